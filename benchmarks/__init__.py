@@ -0,0 +1,5 @@
+"""
+Benchmarks behind the figures quoted in commit messages
+
+Run from the repository root, e.g. python -m benchmarks.lists
+"""
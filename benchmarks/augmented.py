@@ -0,0 +1,26 @@
+"""
+Augmented assignment (user-044): x += y against x = x + y in a counting loop
+"""
+
+from .harness import size_argument, time_program, report
+
+LOOP = '''
+कार्य गिनो() {
+    धारणा i = 0
+    धारणा कुल = 0
+    यावत् i < %d {
+        %s
+    }
+    वापसी कुल
+}
+गिनो()
+'''
+
+def main() -> None:
+    iterations = size_argument(1_000_000)
+    print(f"{iterations} चक्र, कार्य के भीतर:")
+    report('कुल = कुल + i; i = i + 1', time_program(LOOP % (iterations, 'कुल = कुल + i\n        i = i + 1')))
+    report('कुल += i; i += 1', time_program(LOOP % (iterations, 'कुल += i\n        i += 1')))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+संग्रह containers (user-037): each against its pure-Sanskrit equivalent
+"""
+
+import random
+import sys
+from sanskrit_lang.stdlib import load_module
+from .harness import best_of, time_program, report
+
+QUEUE_SIZE = 5000
+HEAP_SIZE = 1000
+WORDS = 20000
+FLAGS = 20000
+
+def main() -> None:
+    sangrah = load_module('संग्रह')
+    rng = random.Random(1)
+    values = [rng.randint(0, 10**6) for _ in range(HEAP_SIZE)]
+    words = [rng.choice('कखगघङचछजझञ') for _ in range(WORDS)]
+
+    print("deque: FIFO push/pop")
+    report('Sanskrit list + slicing', time_program(f'''
+धारणा q = []
+प्रति i में परिधि({QUEUE_SIZE}) {{ q = q + [i] }}
+यावत् लम्बाई(q) > 0 {{ q = q[1:] }}
+''', repeat=1))
+    def deque():
+        queue = sangrah.dvimukhi()
+        for i in range(QUEUE_SIZE):
+            queue.jod(i)
+        while len(queue):
+            queue.baayen_nikaal()
+    report('संग्रह.dvimukhi', best_of(deque))
+
+    print("heap: extract-min")
+    report('Sanskrit linear scan', time_program(f'''
+धारणा a = {values}
+यावत् लम्बाई(a) > 0 {{
+    धारणा m = 0
+    प्रति j में परिधि(लम्बाई(a)) {{
+        यदि a[j] < a[m] {{ m = j }}
+    }}
+    a = a[0:m] + a[m + 1:लम्बाई(a)]
+}}
+''', repeat=1))
+    def heap():
+        queue = sangrah.prathamikta(values)
+        for _ in range(HEAP_SIZE):
+            queue.nikaal()
+    report('संग्रह.prathamikta', best_of(heap))
+
+    print("sorted list: inserts")
+    report('Sanskrit scan + splice', time_program(f'''
+धारणा a = []
+प्रति v में {values} {{
+    धारणा k = 0
+    यावत् k < लम्बाई(a) च a[k] < v {{ k = k + 1 }}
+    a = a[0:k] + [v] + a[k:लम्बाई(a)]
+}}
+''', repeat=1))
+    def sorted_list():
+        items = sangrah.kramit_suchi()
+        for value in values:
+            items.jod(value)
+    report('संग्रह.kramit_suchi', best_of(sorted_list))
+
+    print("counter: word counts")
+    report('Sanskrit dict counting', time_program(f'''
+धारणा g = {{}}
+प्रति w में {words} {{
+    g[w] = g[w] + 1 यदि w में g अथवा 1
+}}
+''', repeat=1))
+    report('संग्रह.ganak', best_of(lambda: sangrah.ganak(words).sarvaadhik(3)))
+
+    print("bitset: flags")
+    report('Sanskrit list of bools', time_program(f'''
+धारणा flags = [असत्य] * {FLAGS}
+प्रति i में परिधि(0, {FLAGS}, 3) {{ flags[i] = सत्य }}
+धारणा c = 0
+प्रति f में flags {{ यदि f {{ c = c + 1 }} }}
+''', repeat=1))
+    def bitset():
+        bits = sangrah.bit_samuchchay(FLAGS)
+        for i in range(0, FLAGS, 3):
+            bits.sthapit(i)
+        return sum(1 for _ in bits)
+    report('संग्रह.bit_samuchchay', best_of(bitset))
+
+    print("bitset: memory for 10^7 members")
+    report('संग्रह.bit_samuchchay', sys.getsizeof(sangrah.bit_samuchchay(10**7).bits) / 1e6, 'MB')
+    report('Python list of bools', sys.getsizeof([False] * 10**7) / 1e6, 'MB')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark harness: timing Sanskrit programs and Python callables
+"""
+
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+from typing import Callable
+from sanskrit_lang.interpreter import SanskritInterpreter
+
+def size_argument(default: int) -> int:
+    """Workload size from the command line, so long runs can be scaled down"""
+    return int(sys.argv[1]) if len(sys.argv) > 1 else default
+
+def best_of(function: Callable[[], object], repeat: int = 3) -> float:
+    """Fastest of several timed calls, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def time_program(source: str, repeat: int = 3) -> float:
+    """Fastest run of a program, compiled once, each run in a fresh context"""
+    interpreter = SanskritInterpreter()
+    program = interpreter.compile(source)
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            interpreter.run_isolated(program)
+    return best_of(run, repeat)
+
+def traced_bytes(function: Callable[[], object]) -> int:
+    """Memory held by what a call returns, measured with tracemalloc"""
+    tracemalloc.start()
+    try:
+        result = function()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+def report(label: str, value: float, unit: str = 's') -> None:
+    number = f"{value:10d}" if isinstance(value, int) else f"{value:10.4f}"
+    print(f"  {label:<44} {number} {unit}")
@@ -0,0 +1,18 @@
+"""
+Compact numeric lists (user-031): memory of a 10M-element list
+"""
+
+from sanskrit_lang.interpreter import SanskritInterpreter
+from .harness import size_argument, traced_bytes, report
+
+def main() -> None:
+    count = size_argument(10_000_000)
+    interpreter = SanskritInterpreter()
+    program = interpreter.compile(f'धारणा बड़ी = [०, १, २, ३, ४, ५, ६, ७, ८, ९] * {count // 10}')
+
+    print(f"{count} तत्व:")
+    report('सूची of ints (array-backed)', traced_bytes(lambda: interpreter.run_isolated(program)) / 1e6, 'MB')
+    report('Python list of floats', traced_bytes(lambda: [i * 1.5 for i in range(count)]) / 1e6, 'MB')
+
+if __name__ == '__main__':
+    main()
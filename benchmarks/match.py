@@ -0,0 +1,37 @@
+"""
+चयन (user-045): 100-way dispatch, jump table against a यदि/अथवा chain
+"""
+
+from .harness import size_argument, time_program, report
+
+CASES = 100
+
+LOOP = '''
+कार्य प्रेषण(x) {
+%s}
+धारणा i = 0
+धारणा कुल = 0
+यावत् i < %d {
+    कुल += प्रेषण(i %% %d)
+    i += 1
+}
+'''
+
+def if_chain() -> str:
+    chain = "वापसी -1\n"
+    for case in reversed(range(CASES)):
+        chain = f"यदि x == {case} {{\nवापसी {case * 2}\n}} अथवा {{\n{chain}}}\n"
+    return chain
+
+def match() -> str:
+    cases = "".join(f"विकल्प {case} {{ वापसी {case * 2} }}\n" for case in range(CASES))
+    return f"चयन x {{\n{cases}अथवा {{ वापसी -1 }}\n}}\n"
+
+def main() -> None:
+    calls = size_argument(100_000)
+    print(f"{calls} कॉल, {CASES} विकल्प:")
+    report('यदि x == k ... अथवा chain', time_program(LOOP % (if_chain(), calls, CASES), repeat=1))
+    report('चयन', time_program(LOOP % (match(), calls, CASES), repeat=1))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+क्रम and वर्णमाला_कुंजी (user-038): key calls per element and collation cost
+"""
+
+import random
+from functools import cmp_to_key
+from sanskrit_lang.interpreter import SanskritInterpreter
+from sanskrit_lang.lists import SanskritList
+from sanskrit_lang.stdlib.varnamala import varnamala_kunji
+from .harness import size_argument, best_of, report
+
+LETTERS = 'अआइकखगघचजटडतदनपबमयरलवशसह'
+SIGNS = ['', 'ा', 'ि', 'ी', 'ु', 'े', 'ो', 'ं', '्']
+
+def main() -> None:
+    count = size_argument(1_000_000)
+    rng = random.Random(1)
+    interpreter = SanskritInterpreter()
+    interpreter.execute('कार्य कुंजी(x) { वापसी x % 1000 }')
+    kram = interpreter.globals.get('क्रम')
+    key = interpreter.globals.get('कुंजी')
+
+    numbers = SanskritList.from_values(rng.randrange(10**6) for _ in range(count))
+    print(f"{count} पूर्ण संख्याएँ, Sanskrit कुंजी:")
+    report('क्रम(सूची, कुंजी)', best_of(lambda: kram(numbers, key), repeat=1))
+
+    sample = list(numbers)[:count // 10]
+    calls = 0
+    def counted(value):
+        nonlocal calls
+        calls += 1
+        return key(value)
+    def compare(a, b):
+        a, b = counted(a), counted(b)
+        return (a > b) - (a < b)
+    print(f"{len(sample)} तत्व, कुंजी प्रति तुलना बनाम प्रति तत्व:")
+    report('key per comparison (cmp_to_key)', best_of(lambda: sorted(sample, key=cmp_to_key(compare)), repeat=1))
+    report('  key calls', calls, 'calls')
+    calls = 0
+    report('key once per element', best_of(lambda: sorted(sample, key=counted), repeat=1))
+    report('  key calls', calls, 'calls')
+
+    words = [''.join(rng.choice(LETTERS) + rng.choice(SIGNS) for _ in range(rng.randint(2, 5)))
+             for _ in range(count)]
+    print(f"{count} देवनागरी शब्द:")
+    report('वर्णमाला_कुंजी', best_of(lambda: sorted(words, key=varnamala_kunji), repeat=1))
+    report('code-point order', best_of(lambda: sorted(words), repeat=1))
+
+if __name__ == '__main__':
+    main()
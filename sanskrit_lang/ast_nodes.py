@@ -13,14 +13,32 @@ class NodeType(Enum):
     IDENTIFIER = "IDENTIFIER"
     BINARY_OP = "BINARY_OP"
     UNARY_OP = "UNARY_OP"
+    AWAIT = "AWAIT"
+    CONDITIONAL = "CONDITIONAL"
+    LIST_LITERAL = "LIST_LITERAL"
+    DICT_LITERAL = "DICT_LITERAL"
+    INTERPOLATED_STRING = "INTERPOLATED_STRING"
+    INDEX = "INDEX"
+    SLICE = "SLICE"
+    INDEX_ASSIGNMENT = "INDEX_ASSIGNMENT"
+    MEMBER = "MEMBER"
+    MEMBER_ASSIGNMENT = "MEMBER_ASSIGNMENT"
     ASSIGNMENT = "ASSIGNMENT"
+    COMPOUND_ASSIGNMENT = "COMPOUND_ASSIGNMENT"
+    CONSTANT_DECLARATION = "CONSTANT_DECLARATION"
     IF_STATEMENT = "IF_STATEMENT"
+    MATCH_STATEMENT = "MATCH_STATEMENT"
+    TRY_STATEMENT = "TRY_STATEMENT"
     WHILE_LOOP = "WHILE_LOOP"
     FOR_LOOP = "FOR_LOOP"
     FUNCTION_DEF = "FUNCTION_DEF"
     FUNCTION_CALL = "FUNCTION_CALL"
     RETURN_STATEMENT = "RETURN_STATEMENT"
+    YIELD_STATEMENT = "YIELD_STATEMENT"
+    BREAK_STATEMENT = "BREAK_STATEMENT"
+    CONTINUE_STATEMENT = "CONTINUE_STATEMENT"
     CLASS_DEF = "CLASS_DEF"
+    RECORD_DEF = "RECORD_DEF"
     IMPORT_STATEMENT = "IMPORT_STATEMENT"
     BLOCK = "BLOCK"
     EXPRESSION_STATEMENT = "EXPRESSION_STATEMENT"
@@ -52,6 +70,8 @@ class Program(ASTNode):
     def __init__(self, statements: List[Statement]):
         super().__init__(NodeType.PROGRAM)
         self.statements = statements
+        # Set once resolved and optimized; the tree is then only read
+        self.prepared = False
     
     def accept(self, visitor):
         return visitor.visit_program(self)
@@ -99,6 +119,105 @@ class UnaryOperation(Expression):
     def accept(self, visitor):
         return visitor.visit_unary_operation(self)
 
+class AwaitExpression(Expression):
+    """Await expression (प्रतीक्षा), only allowed as a whole statement or right-hand side"""
+    
+    def __init__(self, operand: Expression, line: int = 0, column: int = 0):
+        super().__init__(NodeType.AWAIT, line, column)
+        self.operand = operand
+    
+    def accept(self, visitor):
+        return visitor.visit_await_expression(self)
+
+class ConditionalExpression(Expression):
+    """Conditional expression: then_value यदि condition अथवा else_value"""
+    
+    def __init__(self, condition: Expression, then_value: Expression, else_value: Expression,
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.CONDITIONAL, line, column)
+        self.condition = condition
+        self.then_value = then_value
+        self.else_value = else_value
+    
+    def accept(self, visitor):
+        return visitor.visit_conditional_expression(self)
+
+class ListLiteral(Expression):
+    """List literal: [a, b, c]"""
+    
+    def __init__(self, elements: List[Expression], line: int = 0, column: int = 0):
+        super().__init__(NodeType.LIST_LITERAL, line, column)
+        self.elements = elements
+    
+    def accept(self, visitor):
+        return visitor.visit_list_literal(self)
+
+class DictLiteral(Expression):
+    """Dictionary literal: {key: value, ...}"""
+    
+    def __init__(self, entries: List[tuple], line: int = 0, column: int = 0):
+        super().__init__(NodeType.DICT_LITERAL, line, column)
+        self.entries = entries  # list of (key expression, value expression)
+    
+    def accept(self, visitor):
+        return visitor.visit_dict_literal(self)
+
+class InterpolatedString(Expression):
+    """Interpolated string literal: $"text {expression} text" """
+    
+    def __init__(self, parts: List[Any], line: int = 0, column: int = 0):
+        super().__init__(NodeType.INTERPOLATED_STRING, line, column)
+        self.parts = parts  # plain strings and expressions, in order
+    
+    def accept(self, visitor):
+        return visitor.visit_interpolated_string(self)
+
+class IndexExpression(Expression):
+    """Index access: collection[index]"""
+    
+    def __init__(self, collection: Expression, index: Expression, line: int = 0, column: int = 0):
+        super().__init__(NodeType.INDEX, line, column)
+        self.collection = collection
+        self.index = index
+    
+    def accept(self, visitor):
+        return visitor.visit_index_expression(self)
+
+class SliceExpression(Expression):
+    """Slice access: collection[start:stop], either bound may be omitted"""
+    
+    def __init__(self, collection: Expression, start: Optional[Expression], stop: Optional[Expression],
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.SLICE, line, column)
+        self.collection = collection
+        self.start = start
+        self.stop = stop
+    
+    def accept(self, visitor):
+        return visitor.visit_slice_expression(self)
+
+class MemberExpression(Expression):
+    """Member access expression: object.name"""
+    
+    def __init__(self, object: Expression, name: str, line: int = 0, column: int = 0):
+        super().__init__(NodeType.MEMBER, line, column)
+        self.object = object
+        self.name = name
+        # Inline cache of (shape ref, slot index, method ref, version) entries
+        # seen at this site, plus the first field hit unpacked for the
+        # monomorphic fast path. Shapes and methods are held weakly, so the
+        # tree, shared by every execution context, never keeps one alive.
+        self.cache: List[tuple] = []
+        self.field_ref = None
+        self.field_index = 0
+    
+    def __getstate__(self):
+        # Shapes belong to this process's classes; a copy starts with an empty cache
+        return dict(self.__dict__, cache=[], field_ref=None, field_index=0)
+    
+    def accept(self, visitor):
+        return visitor.visit_member_expression(self)
+
 class Assignment(Statement):
     """Variable assignment"""
     
@@ -106,10 +225,71 @@ class Assignment(Statement):
         super().__init__(NodeType.ASSIGNMENT, line, column)
         self.target = target
         self.value = value
+        # Set by the resolver for x = x + ..., which may append in place
+        self.appends = False
     
     def accept(self, visitor):
         return visitor.visit_assignment(self)
 
+class CompoundAssignment(Statement):
+    """Augmented assignment: target += value, and likewise -= *= /= %=
+    
+    The target is an Identifier, IndexExpression or MemberExpression,
+    whose location is evaluated only once.
+    """
+    
+    def __init__(self, target: Expression, operator: str, value: Expression,
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.COMPOUND_ASSIGNMENT, line, column)
+        self.target = target
+        self.operator = operator  # the arithmetic operator, e.g. '+'
+        self.value = value
+    
+    def accept(self, visitor):
+        return visitor.visit_compound_assignment(self)
+
+class ConstantDeclaration(Statement):
+    """Constant declaration (स्थिर); the binding can never be reassigned"""
+    
+    def __init__(self, target: Identifier, value: Expression, line: int = 0, column: int = 0):
+        super().__init__(NodeType.CONSTANT_DECLARATION, line, column)
+        self.target = target
+        self.value = value
+    
+    def accept(self, visitor):
+        return visitor.visit_constant_declaration(self)
+
+class IndexAssignment(Statement):
+    """Assignment to an element: collection[index] = value"""
+    
+    def __init__(self, collection: Expression, index: Expression, value: Expression,
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.INDEX_ASSIGNMENT, line, column)
+        self.collection = collection
+        self.index = index
+        self.value = value
+    
+    def accept(self, visitor):
+        return visitor.visit_index_assignment(self)
+
+class MemberAssignment(Statement):
+    """Member assignment statement: object.name = value"""
+    
+    def __init__(self, object: Expression, name: str, value: Expression,
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.MEMBER_ASSIGNMENT, line, column)
+        self.object = object
+        self.name = name
+        self.value = value
+        # Inline cache of (shape ref before, slot index, shape ref after) entries
+        self.cache: List[tuple] = []
+    
+    def __getstate__(self):
+        return dict(self.__dict__, cache=[])
+    
+    def accept(self, visitor):
+        return visitor.visit_member_assignment(self)
+
 class IfStatement(Statement):
     """If-else conditional statement"""
     
@@ -123,6 +303,36 @@ class IfStatement(Statement):
     def accept(self, visitor):
         return visitor.visit_if_statement(self)
 
+class MatchStatement(Statement):
+    """Match statement: चयन value { विकल्प a, b { ... } अथवा { ... } }"""
+    
+    def __init__(self, subject: Expression, cases: List[tuple], default: Optional[Statement] = None,
+                 line: int = 0, column: int = 0):
+        super().__init__(NodeType.MATCH_STATEMENT, line, column)
+        self.subject = subject
+        self.cases = cases  # list of (value expressions, body block)
+        self.default = default
+        # Filled in on first execution: a dict from case value to body when
+        # every case value is a constant, otherwise False
+        self.jump_table: Optional[Any] = None
+    
+    def accept(self, visitor):
+        return visitor.visit_match_statement(self)
+
+class TryStatement(Statement):
+    """Try statement: प्रयास { ... } पकड़ name { ... } अन्ततः { ... }"""
+    
+    def __init__(self, body: 'Block', error_name: Optional[Identifier], handler: Optional['Block'],
+                 finalizer: Optional['Block'], line: int = 0, column: int = 0):
+        super().__init__(NodeType.TRY_STATEMENT, line, column)
+        self.body = body
+        self.error_name = error_name  # bound to the caught error inside handler
+        self.handler = handler
+        self.finalizer = finalizer
+    
+    def accept(self, visitor):
+        return visitor.visit_try_statement(self)
+
 class WhileLoop(Statement):
     """While loop statement"""
     
@@ -157,6 +367,12 @@ class FunctionDef(Statement):
         self.parameters = parameters
         self.body = body
         self.return_type = return_type
+        # Filled in by the resolver: names the body needs from enclosing scopes
+        self.free_names: Optional[tuple] = None
+        # Set by the resolver when the body contains प्रदान
+        self.is_generator = False
+        # Set by the parser for असमकालिक कार्य
+        self.is_async = False
     
     def accept(self, visitor):
         return visitor.visit_function_def(self)
@@ -183,19 +399,63 @@ class ReturnStatement(Statement):
     def accept(self, visitor):
         return visitor.visit_return_statement(self)
 
+class YieldStatement(Statement):
+    """Yield statement (प्रदान)"""
+    
+    def __init__(self, value: Optional[Expression] = None, line: int = 0, column: int = 0):
+        super().__init__(NodeType.YIELD_STATEMENT, line, column)
+        self.value = value
+    
+    def accept(self, visitor):
+        return visitor.visit_yield_statement(self)
+
+class BreakStatement(Statement):
+    """Break statement (विराम)"""
+    
+    def __init__(self, line: int = 0, column: int = 0):
+        super().__init__(NodeType.BREAK_STATEMENT, line, column)
+    
+    def accept(self, visitor):
+        return visitor.visit_break_statement(self)
+
+class ContinueStatement(Statement):
+    """Continue statement (अग्रे)"""
+    
+    def __init__(self, line: int = 0, column: int = 0):
+        super().__init__(NodeType.CONTINUE_STATEMENT, line, column)
+    
+    def accept(self, visitor):
+        return visitor.visit_continue_statement(self)
+
 class ClassDef(Statement):
     """Class definition"""
     
     def __init__(self, name: Identifier, superclass: Optional[Identifier], 
-                 methods: List[FunctionDef], line: int = 0, column: int = 0):
+                 methods: List[FunctionDef], line: int = 0, column: int = 0,
+                 superclasses: Optional[List[Identifier]] = None):
         super().__init__(NodeType.CLASS_DEF, line, column)
         self.name = name
         self.superclass = superclass
         self.methods = methods
+        # All direct bases in declaration order; superclass is the first of them
+        if superclasses is None:
+            superclasses = [superclass] if superclass is not None else []
+        self.superclasses = superclasses
     
     def accept(self, visitor):
         return visitor.visit_class_def(self)
 
+class RecordDef(Statement):
+    """Record definition (अभिलेख)"""
+    
+    def __init__(self, name: Identifier, fields: List[Identifier], line: int = 0, column: int = 0):
+        super().__init__(NodeType.RECORD_DEF, line, column)
+        self.name = name
+        self.fields = fields
+    
+    def accept(self, visitor):
+        return visitor.visit_record_def(self)
+
 class ImportStatement(Statement):
     """Import statement"""
     
@@ -0,0 +1,155 @@
+"""
+Sanskrit Language Cooperative Execution
+Running programs inside a host asyncio loop without starving it
+"""
+
+from types import MethodType
+from typing import Any, Generator, Optional
+from .ast_nodes import *
+from .environment import BREAK, LoopSignal
+from .errors import SanskritRuntimeError, SanskritReturnException
+from .generators import GeneratorWalker, COMPOUND_STATEMENTS, may_yield, statement_value
+from .interpreter import SanskritFunction, SanskritInterpreter
+from .objects import BoundMethod
+
+# Loop back-edges and calls run between two returns to the event loop
+DEFAULT_QUANTUM = 1000
+
+# Yielded by the walker when the program should let other tasks run
+PREEMPT = object()
+
+def may_pause(node: Optional[Statement]) -> bool:
+    """Check whether a statement holds a loop or statement-level call to walk
+
+    Other statements run straight through the interpreter, so a loop
+    whose body is plain assignments costs one generator per loop.
+    """
+    if node is None:
+        return False
+    if isinstance(node, (WhileLoop, ForLoop)) or isinstance(statement_value(node), FunctionCall):
+        return True
+    if not isinstance(node, COMPOUND_STATEMENTS):
+        return may_yield(node)
+
+    cached = node.__dict__.get('may_pause')
+    if cached is None:
+        if isinstance(node, Block):
+            children = node.statements
+        elif isinstance(node, IfStatement):
+            children = (node.then_branch, node.else_branch)
+        elif isinstance(node, MatchStatement):
+            children = [body for _, body in node.cases] + [node.default]
+        else:
+            children = (node.body, node.handler, node.finalizer)
+        cached = any(may_pause(child) for child in children)
+        node.may_pause = cached
+    return cached
+
+class CooperativeWalker(GeneratorWalker):
+    """Walks a whole program, pausing every `quantum` back-edges or calls
+
+    Every compound statement is walked, as are plain कार्य called as a
+    whole statement, an assignment value or a वापसी value, so long
+    loops anywhere on that path give way to the loop. A call nested
+    inside a larger expression, e.g. f(x) + 1, still runs to completion
+    in one step, as do builtins and उत्पादक bodies.
+
+    Besides PREEMPT the walker yields the argument of a statement-level
+    चलाओ, so the host awaits the coroutine on its own running loop.
+    """
+
+    def __init__(self, interpreter, quantum: int = DEFAULT_QUANTUM):
+        super().__init__(interpreter)
+        if type(quantum) is not int or quantum < 1:
+            raise ValueError(f"क्वांटम धनात्मक पूर्ण संख्या होना चाहिए, प्राप्त '{quantum}'")
+        self.quantum = quantum
+        self.steps = 0
+
+    def pauses(self, node: Statement) -> bool:
+        return may_pause(node)
+
+    def walk(self, node: Statement) -> Generator[Any, Any, Optional[LoopSignal]]:
+        value = statement_value(node)
+        if isinstance(value, FunctionCall):
+            result = yield from self.walk_call(value)
+            self.complete(node, result)
+            return None
+        return (yield from super().walk(node))
+
+    def tick(self) -> bool:
+        """Count a back-edge or call, reporting when the quantum is used up"""
+        self.steps += 1
+        if self.steps < self.quantum:
+            return False
+        self.steps = 0
+        return True
+
+    def walk_call(self, node: FunctionCall) -> Generator[Any, Any, Any]:
+        """Walk a call, entering the body of plain कार्य and methods"""
+        interpreter = self.interpreter
+        callee = interpreter.evaluate(node.function)
+        arguments = [interpreter.evaluate(argument) for argument in node.arguments]
+        if self.tick():
+            yield PREEMPT
+
+        if type(callee) is MethodType and callee.__func__ is SanskritInterpreter.run_coroutine:
+            if len(arguments) != 1:
+                raise SanskritRuntimeError(f"अपेक्षित 1 तर्क, प्राप्त {len(arguments)}")
+            return (yield arguments[0])
+        if type(callee) is BoundMethod and type(callee.method) is SanskritFunction:
+            function = callee.method
+            if len(arguments) != callee.arity():
+                raise SanskritRuntimeError(f"अपेक्षित {callee.arity()} तर्क, प्राप्त {len(arguments)}")
+            arguments.insert(0, callee.receiver)
+        elif type(callee) is SanskritFunction:
+            function = callee
+            if len(arguments) != callee.arity():
+                raise SanskritRuntimeError(f"अपेक्षित {callee.arity()} तर्क, प्राप्त {len(arguments)}")
+        else:
+            return interpreter.call_value(callee, arguments)
+
+        caller = interpreter.environment
+        try:
+            yield from self.walk_block(function.declaration.body.statements, function.bind(arguments))
+        except SanskritReturnException as ret:
+            interpreter.environment = caller
+            return ret.value
+        return None
+
+    def walk_while(self, node: WhileLoop) -> Generator[Any, Any, None]:
+        interpreter = self.interpreter
+        body = node.body
+        walks_body = may_pause(body)
+        while interpreter.is_truthy(interpreter.evaluate(node.condition)):
+            if walks_body:
+                signal = yield from self.walk(body)
+            else:
+                signal = body.accept(interpreter)
+            if signal is BREAK:
+                break
+            if self.tick():
+                yield PREEMPT
+        return None
+
+    def walk_for(self, node: ForLoop) -> Generator[Any, Any, None]:
+        interpreter = self.interpreter
+        iterable = interpreter.evaluate(node.iterable)
+
+        if not hasattr(iterable, '__iter__'):
+            raise SanskritRuntimeError("ऑब्जेक्ट iterable नहीं है")
+
+        environment = interpreter.environment
+        name = node.variable.name
+        body = node.body
+        walks_body = may_pause(body)
+        for item in iterable:
+            environment.define(name, item)
+            if walks_body:
+                signal = yield from self.walk(body)
+            else:
+                signal = body.accept(interpreter)
+            if signal is BREAK:
+                break
+            if self.tick():
+                yield PREEMPT
+        return None
@@ -42,6 +42,10 @@ class DocumentationSystem:
 
     स्थिर पाई = ३.१४१५९
 
+स्थिर मान पुनः निर्दिष्ट नहीं किए जा सकते; ऐसा करने पर प्रोग्राम चलने से
+पहले ही व्याकरण त्रुटि मिलती है। उनके मान सीधे उपयोग के स्थान पर रख दिए
+जाते हैं, इसलिए लूप में स्थिर का उपयोग निःशुल्क है।
+
 चर नाम संस्कृत या अंग्रेजी में हो सकते हैं।
             ''',
             
@@ -60,6 +64,32 @@ class DocumentationSystem:
 • सूची: [१, २, ३]
 • शब्दकोश: {"नाम": "राम", "उम्र": २५}
 
+साँचा शब्द (Interpolated strings) - {} के भीतर की अभिव्यक्ति का मान जुड़ता है:
+    $"F({i}) = {फल[i] * २}"    # "F(3) = 12"
+    $"{{कोष्ठक}}"              # "{कोष्ठक}"
+    + और सुन्दर() की शृंखला से तेज़: पूरा शब्द एक बार में जोड़ा जाता है
+
+सूची उपयोग:
+    धारणा अंक = [१, २, ३, ४]
+    अंक[०]          # 1
+    अंक[१:३]        # [2, 3]
+    अंक[०] = १०
+
+शब्दकोश उपयोग:
+    धारणा व्यक्ति = {"नाम": "राम", "उम्र": २५}
+    व्यक्ति["नाम"]          # "राम"
+    "उम्र" में व्यक्ति       # सत्य
+    प्रति कुंजी में व्यक्ति { मुद्रण(कुंजी, व्यक्ति[कुंजी]) }
+    कुंजियाँ(व्यक्ति), मूल्यानि(व्यक्ति), युग्मानि(व्यक्ति)
+
+अभिलेख (Records) - अपरिवर्तनीय, हल्के मान प्रकार:
+    अभिलेख बिंदु(क, ख)
+    धारणा p = बिंदु(१, २)      # स्थितीय निर्माता
+    p[०], p.क                  # क्षेत्र पढ़ना
+    p == बिंदु(१, २)           # सत्य - मान से तुलना
+    {p: "मूल"}                 # शब्दकोश कुंजी के रूप में उपयोग संभव
+    p.badal("क", ५)            # नया अभिलेख, p अपरिवर्तित
+
 प्रकार जांच:
     प्रकार(चर_नाम)
             ''',
@@ -89,6 +119,52 @@ class DocumentationSystem:
 • मुद्रण() - प्रिंट करने के लिए
 • प्रकार() - प्रकार जांच के लिए
 • लम्बाई() - लंबाई जांच के लिए
+• सूची() - किसी भी क्रम को सूची में बदलने के लिए
+• क्रम(सूची, कुंजी, उल्टा) - स्थिर क्रमबद्ध नई सूची; कुंजी प्रति तत्व एक बार चलती है
+
+    क्रम(अंक)                              # [1, 2, 3]
+    क्रम(अंक, शून्य, सत्य)                   # [3, 2, 1]
+    क्रम(शब्द_सूची, वर्णमाला_कुंजी)          # वर्णमाला क्रम: क < का < कौ < कं < क्ष
+
+उत्पादक (Generators) - 'प्रदान' वाला कार्य मान एक-एक करके देता है:
+
+    कार्य सम_संख्याएँ(n) {
+        प्रति i में परिधि(n) {
+            यदि i % २ == ० { प्रदान i }
+        }
+    }
+
+    प्रति x में सम_संख्याएँ(१०००००००) { ... }   # पूरी सूची कभी नहीं बनती
+    सूची(सम_संख्याएँ(१०))                       # [0, 2, 4, 6, 8]
+
+शरीर केवल तभी चलता है जब अगला मान माँगा जाए; 'वापसी' उत्पादक को समाप्त करती है।
+
+असमकालिक कार्य (Async) - 'प्रतीक्षा' पर रुककर अन्य कार्यों को चलने देता है:
+
+    असमकालिक कार्य पढ़ो(पथ) {
+        धारणा पाठ = प्रतीक्षा प्रवेश.असमकालिक_फ़ाइल_पढ़िये(पथ)
+        वापसी लम्बाई(पाठ)
+    }
+
+    असमकालिक कार्य मुख्य() {
+        वापसी प्रतीक्षा एकत्र(पढ़ो("क.txt"), पढ़ो("ख.txt"))   # साथ-साथ
+    }
+
+    मुद्रण(चलाओ(मुख्य()))
+
+• 'प्रतीक्षा' पूरे कथन, धारणा/स्थिर के मान या वापसी के रूप में ही संभव है
+• एकत्र(क, ख, ...) या एकत्र(सूची) - सबकी साथ-साथ प्रतीक्षा, परिणाम क्रम में
+• निद्रा(क्षण) - कुछ क्षण रुकें; चलाओ(...) - इंटरप्रेटर के इवेंट लूप पर चलाएँ
+
+समानांतर मानचित्र - एक तर्क वाला कार्य हर तत्व पर अलग प्रक्रियाओं में:
+
+    कार्य भारी(n) { ... }
+    समानांतर_मानचित्र(भारी, परिधि(१०००))        # सभी कोर, परिणाम क्रम में
+    समानांतर_मानचित्र(भारी, परिधि(१०००), ४)     # चार कार्यकर्ता
+
+• कार्य जिन कार्यों और मानों को नाम से पढ़ता है, वे प्रतिलिपि बनकर साथ जाते हैं
+• कार्यकर्ता में किए परिवर्तन यहाँ नहीं दिखते; वर्ग की वस्तुएँ भेजी नहीं जा सकतीं
+• खंडों का आकार प्रति तत्व मापे गए समय के अनुसार स्वयं बदलता है
             ''',
             
             # Control flow
@@ -116,6 +192,34 @@ class DocumentationSystem:
     प्रति संख्या में [१, २, ३, ४, ५] {
         मुद्रण(संख्या)
     }
+
+परिधि (range) - बिना सूची बनाए संख्याओं पर लूप:
+
+    प्रति i में परिधि(१०) { ... }          # ० से ९
+    प्रति i में परिधि(१, १००, २) { ... }   # आरम्भ, अंत, चरण
+
+लूप नियंत्रण:
+• विराम - लूप से तुरंत बाहर निकलें (break)
+• अग्रे - अगले चक्र पर जाएं (continue)
+
+    यावत् सत्य {
+        i = i + १
+        यदि i % २ == ० { अग्रे }
+        यदि i > ९ { विराम }
+    }
+
+चयन (match) - एक मान के अनुसार शाखा चुनें:
+
+    चयन आदेश {
+        विकल्प "आरम्भ" { आरम्भ_करो() }
+        विकल्प "रोको", "बंद" { रोको() }
+        अथवा { मुद्रण("अज्ञात आदेश") }
+    }
+
+जब सभी विकल्प स्थिर मान हों (संख्या, शब्द, सत्य/असत्य, शून्य, स्थिर नाम),
+शाखा एक ही शब्दकोश खोज से मिलती है, विकल्पों की संख्या चाहे जितनी हो।
+अन्यथा विकल्पों की क्रम से == तुलना होती है। कोई fall-through नहीं है;
+शाखा के भीतर विराम/अग्रे आसपास के लूप पर लागू होते हैं।
             ''',
             
             # Classes
@@ -137,14 +241,41 @@ class DocumentationSystem:
 
 ऑब्जेक्ट बनाना:
 
-    राम = व्यक्ति("राम", २५)
+    राम = व्यक्ति("राम", २५)     # तर्क प्रारंभ() को दिए जाते हैं
     राम.परिचय()
+    राम.उम्र = २६
+
+प्रत्येक विधि को उसकी वस्तु 'यह' के रूप में मिलती है। एक ही क्रम में बनाए गए
+क्षेत्रों वाली वस्तुएँ एक ही आकार (shape) साझा करती हैं, इसलिए लूप में
+बार-बार पढ़े गए गुण शब्दकोश खोज के बिना मिलते हैं।
+
+विरासत (Inheritance):
+
+    वर्ग छात्र(व्यक्ति) {
+        कार्य प्रारंभ(नाम, उम्र, कक्षा) {
+            व्यक्ति.प्रारंभ(यह, नाम, उम्र)   # जनक वर्ग की विधि
+            यह.कक्षा = कक्षा
+        }
+    }
+
+एक से अधिक जनक भी संभव हैं: वर्ग क(ख, ग) { ... }
+विधि समाधान क्रम C3 नियम से, पायथन की तरह, तय होता है। हर वर्ग बनते समय
+अपनी सभी विरासत में मिली विधियों की एक सपाट तालिका बनाता है, इसलिए गहरी
+पदानुक्रम में भी विधि खोज एक ही शब्दकोश खोज है।
+
+बाद में विधि जोड़ना या बदलना (यह वर्ग और इसके सभी वंशज अद्यतन होते हैं):
+
+    कार्य नमस्ते(यह) { मुद्रण("नमस्ते", यह.नाम) }
+    व्यक्ति.नमस्ते = नमस्ते
             ''',
             
             # Standard library
             'पुस्तकालय': '''
 मानक पुस्तकालय (Standard Library)
 
+मॉड्यूल सदस्य पायथन नाम या संस्कृत नाम, दोनों से उपलब्ध हैं:
+    गणित.vargmool(१६) और गणित.वर्गमूल(१६) समान हैं
+
 गणित मॉड्यूल:
     आयात गणित
     गणित.वर्गमूल(१६)  # 4
@@ -159,6 +290,35 @@ class DocumentationSystem:
     आयात प्रवेश
     नाम = प्रवेश.paath("नाम दर्ज करें: ")
     प्रवेश.file_padhiye("फ़ाइल.txt")
+    प्रति पंक्ति में प्रवेश.file_panktiyan("बड़ी.log") { ... }   # स्थिर स्मृति
+
+प्रवाह मॉड्यूल (आलसी पाइपलाइन, कोई मध्यवर्ती सूची नहीं):
+    आयात प्रवाह
+    प्रवाह.manchitra(दोगुना, क्रम)     # मानचित्र (map)
+    प्रवाह.chhanana(सम, क्रम)          # छानना (filter)
+    प्रवाह.pratham(क्रम, ५)            # प्रथम (take)
+    प्रवाह.tyaag(क्रम, ५)              # त्याग (drop)
+    प्रवाह.yugma(क, ख)                 # युग्म (zip)
+    प्रवाह.shrinkhala(क, ख)            # शृंखला (chain)
+    प्रवाह.khand(क्रम, ३)              # खण्ड (chunk)
+    प्रवाह.ganana(क्रम)                # गणना (enumerate)
+    प्रवाह.sankshep(योग, क्रम, ०)      # संक्षेप (reduce)
+
+स्थायी मॉड्यूल (अपरिवर्तनीय संग्रह, हर बदलाव नया संस्करण देता है):
+    आयात स्थायी
+    धारणा v = स्थायी.suchi([१, २, ३])
+    धारणा v2 = v.jod(४)               # v अपरिवर्तित रहती है
+    v2.badal(०, १०), v2.nikaal()
+    धारणा k = स्थायी.kosh({"क": १})
+    k.rakh("ख", २), k.hatao("क"), k.prapt("क", शून्य)
+
+संग्रह मॉड्यूल (कुशल कंटेनर):
+    आयात संग्रह
+    संग्रह.dvimukhi()         # द्विमुखी पंक्ति: jod, baayen_jod, nikaal, baayen_nikaal
+    संग्रह.prathamikta()      # प्राथमिकता पंक्ति: jod(मान, प्राथमिकता), nikaal, dekho
+    संग्रह.kramit_suchi()     # क्रमित सूची: jod, hatao, sthaan, seema
+    संग्रह.ganak(शब्द_सूची)   # गणक: jod, ginati, sarvaadhik(३), kul
+    संग्रह.bit_samuchchay(१००००००)   # बिट समुच्चय: sthapit, hatao, में
             ''',
             
             # Operators
@@ -172,6 +332,15 @@ class DocumentationSystem:
 • / (भाग) - भाग
 • % (शेष) - मॉड्यूलो
 
+संयुक्त निर्देश:
+• += -= *= /= %=  - x += y का अर्थ x = x + y
+    i += १
+    अंक[०] *= २
+    यह.गिनती -= १
+लक्ष्य एक ही बार पढ़ा और लिखा जाता है। सूची += सूची और शब्द निर्माता += x
+मूल वस्तु को ही बदलते हैं (नई प्रति नहीं बनती), इसलिए उसी सूची के अन्य
+नाम भी बदलाव देखते हैं।
+
 तुलना:
 • == (समान) - बराबर
 • != (असमान) - नहीं बराबर
@@ -184,6 +353,15 @@ class DocumentationSystem:
 • च (और) - AND
 • वा (या) - OR
 • न (नहीं) - NOT
+
+'च' और 'वा' शॉर्ट-सर्किट हैं: दायाँ पक्ष केवल आवश्यकता होने पर ही चलता है।
+
+    x != ० च महँगा(x)    # x शून्य हो तो महँगा() नहीं बुलाया जाता
+
+सशर्त अभिव्यक्ति:
+• मान यदि शर्त अथवा अन्य_मान
+
+    धारणा चिह्न = "धन" यदि x > ० अथवा "ऋण"
             ''',
             
             # Error handling
@@ -205,6 +383,20 @@ class DocumentationSystem:
 - गलत ऑपरेशन
 
 त्रुटि संदेश संस्कृत में दिए जाते हैं।
+
+त्रुटि पकड़ना:
+    प्रयास {
+        मुद्रण(१० / ०)
+    } पकड़ त {
+        मुद्रण(त.प्रकार, त.संदेश, त.पंक्ति)
+    } अन्ततः {
+        मुद्रण("सदा चलता है")
+    }
+
+• पकड़ के बाद नाम वैकल्पिक है; पकड़ या अन्ततः में से एक आवश्यक है
+• पकड़ा गया मान 'त्रुटि' अभिलेख है: प्रकार, संदेश, पंक्ति
+• वापसी, विराम और अग्रे पकड़े नहीं जाते, पर अन्ततः चलता है
+• त्रुटि न होने पर प्रयास का कोई अतिरिक्त व्यय नहीं
             ''',
             
             # Examples
@@ -319,6 +511,19 @@ class DocumentationSystem:
     सुन्दर(१२३)      # "123"
     सुन्दर(सत्य)     # "सत्य"
             ''',
+            
+            'स्मरण': '''
+स्मरण(कार्य, आकार=128)
+
+शुद्ध फ़ंक्शन के परिणामों को LRU कैश में याद रखने के लिए।
+कैश तर्कों के आधार पर बनता है; आकार भरने पर सबसे पुराना परिणाम हटता है।
+
+उदाहरण:
+    फिबोनाची = स्मरण(फिबोनाची, १२८)
+    फिबोनाची(४०)
+    स्मरण_आँकड़े(फिबोनाची)   # सफल, असफल, निष्कासन, आकार, क्षमता
+    स्मरण_साफ़(फिबोनाची)     # कैश खाली करें
+            ''',
         }
         
         return function_docs.get(function_name)
@@ -362,11 +567,21 @@ class DocumentationSystem:
 • vibhajan(text, sep) - स्ट्रिंग को बांटें
 • sandharan(list, sep) - स्ट्रिंग जोड़ें
 • sthaan_badal(text, old, new) - टेक्स्ट बदलें
+• nirmata(text) - शब्द निर्माता (string builder) बनाएँ
 
 उदाहरण:
     आयात शब्द
     शब्द.uchcha("नमस्ते")
     शब्द.vibhajan("क,ख,ग", ",")
+
+शब्द निर्माता - लूप में लंबा शब्द बनाने के लिए:
+    धारणा ब = शब्द.निर्माता()
+    प्रति i में परिधि(१००) { ब.पंक्ति_जोड़(i) }
+    ब.शब्द()                 # पूरा शब्द, एक बार में जोड़ा गया
+    ब.जोड़(x), ब.साफ़(), लम्बाई(ब)
+
+परिणाम = परिणाम + पंक्ति जैसे कथन भी अपने आप बफ़र होते हैं: जब तक
+परिणाम शब्द है, हर बार पूरी प्रति नहीं बनती।
             ''',
             
             'प्रवेश': '''
@@ -381,6 +596,7 @@ class DocumentationSystem:
 • file_padhiye(path) - फ़ाइल पढ़ें
 • file_likhiye(path, content) - फ़ाइल लिखें
 • file_hai(path) - फ़ाइल मौजूद है या नहीं
+• asamakalik_file_padhiye / _likhiye / _jodiye - अलग थ्रेड पर, 'प्रतीक्षा' हेतु
 
 उदाहरण:
     आयात प्रवेश
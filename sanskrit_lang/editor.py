@@ -20,7 +20,7 @@ class SyntaxHighlighter:
         # Sanskrit keyword patterns
         self.patterns = {
             'keyword': [
-                r'\b(यदि|अथवा|यावत्|प्रति|कार्य|वापसी|वर्ग|धारणा|स्थिर|आयात|से)\b',
+                r'\b(यदि|अथवा|यावत्|प्रति|कार्य|वापसी|वर्ग|धारणा|स्थिर|आयात|से|विराम|अग्रे|में|प्रदान|अभिलेख|चयन|विकल्प|प्रयास|पकड़|अन्ततः|असमकालिक|प्रतीक्षा)\b',
                 r'\b(सत्य|असत्य|शून्य|च|वा|न)\b'
             ],
             'number': [
@@ -28,8 +28,8 @@ class SyntaxHighlighter:
                 r'\b[०१२३४५६७८९]+(\.[०१२३४५६७८९]+)?\b'
             ],
             'string': [
-                r'"[^"]*"',
-                r"'[^']*'"
+                r'\$?"[^"]*"',
+                r"\$?'[^']*'"
             ],
             'comment': [
                 r'#.*$'
@@ -0,0 +1,179 @@
+"""
+Sanskrit Language Environments
+Variable scopes, closure cells, completion signals and string buffers
+"""
+
+from typing import Any, Dict, List, Optional
+from .errors import SanskritRuntimeError
+
+# Marker for a captured variable whose defining statement has not run yet
+UNBOUND = object()
+
+class LoopSignal:
+    """Completion signal returned by statements to leave or restart a loop"""
+    
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __repr__(self) -> str:
+        return f"LoopSignal({self.name})"
+
+# विराम and अग्रे complete with these instead of raising, so early loop
+# exits cost a return value rather than Python exception unwinding
+BREAK = LoopSignal('विराम')
+CONTINUE = LoopSignal('अग्रे')
+
+class Cell:
+    """Shared storage for a variable captured by a closure"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any = UNBOUND):
+        self.value = value
+
+class StringBuffer:
+    """Growable string stored as a list of pieces, joined only when read
+
+    Pieces are gathered into chunks of CHUNK_PIECES so that very long
+    buffers hold a few large strings rather than millions of small ones.
+    Every character is copied at most twice, however many appends run.
+    """
+    
+    CHUNK_PIECES = 4096
+    
+    __slots__ = ('chunks', 'pieces', 'length')
+    
+    def __init__(self, text: str = ""):
+        self.chunks: List[str] = []
+        self.pieces: List[str] = [text] if text else []
+        self.length = len(text)
+    
+    def append(self, text: str) -> None:
+        """Add text at the end"""
+        self.pieces.append(text)
+        self.length += len(text)
+        if len(self.pieces) >= self.CHUNK_PIECES:
+            self.chunks.append(''.join(self.pieces))
+            self.pieces.clear()
+    
+    def materialize(self) -> str:
+        """The whole text as one string, which then replaces the pieces"""
+        if self.chunks or len(self.pieces) > 1:
+            text = ''.join(self.chunks) + ''.join(self.pieces)
+            self.chunks.clear()
+            self.pieces[:] = [text]
+        return self.pieces[0] if self.pieces else ""
+    
+    def clear(self) -> None:
+        self.chunks.clear()
+        self.pieces.clear()
+        self.length = 0
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __str__(self) -> str:
+        return self.materialize()
+
+class Environment:
+    """Environment for variable scoping"""
+    
+    def __init__(self, enclosing: Optional['Environment'] = None):
+        self.enclosing = enclosing
+        self.values: Dict[str, Any] = {}
+        # Variables captured by closures live in cells instead of values
+        self.cells: Optional[Dict[str, Cell]] = None
+    
+    def define(self, name: str, value: Any) -> None:
+        """Define a variable"""
+        if self.cells and name in self.cells:
+            self.cells[name].value = value
+            return
+        self.values[name] = value
+    
+    def get(self, name: str) -> Any:
+        """Get a variable value"""
+        if name in self.values:
+            return self.values[name]
+        
+        if self.cells:
+            cell = self.cells.get(name)
+            if cell is not None and cell.value is not UNBOUND:
+                return cell.value
+        
+        if self.enclosing:
+            return self.enclosing.get(name)
+        
+        raise SanskritRuntimeError(f"अपरिभाषित चर '{name}'")
+    
+    def assign(self, name: str, value: Any) -> None:
+        """Assign to a variable"""
+        if name in self.values:
+            self.values[name] = value
+            return
+        
+        if self.cells:
+            cell = self.cells.get(name)
+            if cell is not None and cell.value is not UNBOUND:
+                cell.value = value
+                return
+        
+        if self.enclosing:
+            self.enclosing.assign(name, value)
+            return
+        
+        # If variable doesn't exist anywhere, create it in current scope
+        self.values[name] = value
+    
+    def owner(self, name: str) -> 'Environment':
+        """The environment holding a variable, so it can be read and written in one step"""
+        environment = self
+        while environment is not None:
+            if name in environment.values:
+                return environment
+            if environment.cells:
+                cell = environment.cells.get(name)
+                if cell is not None and cell.value is not UNBOUND:
+                    return environment
+            environment = environment.enclosing
+        raise SanskritRuntimeError(f"अपरिभाषित चर '{name}'")
+    
+    def set_own(self, name: str, value: Any) -> None:
+        """Write a variable held directly by this environment"""
+        if name in self.values:
+            self.values[name] = value
+        else:
+            self.cells[name].value = value
+    
+    def capture(self, name: str) -> Optional[Cell]:
+        """Get the cell holding a variable, moving it into one if needed.
+        
+        Returns None for globals, which closures reach directly.
+        """
+        environment = self
+        while environment is not None:
+            if environment.cells and name in environment.cells:
+                return environment.cells[name]
+            
+            if name in environment.values:
+                if environment.enclosing is None:
+                    return None
+                cell = Cell(environment.values.pop(name))
+                environment.add_cell(name, cell)
+                return cell
+            
+            environment = environment.enclosing
+        
+        # Not defined yet (e.g. a local function declared later); the
+        # defining statement will fill this cell through define()
+        cell = Cell()
+        self.add_cell(name, cell)
+        return cell
+    
+    def add_cell(self, name: str, cell: Cell) -> None:
+        """Store a cell in this environment"""
+        if self.cells is None:
+            self.cells = {}
+        self.cells[name] = cell
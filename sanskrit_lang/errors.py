@@ -201,6 +201,22 @@ def translate_python_error(python_error: Exception) -> str:
     
     return f"अज्ञात त्रुटि: {str(python_error)}"
 
+# Raised to move control, never caught by पकड़
+CONTROL_FLOW_EXCEPTIONS = (SanskritReturnException, SanskritBreakException, SanskritContinueException)
+
+def describe_error(error: Exception) -> tuple:
+    """Split an error into its Sanskrit kind and message, as seen by पकड़"""
+    if isinstance(error, SanskritError):
+        kind, separator, message = error.message.partition(': ')
+        if separator and kind.endswith('त्रुटि'):
+            return kind, message
+        return "त्रुटि", error.message
+    
+    for error_type in type(error).__mro__:
+        if error_type.__name__ in ERROR_TRANSLATIONS:
+            return ERROR_TRANSLATIONS[error_type.__name__], str(error)
+    return type(error).__name__, str(error)
+
 class ErrorReporter:
     """Error reporting and formatting utility"""
     
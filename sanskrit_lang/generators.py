@@ -0,0 +1,331 @@
+"""
+Sanskrit Language Generators
+Resumable execution of कार्य bodies that contain प्रदान
+"""
+
+from typing import Any, Generator, List, Optional
+from .ast_nodes import *
+from .environment import Environment, LoopSignal, BREAK
+from .errors import (SanskritRuntimeError, SanskritReturnException, SanskritTypeError,
+                     CONTROL_FLOW_EXCEPTIONS)
+
+# Statements whose bodies may hold a प्रदान of the same function.
+# Nested कार्य and वर्ग definitions own their प्रदान, so they are leaves.
+COMPOUND_STATEMENTS = (Block, IfStatement, MatchStatement, TryStatement, WhileLoop, ForLoop)
+
+def statement_value(node: Statement) -> Optional[Expression]:
+    """The expression a statement evaluates before finishing with its result
+
+    Covers whole expression statements, the value of an assignment or
+    स्थिर and the value of a वापसी; see GeneratorWalker.complete.
+    """
+    if isinstance(node, ExpressionStatement):
+        return node.expression
+    if isinstance(node, (Assignment, ConstantDeclaration, ReturnStatement)):
+        return node.value
+    return None
+
+def awaited_expression(node: Statement) -> Optional[AwaitExpression]:
+    """The प्रतीक्षा making up a statement's value, if any
+
+    The resolver allows प्रतीक्षा only in these statement positions.
+    """
+    value = statement_value(node)
+    return value if isinstance(value, AwaitExpression) else None
+
+def may_yield(node: Optional[Statement]) -> bool:
+    """Check whether executing a statement can pause at a प्रदान or प्रतीक्षा"""
+    if node is None:
+        return False
+    if isinstance(node, YieldStatement):
+        return True
+    if awaited_expression(node) is not None:
+        return True
+    if not isinstance(node, COMPOUND_STATEMENTS):
+        return False
+
+    cached = node.__dict__.get('may_yield')
+    if cached is None:
+        if isinstance(node, Block):
+            children = node.statements
+        elif isinstance(node, IfStatement):
+            children = (node.then_branch, node.else_branch)
+        elif isinstance(node, MatchStatement):
+            children = [body for _, body in node.cases] + [node.default]
+        elif isinstance(node, TryStatement):
+            children = (node.body, node.handler, node.finalizer)
+        else:
+            children = (node.body,)
+        cached = any(may_yield(child) for child in children)
+        node.may_yield = cached
+    return cached
+
+class SanskritGenerator:
+    """Lazy sequence returned by calling a generator कार्य (उत्पादक)
+
+    Each resume swaps the generator's own environment into the
+    interpreter and the caller's environment back out afterwards, so
+    a paused body never sees, or leaks into, the scope that iterates it.
+    """
+
+    __slots__ = ('name', 'interpreter', 'frame', 'environment')
+
+    def __init__(self, name: str, interpreter, frame: Generator[Any, None, None],
+                 environment: Environment):
+        self.name = name
+        self.interpreter = interpreter
+        self.frame = frame
+        self.environment = environment
+
+    def __iter__(self) -> 'SanskritGenerator':
+        return self
+
+    def __next__(self) -> Any:
+        interpreter = self.interpreter
+        caller = interpreter.environment
+        interpreter.environment = self.environment
+        try:
+            return next(self.frame)
+        finally:
+            self.environment = interpreter.environment
+            interpreter.environment = caller
+
+    def close(self) -> None:
+        """Abandon the generator without running the rest of its body"""
+        interpreter = self.interpreter
+        caller = interpreter.environment
+        interpreter.environment = self.environment
+        try:
+            self.frame.close()
+        finally:
+            interpreter.environment = caller
+
+    def __repr__(self) -> str:
+        return f"<उत्पादक {self.name}>"
+
+class SanskritCoroutine:
+    """Pending result of calling an असमकालिक कार्य
+
+    Awaiting it drives the body on the GeneratorWalker: the body pauses
+    at each प्रतीक्षा by handing out the awaited value, which is awaited
+    here on the asyncio loop. Its result, or its exception, is sent
+    back in at the same point, so प्रयास/पकड़ sees failed waits. Like
+    SanskritGenerator, every step swaps the body's environment in.
+    """
+
+    __slots__ = ('name', 'interpreter', 'frame', 'environment', 'started')
+
+    def __init__(self, name: str, interpreter, frame: Generator[Any, Any, Any],
+                 environment: Environment):
+        self.name = name
+        self.interpreter = interpreter
+        self.frame = frame
+        self.environment = environment
+        self.started = False
+
+    def step(self, value: Any, error: Optional[Exception]) -> Any:
+        """Run the body up to its next प्रतीक्षा, returning the value to await"""
+        interpreter = self.interpreter
+        caller = interpreter.environment
+        interpreter.environment = self.environment
+        try:
+            if error is None:
+                return self.frame.send(value)
+            return self.frame.throw(error)
+        finally:
+            self.environment = interpreter.environment
+            interpreter.environment = caller
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        if self.started:
+            raise SanskritRuntimeError(f"असमकालिक कार्य '{self.name}' की प्रतीक्षा केवल एक बार संभव है")
+        self.started = True
+        value = None
+        error = None
+        while True:
+            try:
+                awaitable = self.step(value, error)
+            except StopIteration as stop:
+                return stop.value
+            value = error = None
+            try:
+                waiter = awaitable.__await__()
+            except AttributeError:
+                error = SanskritTypeError(f"'{awaitable}' की प्रतीक्षा संभव नहीं")
+                continue
+            try:
+                value = yield from waiter
+            except Exception as failure:
+                error = failure
+
+    def close(self) -> None:
+        """Abandon a coroutine that will never be awaited further"""
+        self.frame.close()
+
+    def __repr__(self) -> str:
+        return f"<असमकालिक कार्य {self.name}>"
+
+class GeneratorWalker:
+    """Executes statements as a Python generator that pauses at प्रदान
+
+    Only the compound statements on the path to a प्रदान are walked
+    here; everything else runs through the interpreter unchanged.
+    Scopes are restored on normal exit only, never in a finally clause:
+    a paused generator may be closed or collected while another
+    environment is active, and SanskritGenerator already puts the
+    caller's environment back whenever the body stops running.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+
+    def run(self, statements: List[Statement]) -> Generator[Any, None, None]:
+        """Walk a function body, finishing quietly at वापसी"""
+        try:
+            yield from self.walk_statements(statements)
+        except SanskritReturnException:
+            return
+
+    def run_async(self, statements: List[Statement]) -> Generator[Any, Any, Any]:
+        """Walk an async function body, returning the value of its वापसी"""
+        try:
+            yield from self.walk_statements(statements)
+        except SanskritReturnException as ret:
+            return ret.value
+        return None
+
+    def walk_statements(self, statements: List[Statement]) -> Generator[Any, None, Optional[LoopSignal]]:
+        """Walk statements in the current scope, stopping at the first loop signal"""
+        interpreter = self.interpreter
+        pauses = self.pauses
+        for statement in statements:
+            if pauses(statement):
+                signal = yield from self.walk(statement)
+            else:
+                signal = statement.accept(interpreter)
+            if signal is not None:
+                return signal
+        return None
+
+    def pauses(self, node: Statement) -> bool:
+        """Check whether a statement must be walked rather than run by the interpreter"""
+        return may_yield(node)
+
+    def walk(self, node: Statement) -> Generator[Any, None, Optional[LoopSignal]]:
+        """Walk a single statement"""
+        interpreter = self.interpreter
+        if not self.pauses(node):
+            return node.accept(interpreter)
+
+        if isinstance(node, YieldStatement):
+            value = interpreter.evaluate(node.value) if node.value is not None else None
+            yield value
+            return None
+        expression = awaited_expression(node)
+        if expression is not None:
+            return (yield from self.walk_await(node, expression))
+        if isinstance(node, Block):
+            return (yield from self.walk_block(node.statements, Environment(interpreter.environment)))
+        if isinstance(node, IfStatement):
+            return (yield from self.walk_if(node))
+        if isinstance(node, MatchStatement):
+            body = interpreter.select_case(node, interpreter.evaluate(node.subject))
+            if body is None:
+                return None
+            return (yield from self.walk(body))
+        if isinstance(node, TryStatement):
+            return (yield from self.walk_try(node))
+        if isinstance(node, WhileLoop):
+            return (yield from self.walk_while(node))
+        return (yield from self.walk_for(node))
+
+    def walk_await(self, node: Statement, expression: AwaitExpression) -> Generator[Any, Any, None]:
+        """Walk a statement whose value is a प्रतीक्षा, finishing it with the awaited result"""
+        result = yield self.interpreter.evaluate(expression.operand)
+        self.complete(node, result)
+        return None
+
+    def complete(self, node: Statement, result: Any) -> None:
+        """Finish a statement whose value was produced while walking"""
+        interpreter = self.interpreter
+        if isinstance(node, Assignment):
+            interpreter.environment.assign(node.target.name, result)
+        elif isinstance(node, ConstantDeclaration):
+            interpreter.environment.define(node.target.name, result)
+        elif isinstance(node, ReturnStatement):
+            raise SanskritReturnException(result)
+
+    def walk_block(self, statements: List[Statement],
+                   environment: Environment) -> Generator[Any, None, Optional[LoopSignal]]:
+        """Walk statements inside a new scope"""
+        interpreter = self.interpreter
+        previous = interpreter.environment
+        interpreter.environment = environment
+        signal = yield from self.walk_statements(statements)
+        interpreter.environment = previous
+        return signal
+
+    def walk_if(self, node: IfStatement) -> Generator[Any, None, Optional[LoopSignal]]:
+        """Walk an if statement"""
+        interpreter = self.interpreter
+        if interpreter.is_truthy(interpreter.evaluate(node.condition)):
+            return (yield from self.walk(node.then_branch))
+        elif node.else_branch:
+            return (yield from self.walk(node.else_branch))
+        return None
+
+    def walk_try(self, node: TryStatement) -> Generator[Any, None, Optional[LoopSignal]]:
+        """Walk a try statement
+
+        A failing block leaves its scope active (see the class docstring),
+        so the try's own scope is put back before पकड़ and अन्ततः run.
+        Closing a paused generator raises GeneratorExit, which is not an
+        Exception: like other scopes, अन्ततः then does not run.
+        """
+        interpreter = self.interpreter
+        environment = interpreter.environment
+        try:
+            try:
+                signal = yield from self.walk(node.body)
+            except CONTROL_FLOW_EXCEPTIONS:
+                raise
+            except Exception as error:
+                if node.handler is None:
+                    raise
+                interpreter.environment = environment
+                signal = yield from self.walk_block(node.handler.statements,
+                                                    interpreter.handler_environment(node, error))
+        except Exception:
+            if node.finalizer is not None:
+                interpreter.environment = environment
+                yield from self.walk(node.finalizer)
+            raise
+        if node.finalizer is not None:
+            return (yield from self.walk(node.finalizer)) or signal
+        return signal
+
+    def walk_while(self, node: WhileLoop) -> Generator[Any, None, None]:
+        """Walk a while loop"""
+        interpreter = self.interpreter
+        while interpreter.is_truthy(interpreter.evaluate(node.condition)):
+            signal = yield from self.walk(node.body)
+            if signal is BREAK:
+                break
+        return None
+
+    def walk_for(self, node: ForLoop) -> Generator[Any, None, None]:
+        """Walk a for loop"""
+        interpreter = self.interpreter
+        iterable = interpreter.evaluate(node.iterable)
+
+        if not hasattr(iterable, '__iter__'):
+            raise SanskritRuntimeError("ऑब्जेक्ट iterable नहीं है")
+
+        environment = interpreter.environment
+        name = node.variable.name
+        for item in iterable:
+            environment.define(name, item)
+            signal = yield from self.walk(node.body)
+            if signal is BREAK:
+                break
+        return None
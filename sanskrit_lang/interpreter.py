@@ -3,63 +3,73 @@ Sanskrit Language Interpreter
 Tree-walking interpreter for Sanskrit programming language
 """
 
+import asyncio
+import inspect
+import operator
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Callable
 from .ast_nodes import *
 from .types import SanskritType, SanskritValue
-from .errors import SanskritRuntimeError, SanskritReturnException
+from .errors import (SanskritRuntimeError, SanskritReturnException,
+                     SanskritIndexError, SanskritKeyError, SanskritTypeError,
+                     SanskritError, CONTROL_FLOW_EXCEPTIONS, describe_error)
+from .lists import SanskritList
+from .records import make_record_type
+from .objects import (SanskritClass, SanskritInstance, BoundMethod,
+                      get_foreign_attribute)
 from .stdlib import get_builtin_functions
-
-class Environment:
-    """Environment for variable scoping"""
-    
-    def __init__(self, enclosing: Optional['Environment'] = None):
-        self.enclosing = enclosing
-        self.values: Dict[str, Any] = {}
-    
-    def define(self, name: str, value: Any) -> None:
-        """Define a variable"""
-        self.values[name] = value
-    
-    def get(self, name: str) -> Any:
-        """Get a variable value"""
-        if name in self.values:
-            return self.values[name]
-        
-        if self.enclosing:
-            return self.enclosing.get(name)
-        
-        raise SanskritRuntimeError(f"अपरिभाषित चर '{name}'")
-    
-    def assign(self, name: str, value: Any) -> None:
-        """Assign to a variable"""
-        if name in self.values:
-            self.values[name] = value
-            return
-        
-        if self.enclosing:
-            self.enclosing.assign(name, value)
-            return
-        
-        # If variable doesn't exist anywhere, create it in current scope
-        self.values[name] = value
+from .resolver import SanskritResolver
+from .optimizer import SanskritOptimizer
+from .environment import Environment, Cell, LoopSignal, BREAK, CONTINUE, StringBuffer
+from .generators import GeneratorWalker, SanskritGenerator, SanskritCoroutine
 
 class SanskritFunction:
     """Callable function object"""
     
-    def __init__(self, declaration: FunctionDef, closure: Environment):
+    def __init__(self, declaration: FunctionDef, closure: Environment,
+                 interpreter: Optional['SanskritInterpreter'] = None):
         self.declaration = declaration
         self.closure = closure
+        # Kept so that Python code (stdlib callbacks) can call the function directly
+        self.interpreter = interpreter
+        self.parameter_names = tuple(param.name for param in declaration.parameters)
+        # Bodies consisting of a single वापसी are evaluated without raising
+        # SanskritReturnException, which dominates the cost of small callbacks
+        statements = declaration.body.statements
+        if len(statements) == 1 and isinstance(statements[0], ReturnStatement):
+            self.return_expression = statements[0].value
+            self.returns_directly = True
+        else:
+            self.return_expression = None
+            self.returns_directly = False
+    
+    def bind(self, arguments: List[Any]) -> Environment:
+        """Create the call environment with parameters bound"""
+        environment = Environment(self.closure)
+        
+        # A fresh environment has no captured cells yet, so write values directly
+        values = environment.values
+        for name, argument in zip(self.parameter_names, arguments):
+            values[name] = argument
+        for name in self.parameter_names[len(arguments):]:
+            values[name] = None
+        return environment
     
     def call(self, interpreter: 'SanskritInterpreter', arguments: List[Any]) -> Any:
         """Call the function"""
-        environment = Environment(self.closure)
+        environment = self.bind(arguments)
         
-        # Bind parameters
-        for i, param in enumerate(self.declaration.parameters):
-            if i < len(arguments):
-                environment.define(param.name, arguments[i])
-            else:
-                environment.define(param.name, None)
+        if self.returns_directly:
+            if self.return_expression is None:
+                return None
+            previous = interpreter.environment
+            interpreter.environment = environment
+            try:
+                return self.return_expression.accept(interpreter)
+            finally:
+                interpreter.environment = previous
         
         try:
             interpreter.execute_block(self.declaration.body.statements, environment)
@@ -68,53 +78,188 @@ class SanskritFunction:
         
         return None
     
+    def __call__(self, *arguments: Any) -> Any:
+        """Call from Python code, e.g. as a प्रवाह callback"""
+        if len(arguments) != len(self.parameter_names):
+            raise SanskritRuntimeError(
+                f"अपेक्षित {len(self.parameter_names)} तर्क, प्राप्त {len(arguments)}")
+        return self.call(self.interpreter, arguments)
+    
     def arity(self) -> int:
         """Return number of parameters"""
         return len(self.declaration.parameters)
 
-class SanskritClass:
-    """Class object"""
-    
-    def __init__(self, name: str, methods: Dict[str, SanskritFunction]):
-        self.name = name
-        self.methods = methods
-    
-    def call(self, interpreter: 'SanskritInterpreter', arguments: List[Any]) -> Any:
-        """Create instance of class"""
-        instance = SanskritInstance(self)
-        return instance
+class GeneratorFunction(SanskritFunction):
+    """Function containing प्रदान; calling it returns a lazy उत्पादक"""
+    
+    def call(self, interpreter: 'SanskritInterpreter', arguments: List[Any]) -> SanskritGenerator:
+        """Create a generator; the body runs only as values are requested"""
+        environment = self.bind(arguments)
+        frame = interpreter.generator_walker.run(self.declaration.body.statements)
+        return SanskritGenerator(self.declaration.name.name, interpreter, frame, environment)
+
+class AsyncFunction(SanskritFunction):
+    """असमकालिक कार्य; calling it returns a coroutine to await or चलाओ"""
+    
+    def call(self, interpreter: 'SanskritInterpreter', arguments: List[Any]) -> SanskritCoroutine:
+        """Create a coroutine; the body runs only once it is awaited"""
+        environment = self.bind(arguments)
+        frame = interpreter.generator_walker.run_async(self.declaration.body.statements)
+        return SanskritCoroutine(self.declaration.name.name, interpreter, frame, environment)
 
-class SanskritInstance:
-    """Instance of a class"""
+def make_function(declaration: FunctionDef, closure: Environment,
+                  interpreter: 'SanskritInterpreter') -> SanskritFunction:
+    """Create the function object matching a resolved declaration"""
+    if declaration.is_async:
+        return AsyncFunction(declaration, closure, interpreter)
+    if declaration.is_generator:
+        return GeneratorFunction(declaration, closure, interpreter)
+    return SanskritFunction(declaration, closure, interpreter)
+
+class MemoizedFunction(SanskritFunction):
+    """Function whose results are cached by argument tuple (स्मरण)"""
     
-    def __init__(self, klass: SanskritClass):
-        self.klass = klass
-        self.fields: Dict[str, Any] = {}
+    def __init__(self, function: SanskritFunction, capacity: int = 128):
+        super().__init__(function.declaration, function.closure, function.interpreter)
+        self.capacity = capacity
+        self.cache: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
     
-    def get(self, name: str) -> Any:
-        """Get field or method"""
-        if name in self.fields:
-            return self.fields[name]
-        
-        if name in self.klass.methods:
-            return self.klass.methods[name]
+    def call(self, interpreter: 'SanskritInterpreter', arguments: List[Any]) -> Any:
+        """Call the function, reusing a cached result when possible"""
+        # Types are part of the key so that 1, 1.0 and सत्य stay distinct
+        key = tuple((type(arg), arg) for arg in arguments)
+        try:
+            result = self.cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments (lists etc.) are never cached
+            return super().call(interpreter, arguments)
+        else:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return result
         
-        raise SanskritRuntimeError(f"अपरिभाषित गुण '{name}'")
-    
-    def set(self, name: str, value: Any) -> None:
-        """Set field"""
-        self.fields[name] = value
+        self.misses += 1
+        result = super().call(interpreter, arguments)
+        self.cache[key] = result
+        if len(self.cache) > self.capacity:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics"""
+        return {
+            'सफल': self.hits,
+            'असफल': self.misses,
+            'निष्कासन': self.evictions,
+            'आकार': len(self.cache),
+            'क्षमता': self.capacity,
+        }
+    
+    def clear(self) -> None:
+        """Empty the cache and reset statistics"""
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+# Shapes remembered per access site before it stops caching (megamorphic)
+MAX_INLINE_CACHE = 4
+
+# Augmented assignments between two ints, which can skip the generic rules
+INT_OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '%': operator.mod}
+
+# Serializes the one-time fill of inline caches shared by all execution contexts
+SITE_LOCK = threading.Lock()
+
+# Value bound by पकड़: the kind of error, its message and source line
+ErrorRecord = make_record_type('त्रुटि', ['प्रकार', 'संदेश', 'पंक्ति'])
 
 class SanskritInterpreter:
-    """Tree-walking interpreter"""
-    
-    def __init__(self):
+    """Tree-walking interpreter
+    
+    An interpreter is also an execution context: it owns the globals,
+    the current scope and the walkers, which no two threads may share.
+    context() makes another one over the same builtins and compiler,
+    so prepared programs can run in many threads at once, each in its
+    own context.
+    """
+    
+    def __init__(self, parent: Optional['SanskritInterpreter'] = None):
+        if parent is None:
+            self.builtins = get_builtin_functions()
+            self.resolver = SanskritResolver()
+            self.optimizer = SanskritOptimizer(self)
+            # Resolving and optimizing rewrite the shared tree, one program at a time
+            self.compile_lock = threading.Lock()
+        else:
+            self.builtins = parent.builtins
+            self.resolver = parent.resolver
+            self.optimizer = parent.optimizer
+            self.compile_lock = parent.compile_lock
         self.globals = Environment()
         self.environment = self.globals
+        self.generator_walker = GeneratorWalker(self)
+        # Created on first use, so programs without असमकालिक कार्य never need one
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Add built-in functions
-        for name, func in get_builtin_functions().items():
+        for name, func in self.builtins.items():
             self.globals.define(name, func)
+        self.globals.define('चलाओ', self.run_coroutine)
+    
+    def context(self) -> 'SanskritInterpreter':
+        """A fresh execution context sharing this interpreter's builtins and compiler"""
+        return SanskritInterpreter(self)
+    
+    def compile(self, source: str) -> Program:
+        """Parse and prepare source once, to run any number of times"""
+        from .lexer import SanskritLexer
+        from .parser import SanskritParser
+        
+        tokens = SanskritLexer(source).tokenize()
+        return self.prepare(SanskritParser(tokens).parse(), fresh_scope=True)
+    
+    def prepare(self, program: Program, fresh_scope: bool = False) -> Program:
+        """Resolve and optimize a program, once; afterwards threads may share it
+        
+        Programs run through execute and interpret share one outermost
+        scope, so REPL lines see earlier स्थिर constants. A fresh_scope
+        program is compiled on its own, as by compile and run_isolated.
+        """
+        with self.compile_lock:
+            if not program.prepared:
+                self.resolver.resolve(program, fresh_scope)
+                self.optimizer.optimize(program, fresh_scope)
+                program.prepared = True
+        return program
+    
+    def run_isolated(self, program: Program) -> Environment:
+        """Run a program in a new execution context, returning that context's globals
+        
+        Safe to call from many threads at once with the same program.
+        Errors propagate to the caller rather than being printed.
+        Strings built up by += or s = s + ... are handed back as plain
+        str, not as the StringBuffer the interpreter keeps internally.
+        """
+        self.prepare(program, fresh_scope=True)
+        context = self.context()
+        for statement in program.statements:
+            context.execute_statement(statement)
+        
+        globals = context.globals
+        for name, value in globals.values.items():
+            if type(value) is StringBuffer:
+                globals.values[name] = value.materialize()
+        for cell in (globals.cells or {}).values():
+            if type(cell.value) is StringBuffer:
+                cell.value = cell.value.materialize()
+        return globals
     
     def execute(self, source: str) -> None:
         """Execute source code"""
@@ -131,29 +276,88 @@ class SanskritInterpreter:
     
     def interpret(self, program: Program) -> None:
         """Interpret AST"""
+        self.prepare(program)
         try:
             for statement in program.statements:
                 self.execute_statement(statement)
         except SanskritRuntimeError as error:
             print(f"रनटाइम त्रुटि: {error}")
     
-    def execute_statement(self, stmt: Statement) -> None:
-        """Execute a statement"""
-        stmt.accept(self)
+    def run_coroutine(self, coroutine: Any) -> Any:
+        """Run a coroutine to completion on the interpreter's event loop (चलाओ)"""
+        if not inspect.isawaitable(coroutine):
+            raise SanskritTypeError(f"'चलाओ' को असमकालिक कार्य का परिणाम चाहिए, प्राप्त '{coroutine}'")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Inside run_async, statement-level चलाओ is awaited by the host instead
+            raise SanskritRuntimeError("चालू इवेंट लूप में 'चलाओ' केवल पूरे कथन या धारणा के मान के रूप में संभव है, "
+                                       "असमकालिक कार्य में 'प्रतीक्षा' का प्रयोग करें")
+        if self.event_loop is None:
+            self.event_loop = asyncio.new_event_loop()
+        return self.event_loop.run_until_complete(coroutine)
+    
+    async def run_async(self, program: Program, quantum: Optional[int] = None) -> None:
+        """Interpret a program as a task of an already running asyncio loop
+        
+        Long loops and deep call chains give way to the loop every
+        `quantum` back-edges or calls (see CooperativeWalker), so many
+        programs, each with its own interpreter, can share one loop.
+        """
+        from .cooperative import CooperativeWalker, PREEMPT, DEFAULT_QUANTUM
+        
+        self.prepare(program)
+        walker = CooperativeWalker(self, DEFAULT_QUANTUM if quantum is None else quantum)
+        frame = walker.run(program.statements)
+        value = None
+        error = None
+        # The walker leaves scopes in place when an error unwinds it
+        environment = self.environment
+        try:
+            while True:
+                try:
+                    request = frame.send(value) if error is None else frame.throw(error)
+                except StopIteration:
+                    return
+                value = error = None
+                if request is PREEMPT:
+                    await asyncio.sleep(0)
+                    continue
+                # A statement-level चलाओ: await the coroutine on this loop
+                try:
+                    if not inspect.isawaitable(request):
+                        raise SanskritTypeError(f"'चलाओ' को असमकालिक कार्य का परिणाम चाहिए, प्राप्त '{request}'")
+                    value = await request
+                except Exception as failure:
+                    error = failure
+        except SanskritRuntimeError as error:
+            print(f"रनटाइम त्रुटि: {error}")
+        finally:
+            self.environment = environment
+    
+    
+    def execute_statement(self, stmt: Statement) -> Optional[LoopSignal]:
+        """Execute a statement, returning its loop signal if any"""
+        return stmt.accept(self)
     
     def evaluate(self, expr: Expression) -> Any:
         """Evaluate an expression"""
         return expr.accept(self)
     
-    def execute_block(self, statements: List[Statement], environment: Environment) -> None:
-        """Execute a block of statements"""
+    def execute_block(self, statements: List[Statement], environment: Environment) -> Optional[LoopSignal]:
+        """Execute a block of statements, stopping at the first loop signal"""
         previous = self.environment
         try:
             self.environment = environment
             for statement in statements:
-                self.execute_statement(statement)
+                signal = statement.accept(self)
+                if signal is not None:
+                    return signal
         finally:
             self.environment = previous
+        return None
     
     def visit_program(self, node: Program) -> None:
         """Visit program node"""
@@ -166,11 +370,21 @@ class SanskritInterpreter:
     
     def visit_identifier(self, node: Identifier) -> Any:
         """Visit identifier node"""
-        return self.environment.get(node.name)
+        value = self.environment.get(node.name)
+        if type(value) is StringBuffer:
+            return value.materialize()
+        return value
     
     def visit_binary_operation(self, node: BinaryOperation) -> Any:
         """Visit binary operation node"""
         left = self.evaluate(node.left)
+        
+        # Logical operators short-circuit: the right side only runs when needed
+        if node.operator == 'च':  # and
+            return self.is_truthy(left) and self.is_truthy(self.evaluate(node.right))
+        elif node.operator == 'वा':  # or
+            return self.is_truthy(left) or self.is_truthy(self.evaluate(node.right))
+        
         right = self.evaluate(node.right)
         
         # Arithmetic operators
@@ -203,11 +417,13 @@ class SanskritInterpreter:
         elif node.operator == '>=':
             return left >= right
         
-        # Logical operators
-        elif node.operator == 'च':  # and
-            return self.is_truthy(left) and self.is_truthy(right)
-        elif node.operator == 'वा':  # or
-            return self.is_truthy(left) or self.is_truthy(right)
+        # Membership
+        elif node.operator == 'में':
+            try:
+                return left in right
+            except TypeError:
+                raise SanskritTypeError(f"'{type(right).__name__}' में सदस्यता जांच संभव नहीं",
+                                        node.line, node.column)
         
         raise SanskritRuntimeError(f"अज्ञात ऑपरेटर '{node.operator}'")
     
@@ -222,24 +438,295 @@ class SanskritInterpreter:
         
         raise SanskritRuntimeError(f"अज्ञात यूनरी ऑपरेटर '{node.operator}'")
     
+    def visit_await_expression(self, node: AwaitExpression) -> Any:
+        """Visit await expression node"""
+        # Async bodies run on the GeneratorWalker, which handles प्रतीक्षा itself
+        raise SanskritRuntimeError("'प्रतीक्षा' केवल असमकालिक कार्य के भीतर संभव है")
+    
+    def visit_conditional_expression(self, node: ConditionalExpression) -> Any:
+        """Visit conditional expression node"""
+        if self.is_truthy(self.evaluate(node.condition)):
+            return self.evaluate(node.then_value)
+        return self.evaluate(node.else_value)
+    
+    def visit_list_literal(self, node: ListLiteral) -> SanskritList:
+        """Visit list literal node"""
+        return SanskritList.from_values([self.evaluate(element) for element in node.elements])
+    
+    def visit_interpolated_string(self, node: InterpolatedString) -> str:
+        """Visit interpolated string node: one join instead of a chain of +"""
+        parts = []
+        for part in node.parts:
+            if type(part) is str:
+                parts.append(part)
+            else:
+                parts.append(str(self.evaluate(part)))
+        return ''.join(parts)
+    
+    def visit_dict_literal(self, node: DictLiteral) -> Dict[Any, Any]:
+        """Visit dictionary literal node"""
+        result = {}
+        for key_node, value_node in node.entries:
+            key = self.evaluate(key_node)
+            value = self.evaluate(value_node)
+            try:
+                result[key] = value
+            except TypeError:
+                raise SanskritTypeError(f"'{type(key).__name__}' शब्दकोश कुंजी नहीं हो सकती",
+                                        key_node.line, key_node.column)
+        return result
+    
+    def visit_index_expression(self, node: IndexExpression) -> Any:
+        """Visit index expression node"""
+        return self.get_item(self.evaluate(node.collection), self.evaluate(node.index), node)
+    
+    def get_item(self, collection: Any, index: Any, node: ASTNode) -> Any:
+        """Read collection[index], reporting failures at the given node"""
+        try:
+            return collection[index]
+        except KeyError:
+            raise SanskritKeyError(index, node.line, node.column)
+        except IndexError:
+            raise SanskritIndexError(index, len(collection), node.line, node.column)
+        except TypeError:
+            raise SanskritTypeError(
+                f"'{type(collection).__name__}' को '{type(index).__name__}' से अनुक्रमित नहीं किया जा सकता",
+                node.line, node.column)
+    
+    def visit_slice_expression(self, node: SliceExpression) -> Any:
+        """Visit slice expression node"""
+        collection = self.evaluate(node.collection)
+        start = self.evaluate(node.start) if node.start is not None else None
+        stop = self.evaluate(node.stop) if node.stop is not None else None
+        try:
+            return collection[start:stop]
+        except TypeError:
+            raise SanskritTypeError(f"'{type(collection).__name__}' का खण्ड संभव नहीं",
+                                    node.line, node.column)
+    
+    def visit_index_assignment(self, node: IndexAssignment) -> None:
+        """Visit index assignment node"""
+        collection = self.evaluate(node.collection)
+        index = self.evaluate(node.index)
+        value = self.evaluate(node.value)
+        try:
+            collection[index] = value
+        except IndexError:
+            raise SanskritIndexError(index, len(collection), node.line, node.column)
+        except TypeError:
+            raise SanskritTypeError(f"'{type(collection).__name__}' में असाइनमेंट संभव नहीं",
+                                    node.line, node.column)
+    
     def visit_assignment(self, node: Assignment) -> None:
         """Visit assignment node"""
+        if node.appends:
+            self.append_assignment(node)
+            return
         value = self.evaluate(node.value)
         self.environment.assign(node.target.name, value)
     
-    def visit_if_statement(self, node: IfStatement) -> None:
+    def append_assignment(self, node: Assignment) -> None:
+        """Run x = x + y, appending to a buffer instead of copying x when x is a string
+        
+        The variable then holds a StringBuffer, which reads of x join on
+        demand, so a loop of appends costs linear rather than quadratic time.
+        """
+        name = node.target.name
+        current = self.environment.get(name)
+        if type(current) is StringBuffer or type(current) is str:
+            current = self.append_text(current, node.value.right)
+        else:
+            # Not a string: plain +, without reading x a second time
+            right = self.evaluate(node.value.right)
+            if isinstance(right, str):
+                current = str(current) + right
+            else:
+                current = current + right
+        # Assign even when appending in place: the right side may have rebound x
+        self.environment.assign(name, current)
+    
+    def append_text(self, current: Any, expression: Expression) -> StringBuffer:
+        """Append the text of an expression to a string variable's value, as a buffer"""
+        if type(current) is str:
+            buffer = StringBuffer(current)
+            buffer.append(str(self.evaluate(expression)))
+            return buffer
+        
+        mark = len(current)
+        right = self.evaluate(expression)
+        if len(current) != mark:
+            # The right side appended to x itself; x + y must use the old x
+            current = StringBuffer(current.materialize()[:mark])
+        current.append(str(right))
+        return current
+    
+    def visit_compound_assignment(self, node: CompoundAssignment) -> None:
+        """Visit augmented assignment node: one read-modify-write of the target"""
+        target = node.target
+        if type(target) is Identifier:
+            name = target.name
+            scope = self.environment.owner(name)
+            values = scope.values
+            current = values[name] if name in values else scope.cells[name].value
+            if type(current) is int:
+                # Counters: int with int needs none of the generic + rules
+                value = self.evaluate(node.value)
+                operation = INT_OPERATORS.get(node.operator)
+                if type(value) is int and operation is not None:
+                    result = operation(current, value)
+                else:
+                    result = self.apply_in_place(node, current, value)
+            elif node.operator == '+' and (type(current) is StringBuffer or type(current) is str):
+                result = self.append_text(current, node.value)
+            else:
+                if type(current) is StringBuffer:
+                    current = current.materialize()
+                result = self.apply_in_place(node, current, self.evaluate(node.value))
+            if name in values:
+                values[name] = result
+            else:
+                scope.set_own(name, result)
+        
+        elif type(target) is IndexExpression:
+            collection = self.evaluate(target.collection)
+            index = self.evaluate(target.index)
+            current = self.get_item(collection, index, target)
+            result = self.apply_in_place(node, current, self.evaluate(node.value))
+            if result is not current:
+                try:
+                    collection[index] = result
+                except TypeError:
+                    raise SanskritTypeError(f"'{type(collection).__name__}' में असाइनमेंट संभव नहीं",
+                                            node.line, node.column)
+        
+        else:
+            obj = self.evaluate(target.object)
+            if type(obj) is not SanskritInstance:
+                raise SanskritTypeError(f"'{type(obj).__name__}' के गुण निर्दिष्ट नहीं किए जा सकते",
+                                        node.line, node.column)
+            current = obj.get(target.name)
+            result = self.apply_in_place(node, current, self.evaluate(node.value))
+            if result is not current:
+                obj.set(target.name, result)
+    
+    def apply_in_place(self, node: CompoundAssignment, current: Any, value: Any) -> Any:
+        """Combine a target's value with the right side, mutating it where + allows"""
+        if node.operator == '+':
+            if type(current) is SanskritList and isinstance(value, SanskritList):
+                current.extend(value)
+                return current
+            if isinstance(current, StringBuffer):
+                # शब्द.निर्माता builders
+                current.append(value if type(value) is str else str(value))
+                return current
+            if isinstance(current, str) or isinstance(value, str):
+                return str(current) + str(value)
+            return current + value
+        elif node.operator == '-':
+            return current - value
+        elif node.operator == '*':
+            return current * value
+        elif node.operator == '/':
+            if value == 0:
+                raise SanskritRuntimeError("शून्य से भाग")
+            return current / value
+        elif node.operator == '%':
+            return current % value
+        raise SanskritRuntimeError(f"अज्ञात ऑपरेटर '{node.operator}='")
+    
+    def visit_constant_declaration(self, node: ConstantDeclaration) -> None:
+        """Visit constant declaration node"""
+        value = self.evaluate(node.value)
+        self.environment.define(node.target.name, value)
+    
+    def visit_if_statement(self, node: IfStatement) -> Optional[LoopSignal]:
         """Visit if statement node"""
         condition = self.evaluate(node.condition)
         
         if self.is_truthy(condition):
-            self.execute_statement(node.then_branch)
+            return self.execute_statement(node.then_branch)
         elif node.else_branch:
-            self.execute_statement(node.else_branch)
+            return self.execute_statement(node.else_branch)
+        return None
+    
+    def visit_match_statement(self, node: MatchStatement) -> Optional[LoopSignal]:
+        """Visit match statement node"""
+        body = self.select_case(node, self.evaluate(node.subject))
+        if body is None:
+            return None
+        return self.execute_statement(body)
+    
+    def select_case(self, node: MatchStatement, subject: Any) -> Optional[Statement]:
+        """Find the branch for a subject: one dict lookup when every case is a constant"""
+        table = node.jump_table
+        if table is None:
+            table = node.jump_table = self.build_jump_table(node)
+        
+        if table is not False:
+            try:
+                return table.get(subject, node.default)
+            except TypeError:
+                # Unhashable subjects, such as lists, never equal a constant case
+                return node.default
+        
+        for values, body in node.cases:
+            for value in values:
+                if subject == self.evaluate(value):
+                    return body
+        return node.default
+    
+    def build_jump_table(self, node: MatchStatement) -> Any:
+        """Map constant case values to their bodies, or False if any case is computed"""
+        table = {}
+        for values, body in node.cases:
+            for value in values:
+                if not isinstance(value, Literal):
+                    return False
+                # The first of duplicate cases wins, as in a sequential test
+                table.setdefault(value.value, body)
+        return table
+    
+    def visit_try_statement(self, node: TryStatement) -> Optional[LoopSignal]:
+        """Visit try statement node
+        
+        The body runs inside a plain Python try, so nothing is recorded
+        per statement: entering the body costs nothing until an error is
+        actually raised. वापसी, विराम and अग्रे pass through untouched.
+        """
+        environment = self.environment
+        signal = None
+        final_signal = None
+        try:
+            try:
+                signal = self.execute_statement(node.body)
+            except CONTROL_FLOW_EXCEPTIONS:
+                raise
+            except Exception as error:
+                if node.handler is None:
+                    raise
+                self.environment = environment
+                signal = self.execute_block(node.handler.statements,
+                                            self.handler_environment(node, error))
+        finally:
+            if node.finalizer is not None:
+                self.environment = environment
+                final_signal = self.execute_statement(node.finalizer)
+        return final_signal or signal
+    
+    def handler_environment(self, node: TryStatement, error: Exception) -> Environment:
+        """Scope of a पकड़ block, with the error bound as a त्रुटि record"""
+        environment = Environment(self.environment)
+        if node.error_name is not None:
+            kind, message = describe_error(error)
+            line = error.line if isinstance(error, SanskritError) and error.line > 0 else None
+            environment.define(node.error_name.name, ErrorRecord(kind, message, line))
+        return environment
     
     def visit_while_loop(self, node: WhileLoop) -> None:
         """Visit while loop node"""
         while self.is_truthy(self.evaluate(node.condition)):
-            self.execute_statement(node.body)
+            if self.execute_statement(node.body) is BREAK:
+                break
     
     def visit_for_loop(self, node: ForLoop) -> None:
         """Visit for loop node"""
@@ -248,24 +735,67 @@ class SanskritInterpreter:
         if not hasattr(iterable, '__iter__'):
             raise SanskritRuntimeError("ऑब्जेक्ट iterable नहीं है")
         
+        if isinstance(node.body, Block):
+            # Fast path: the loop variable is written straight into the
+            # enclosing scope and the body block runs without the generic
+            # visitor dispatch. परिधि ranges iterate natively here.
+            environment = self.environment
+            values = environment.values
+            name = node.variable.name
+            statements = node.body.statements
+            execute_block = self.execute_block
+            for item in iterable:
+                if environment.cells is None:
+                    values[name] = item
+                else:
+                    environment.define(name, item)
+                if execute_block(statements, Environment(environment)) is BREAK:
+                    break
+            return
+        
         for item in iterable:
             self.environment.define(node.variable.name, item)
-            self.execute_statement(node.body)
+            if self.execute_statement(node.body) is BREAK:
+                break
     
     def visit_function_def(self, node: FunctionDef) -> None:
         """Visit function definition node"""
-        function = SanskritFunction(node, self.environment)
+        function = make_function(node, self.globals, self)
         self.environment.define(node.name.name, function)
+        # Captured after defining the name so recursive calls resolve
+        function.closure = self.create_closure(node)
     
     def visit_function_call(self, node: FunctionCall) -> Any:
         """Visit function call node"""
-        callee = self.evaluate(node.function)
+        function = node.function
+        if type(function) is MemberExpression:
+            # obj.method(...) calls the method without building a BoundMethod
+            receiver = self.evaluate(function.object)
+            if type(receiver) is SanskritInstance:
+                index, method = self.lookup_member(receiver, function)
+                if method is not None:
+                    arguments = [receiver]
+                    for arg in node.arguments:
+                        arguments.append(self.evaluate(arg))
+                    if len(arguments) != method.arity():
+                        raise SanskritRuntimeError(
+                            f"अपेक्षित {method.arity() - 1} तर्क, प्राप्त {len(arguments) - 1}")
+                    return method.call(self, arguments)
+                callee = receiver.slots[index]
+            else:
+                callee = get_foreign_attribute(receiver, function.name)
+        else:
+            callee = self.evaluate(function)
         
         arguments = []
         for arg in node.arguments:
             arguments.append(self.evaluate(arg))
         
-        if isinstance(callee, SanskritFunction):
+        return self.call_value(callee, arguments)
+    
+    def call_value(self, callee: Any, arguments: List[Any]) -> Any:
+        """Call a function, class, method or builtin with evaluated arguments"""
+        if isinstance(callee, (SanskritFunction, SanskritClass, BoundMethod)):
             if len(arguments) != callee.arity():
                 raise SanskritRuntimeError(
                     f"अपेक्षित {callee.arity()} तर्क, प्राप्त {len(arguments)}")
@@ -276,6 +806,122 @@ class SanskritInterpreter:
         else:
             raise SanskritRuntimeError("केवल फ़ंक्शन को कॉल किया जा सकता है")
     
+    def lookup_member(self, instance: SanskritInstance, node: MemberExpression) -> tuple:
+        """Find a member as (slot index, None) or (None, method), via the site's inline cache"""
+        shape = instance.shape
+        shape_ref = shape.ref
+        for entry in node.cache:
+            if entry[0] is shape_ref:
+                if entry[3] == shape.klass.version:
+                    # While the shape lives so do its class and, at this version, the method
+                    return entry[1], entry[2] and entry[2]()
+                # The class hierarchy changed since this entry was made.
+                # Rebinding, unlike remove(), cannot fail if another
+                # context dropped the same entry first.
+                node.cache = [other for other in node.cache if other is not entry]
+                break
+        
+        index = shape.fields.get(node.name)
+        method = None
+        if index is None:
+            method = shape.klass.method_table.get(node.name)
+            if method is None:
+                raise SanskritRuntimeError(f"अपरिभाषित गुण '{node.name}'")
+        cache = self.live_entries(node)
+        if len(cache) < MAX_INLINE_CACHE:
+            cache.append((shape_ref, index, method and weakref.ref(method), shape.klass.version))
+        return index, method
+    
+    def live_entries(self, node: ASTNode) -> List[tuple]:
+        """A site's inline cache without entries whose shape has been freed
+        
+        Shapes of finished execution contexts die with them; dropping
+        their entries leaves room for the shapes of later contexts.
+        """
+        cache = node.cache
+        if len(cache) >= MAX_INLINE_CACHE and any(entry[0]() is None for entry in cache):
+            cache = [entry for entry in cache if entry[0]() is not None]
+            node.cache = cache
+        return cache
+    
+    def visit_member_expression(self, node: MemberExpression) -> Any:
+        """Visit member access node"""
+        obj = self.evaluate(node.object)
+        if type(obj) is not SanskritInstance:
+            return get_foreign_attribute(obj, node.name)
+        
+        # Monomorphic fast path: one identity check, no dictionary lookups
+        if obj.shape.ref is node.field_ref:
+            return obj.slots[node.field_index]
+        
+        index, method = self.lookup_member(obj, node)
+        if method is not None:
+            return BoundMethod(obj, method)
+        field_ref = node.field_ref
+        if field_ref is None or field_ref() is None:
+            with SITE_LOCK:
+                if node.field_ref is field_ref:
+                    # Index first: whoever sees the shape also sees its index
+                    node.field_index = index
+                    node.field_ref = obj.shape.ref
+        return obj.slots[index]
+    
+    def visit_member_assignment(self, node: MemberAssignment) -> None:
+        """Visit member assignment node"""
+        obj = self.evaluate(node.object)
+        value = self.evaluate(node.value)
+        if type(obj) is SanskritClass:
+            if not isinstance(value, SanskritFunction):
+                raise SanskritTypeError(f"वर्ग '{obj.name}' में केवल फ़ंक्शन विधि के रूप में जोड़े जा सकते हैं",
+                                        node.line, node.column)
+            obj.set_method(node.name, value)
+            return
+        if type(obj) is not SanskritInstance:
+            raise SanskritTypeError(f"'{type(obj).__name__}' के गुण निर्दिष्ट नहीं किए जा सकते",
+                                    node.line, node.column)
+        
+        shape = obj.shape
+        shape_ref = shape.ref
+        for cached_ref, index, next_ref in node.cache:
+            if cached_ref is shape_ref:
+                if next_ref is shape_ref:
+                    obj.slots[index] = value
+                else:
+                    # The transition is alive while the shape before it is
+                    obj.slots.append(value)
+                    obj.shape = next_ref()
+                return
+        
+        index = shape.fields.get(node.name)
+        if index is None:
+            # New field: slots stay in step with the shape's field count
+            next_shape = shape.with_field(node.name)
+            index = len(obj.slots)
+            obj.slots.append(value)
+            obj.shape = next_shape
+        else:
+            next_shape = shape
+            obj.slots[index] = value
+        cache = self.live_entries(node)
+        if len(cache) < MAX_INLINE_CACHE:
+            cache.append((shape_ref, index, next_shape.ref))
+    
+    def create_closure(self, declaration: FunctionDef) -> Environment:
+        """Build a flat closure holding only the variables a function uses"""
+        if self.environment is self.globals:
+            return self.globals
+        
+        if declaration.free_names is None:
+            with self.compile_lock:
+                self.resolver.resolve_function(declaration)
+        
+        closure = Environment(self.globals)
+        for name in declaration.free_names:
+            cell = self.environment.capture(name)
+            if cell is not None:
+                closure.add_cell(name, cell)
+        return closure
+    
     def visit_return_statement(self, node: ReturnStatement) -> None:
         """Visit return statement node"""
         value = None
@@ -284,16 +930,42 @@ class SanskritInterpreter:
         
         raise SanskritReturnException(value)
     
+    def visit_yield_statement(self, node: YieldStatement) -> None:
+        """Visit yield statement node"""
+        # Generator bodies run on the GeneratorWalker, which handles प्रदान itself
+        raise SanskritRuntimeError("'प्रदान' केवल उत्पादक कार्य के भीतर संभव है")
+    
+    def visit_break_statement(self, node: BreakStatement) -> LoopSignal:
+        """Visit break statement node"""
+        return BREAK
+    
+    def visit_continue_statement(self, node: ContinueStatement) -> LoopSignal:
+        """Visit continue statement node"""
+        return CONTINUE
+    
     def visit_class_def(self, node: ClassDef) -> None:
         """Visit class definition node"""
         methods = {}
         for method in node.methods:
-            function = SanskritFunction(method, self.environment)
+            function = make_function(method, self.create_closure(method), self)
             methods[method.name.name] = function
         
-        klass = SanskritClass(node.name.name, methods)
+        bases = []
+        for superclass in node.superclasses:
+            base = self.evaluate(superclass)
+            if type(base) is not SanskritClass:
+                raise SanskritTypeError(f"'{superclass.name}' वर्ग नहीं है, इससे विरासत संभव नहीं",
+                                        node.line, node.column)
+            bases.append(base)
+        
+        klass = SanskritClass(node.name.name, methods, bases)
         self.environment.define(node.name.name, klass)
     
+    def visit_record_def(self, node: RecordDef) -> None:
+        """Visit record definition node"""
+        record_type = make_record_type(node.name.name, [field.name for field in node.fields])
+        self.environment.define(node.name.name, record_type)
+    
     def visit_import_statement(self, node: ImportStatement) -> None:
         """Visit import statement node"""
         # Simple import implementation
@@ -301,9 +973,9 @@ class SanskritInterpreter:
         module = load_module(node.module)
         self.environment.define(node.module, module)
     
-    def visit_block(self, node: Block) -> None:
+    def visit_block(self, node: Block) -> Optional[LoopSignal]:
         """Visit block node"""
-        self.execute_block(node.statements, Environment(self.environment))
+        return self.execute_block(node.statements, Environment(self.environment))
     
     def visit_expression_statement(self, node: ExpressionStatement) -> None:
         """Visit expression statement node"""
@@ -7,11 +7,13 @@ import re
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Iterator, Optional
+from .errors import SanskritSyntaxError
 
 class TokenType(Enum):
     # Literals
     SANKHYA = "SANKHYA"  # Number
     SHABDA = "SHABDA"    # String
+    SAANCHA = "SAANCHA"  # Interpolated string $"...{expr}..."
     SATYA = "SATYA"      # True
     ASATYA = "ASATYA"    # False
     SHUNYA = "SHUNYA"    # None/Null
@@ -31,6 +33,18 @@ class TokenType(Enum):
     STHIRA = "STHIRA"    # const
     AAYAT = "AAYAT"      # import
     SE = "SE"            # from
+    VIRAAMA = "VIRAAMA"  # break
+    AGRE = "AGRE"        # continue
+    MEIN = "MEIN"        # in
+    PRADAANA = "PRADAANA"  # yield
+    ABHILEKHA = "ABHILEKHA"  # record
+    CHAYANA = "CHAYANA"  # match
+    VIKALPA = "VIKALPA"  # case
+    PRAYAASA = "PRAYAASA"  # try
+    PAKAD = "PAKAD"      # catch
+    ANTATAH = "ANTATAH"  # finally
+    ASAMAKALIKA = "ASAMAKALIKA"  # async
+    PRATIKSHA = "PRATIKSHA"  # await
     
     # Operators
     YOGA = "YOGA"        # + (addition)
@@ -45,6 +59,11 @@ class TokenType(Enum):
     LAGHU_SAMA = "LAGHU_SAMA"  # <= (less equal)
     MAHAN_SAMA = "MAHAN_SAMA"  # >= (greater equal)
     NIRDESH = "NIRDESH"  # = (assignment)
+    YOGA_NIRDESH = "YOGA_NIRDESH"  # +=
+    VYAVAKALANA_NIRDESH = "VYAVAKALANA_NIRDESH"  # -=
+    GUNA_NIRDESH = "GUNA_NIRDESH"  # *=
+    BHAGA_NIRDESH = "BHAGA_NIRDESH"  # /=
+    SHESH_NIRDESH = "SHESH_NIRDESH"  # %=
     
     # Logical operators
     CHA = "CHA"          # and
@@ -100,6 +119,19 @@ class SanskritLexer:
             'स्थिर': TokenType.STHIRA,
             'आयात': TokenType.AAYAT,
             'से': TokenType.SE,
+            'विराम': TokenType.VIRAAMA,
+            'अग्रे': TokenType.AGRE,
+            'में': TokenType.MEIN,
+            'प्रदान': TokenType.PRADAANA,
+            'अभिलेख': TokenType.ABHILEKHA,
+            'चयन': TokenType.CHAYANA,
+            'विकल्प': TokenType.VIKALPA,
+            'प्रयास': TokenType.PRAYAASA,
+            'पकड़': TokenType.PAKAD,
+            '\u092a\u0915\u095c': TokenType.PAKAD,  # पकड़ typed with the precomposed ड़
+            'अन्ततः': TokenType.ANTATAH,
+            'असमकालिक': TokenType.ASAMAKALIKA,
+            'प्रतीक्षा': TokenType.PRATIKSHA,
             'सत्य': TokenType.SATYA,
             'असत्य': TokenType.ASATYA,
             'शून्य': TokenType.SHUNYA,
@@ -122,6 +154,11 @@ class SanskritLexer:
             '<=': TokenType.LAGHU_SAMA,
             '>=': TokenType.MAHAN_SAMA,
             '=': TokenType.NIRDESH,
+            '+=': TokenType.YOGA_NIRDESH,
+            '-=': TokenType.VYAVAKALANA_NIRDESH,
+            '*=': TokenType.GUNA_NIRDESH,
+            '/=': TokenType.BHAGA_NIRDESH,
+            '%=': TokenType.SHESH_NIRDESH,
         }
         
         # Punctuation mapping
@@ -212,6 +249,93 @@ class SanskritLexer:
         
         return Token(TokenType.SHABDA, value, self.line, start_col)
     
+    def read_escape(self) -> str:
+        """Read the character after a backslash in a string literal"""
+        escape_chars = {'n': '\n', 'r': '\r', 't': '\t',
+                        'b': '\b', 'f': '\f', '"': '"',
+                        "'": "'", '\\': '\\'}
+        char = self.current_char()
+        if char is None:
+            return '\\'
+        self.advance()
+        return escape_chars.get(char, char)
+    
+    def read_interpolated_string(self) -> Token:
+        """Read interpolated string literal: $"text {expression} text"
+        
+        The value is a list of parts: plain strings for the text and token
+        lists for the embedded expressions, so the parser can build the
+        whole literal once instead of the interpreter re-scanning it.
+        {{ and }} stand for literal braces.
+        """
+        start_line, start_col = self.line, self.column
+        self.advance()  # consume $
+        quote_char = self.current_char()
+        self.advance()  # consume opening quote
+        parts = []
+        text = ""
+        
+        while self.current_char() and self.current_char() != quote_char:
+            char = self.current_char()
+            if char == '\\':
+                self.advance()
+                text += self.read_escape()
+            elif char == '{' and self.peek_char() == '{':
+                self.advance()
+                self.advance()
+                text += '{'
+            elif char == '}' and self.peek_char() == '}':
+                self.advance()
+                self.advance()
+                text += '}'
+            elif char == '{':
+                if text:
+                    parts.append(text)
+                    text = ""
+                self.advance()
+                parts.append(self.read_interpolation())
+            else:
+                text += char
+                self.advance()
+        
+        if self.current_char() != quote_char:
+            raise SanskritSyntaxError("अपूर्ण साँचा शब्द", start_line, start_col)
+        self.advance()  # consume closing quote
+        
+        if text:
+            parts.append(text)
+        return Token(TokenType.SAANCHA, parts, start_line, start_col)
+    
+    def read_interpolation(self) -> List[Token]:
+        """Tokenize one {expression} of an interpolated string, after its '{'"""
+        line, column = self.line, self.column
+        start_pos = self.position
+        depth = 0
+        while self.current_char() is not None:
+            char = self.current_char()
+            if char in '"\'':
+                # Strings inside the expression may contain braces
+                self.read_string(char)
+                continue
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                if depth == 0:
+                    break
+                depth -= 1
+            self.advance()
+        
+        if self.current_char() != '}':
+            raise SanskritSyntaxError("साँचा शब्द में '}' की अपेक्षा", line, column)
+        source = self.source[start_pos:self.position]
+        self.advance()  # consume closing brace
+        if not source.strip():
+            raise SanskritSyntaxError("साँचा शब्द में रिक्त अभिव्यक्ति", line, column)
+        
+        lexer = SanskritLexer(source)
+        lexer.line, lexer.column = line, column
+        return [token for token in lexer.tokenize() if token.type != TokenType.NAVAPANKTI]
+    
     def read_identifier(self) -> Token:
         """Read identifier or keyword"""
         start_pos = self.position
@@ -234,7 +358,7 @@ class SanskritLexer:
         char = self.current_char()
         
         # Check for two-character operators first
-        if char in '<>!=':
+        if char in '<>!=+-*/%':
             next_char = self.peek_char()
             if next_char == '=':
                 op = char + next_char
@@ -279,6 +403,11 @@ class SanskritLexer:
                 tokens.append(self.read_number())
                 continue
             
+            # Handle interpolated strings
+            if char == '$' and self.peek_char() in ('"', "'"):
+                tokens.append(self.read_interpolated_string())
+                continue
+            
             # Handle strings
             if char in '"\'':
                 tokens.append(self.read_string(char))
@@ -0,0 +1,142 @@
+"""
+Sanskrit Language Lists
+List (सूची) values with compact storage for numeric data
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator, Union
+
+# array typecodes for homogeneous numeric lists: 64-bit ints and doubles
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+
+def _compact_typecode(values: list) -> Union[str, None]:
+    """Pick an array typecode that can hold every value exactly, if any"""
+    if not values:
+        return None
+
+    first = type(values[0])
+    if first is int:
+        typecode = INT_TYPECODE
+    elif first is float:
+        typecode = FLOAT_TYPECODE
+    else:
+        return None
+
+    # bool is a subclass of int, so compare exact types
+    for value in values:
+        if type(value) is not first:
+            return None
+    return typecode
+
+class SanskritList:
+    """List value (सूची)
+
+    Lists holding only integers or only floats are stored in an
+    array.array, which takes 8 bytes per element instead of a pointer
+    plus a boxed number. Storing any other value switches the list to a
+    plain Python list, transparently.
+    """
+
+    __slots__ = ('items',)
+    __hash__ = None
+
+    def __init__(self, items: Union[list, array, None] = None):
+        self.items = items if items is not None else []
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> 'SanskritList':
+        """Build a list, choosing compact storage when possible"""
+        values = list(values)
+        typecode = _compact_typecode(values)
+        if typecode is not None:
+            try:
+                return cls(array(typecode, values))
+            except OverflowError:
+                pass
+        return cls(values)
+
+    @property
+    def is_compact(self) -> bool:
+        """Whether the list uses array-backed storage"""
+        return isinstance(self.items, array)
+
+    def _fits(self, value: Any) -> bool:
+        """Check whether a value can be stored without leaving the array"""
+        if self.items.typecode == INT_TYPECODE:
+            return type(value) is int
+        return type(value) is float
+
+    def _generalize(self) -> None:
+        """Fall back from array storage to a generic list"""
+        self.items = self.items.tolist()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.items
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return SanskritList(self.items[index])
+        return self.items[index]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        if self.is_compact and not self._fits(value):
+            self._generalize()
+        try:
+            self.items[index] = value
+        except OverflowError:
+            self._generalize()
+            self.items[index] = value
+
+    def append(self, value: Any) -> None:
+        """Append a value (जोड़)"""
+        if self.is_compact and not self._fits(value):
+            self._generalize()
+        try:
+            self.items.append(value)
+        except OverflowError:
+            self._generalize()
+            self.items.append(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append every value from an iterable (विस्तार)"""
+        if (self.is_compact and isinstance(values, SanskritList) and values.is_compact
+                and values.items.typecode == self.items.typecode):
+            self.items.extend(values.items)
+            return
+        if values is self:
+            # Iterating a list while appending to it would never end
+            values = list(self.items)
+        for value in values:
+            self.append(value)
+
+    def __add__(self, other: Any) -> 'SanskritList':
+        if not isinstance(other, SanskritList):
+            return NotImplemented
+        if self.is_compact and other.is_compact and self.items.typecode == other.items.typecode:
+            return SanskritList(self.items + other.items)
+        return SanskritList.from_values(list(self.items) + list(other.items))
+
+    def __mul__(self, count: Any) -> 'SanskritList':
+        if type(count) is not int:
+            return NotImplemented
+        return SanskritList(self.items * count)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SanskritList):
+            return list(self.items) == list(other.items)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        # Displayed like a Python list, also when nested in other collections
+        return repr(list(self.items))
+
+    __str__ = __repr__
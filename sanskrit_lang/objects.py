@@ -0,0 +1,245 @@
+"""
+Sanskrit Language Objects
+Classes, instances and the hidden-class shapes that lay out their fields
+"""
+
+import re
+import weakref
+from typing import Any, Dict, List, Optional
+from .errors import SanskritRuntimeError, SanskritTypeError
+
+# Implicit first parameter of every method, bound to the receiving instance
+SELF_NAME = 'यह'
+# Method run by the class constructor with the constructor's arguments
+INITIALIZER_NAME = 'प्रारंभ'
+
+class Shape:
+    """Hidden class: the field layout shared by instances built the same way
+
+    A shape maps field names to slot indices. Adding a field moves an
+    instance to a child shape through a cached transition, so all
+    instances whose fields were assigned in the same order share one
+    shape object. Access sites compare shapes by identity to reuse a
+    previously found slot index without any dictionary lookup.
+
+    Sites keep the shape's own weak reference, `ref`, and compare that
+    instead: the syntax tree outlives the programs run from it, and must
+    not keep their classes, and through them their globals, alive.
+    """
+
+    __slots__ = ('klass', 'fields', 'transitions', 'ref', '__weakref__')
+
+    def __init__(self, klass: 'SanskritClass', fields: Optional[Dict[str, int]] = None):
+        self.klass = klass
+        self.fields = fields if fields is not None else {}
+        self.transitions: Dict[str, 'Shape'] = {}
+        self.ref = weakref.ref(self)
+
+    def with_field(self, name: str) -> 'Shape':
+        """The shape reached by adding a field"""
+        shape = self.transitions.get(name)
+        if shape is None:
+            fields = dict(self.fields)
+            fields[name] = len(fields)
+            shape = Shape(self.klass, fields)
+            self.transitions[name] = shape
+        return shape
+
+def c3_linearize(klass: 'SanskritClass', bases: List['SanskritClass']) -> List['SanskritClass']:
+    """Method resolution order by C3 linearization, as in Python"""
+    sequences = [list(base.mro) for base in bases] + [list(bases)]
+    order = [klass]
+    while True:
+        sequences = [sequence for sequence in sequences if sequence]
+        if not sequences:
+            return order
+        for sequence in sequences:
+            candidate = sequence[0]
+            # A head is usable only if no other sequence still needs it later
+            if not any(candidate in other[1:] for other in sequences):
+                break
+        else:
+            raise SanskritTypeError(f"वर्ग '{klass.name}' के लिए सुसंगत विधि समाधान क्रम संभव नहीं")
+        order.append(candidate)
+        for sequence in sequences:
+            if sequence[0] is candidate:
+                del sequence[0]
+
+class SanskritClass:
+    """Class object
+
+    Methods are resolved once, at class creation, into a flat table
+    covering the whole MRO, so lookups on deep hierarchies cost one
+    dictionary probe. The table is rebuilt, and the version bumped, only
+    when this class or one of its ancestors gets a new method.
+    """
+
+    def __init__(self, name: str, methods: Dict[str, Any], bases: Optional[List['SanskritClass']] = None):
+        self.name = name
+        self.methods = methods
+        self.bases = list(bases or [])
+        self.mro = c3_linearize(self, self.bases)
+        # Classes inheriting from this one, so they can be invalidated
+        self.subclasses: 'weakref.WeakSet[SanskritClass]' = weakref.WeakSet()
+        for base in self.bases:
+            base.subclasses.add(self)
+        self.version = 0
+        self.method_table: Dict[str, Any] = {}
+        self.build_method_table()
+        # Every instance starts out with this empty shape
+        self.root_shape = Shape(self)
+
+    def build_method_table(self) -> None:
+        """Flatten the methods of the MRO, nearest class winning"""
+        table = {}
+        for klass in reversed(self.mro):
+            table.update(klass.methods)
+        self.method_table = table
+
+    def set_method(self, name: str, method: Any) -> None:
+        """Add or replace a method, invalidating this class and its subclasses"""
+        self.methods[name] = method
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Rebuild cached method tables after a change in the hierarchy"""
+        self.build_method_table()
+        self.version += 1
+        for subclass in list(self.subclasses):
+            subclass.invalidate()
+
+    def find_method(self, name: str) -> Any:
+        """Look a method up through the MRO, or None"""
+        return self.method_table.get(name)
+
+    def get(self, name: str) -> Any:
+        """Member access on the class itself gives the plain function, e.g. जनक.प्रारंभ(यह)"""
+        method = self.method_table.get(name)
+        if method is None:
+            raise SanskritRuntimeError(f"वर्ग '{self.name}' में विधि '{name}' नहीं है")
+        return method
+
+    def is_subclass_of(self, other: 'SanskritClass') -> bool:
+        return other in self.mro
+
+    def arity(self) -> int:
+        """Number of constructor arguments, taken from प्रारंभ"""
+        initializer = self.method_table.get(INITIALIZER_NAME)
+        if initializer is None:
+            return 0
+        return initializer.arity() - 1
+
+    def call(self, interpreter, arguments: List[Any]) -> 'SanskritInstance':
+        """Create instance of class, passing the arguments to प्रारंभ"""
+        instance = SanskritInstance(self)
+        initializer = self.method_table.get(INITIALIZER_NAME)
+        if initializer is not None:
+            initializer.call(interpreter, [instance] + list(arguments))
+        return instance
+
+    def __repr__(self) -> str:
+        return f"<वर्ग {self.name}>"
+
+class SanskritInstance:
+    """Instance of a class"""
+
+    __slots__ = ('shape', 'slots')
+
+    def __init__(self, klass: SanskritClass):
+        self.shape = klass.root_shape
+        self.slots: List[Any] = []
+
+    @property
+    def klass(self) -> SanskritClass:
+        return self.shape.klass
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Field values by name"""
+        return {name: self.slots[index] for name, index in self.shape.fields.items()}
+
+    def get(self, name: str) -> Any:
+        """Get field or bound method"""
+        index = self.shape.fields.get(name)
+        if index is not None:
+            return self.slots[index]
+
+        method = self.shape.klass.method_table.get(name)
+        if method is not None:
+            return BoundMethod(self, method)
+
+        raise SanskritRuntimeError(f"अपरिभाषित गुण '{name}'")
+
+    def set(self, name: str, value: Any) -> None:
+        """Set field, moving to a new shape when the field is new"""
+        index = self.shape.fields.get(name)
+        if index is None:
+            self.shape = self.shape.with_field(name)
+            self.slots.append(value)
+        else:
+            self.slots[index] = value
+
+    def __repr__(self) -> str:
+        return f"<{self.shape.klass.name} वस्तु>"
+
+class BoundMethod:
+    """Method together with the instance it was read from"""
+
+    __slots__ = ('receiver', 'method')
+
+    def __init__(self, receiver: SanskritInstance, method: Any):
+        self.receiver = receiver
+        self.method = method
+
+    def arity(self) -> int:
+        return self.method.arity() - 1
+
+    def call(self, interpreter, arguments: List[Any]) -> Any:
+        return self.method.call(interpreter, [self.receiver] + list(arguments))
+
+    def __call__(self, *arguments: Any) -> Any:
+        """Call from Python code, e.g. as a प्रवाह callback"""
+        return self.method(self.receiver, *arguments)
+
+    def __repr__(self) -> str:
+        return f"<विधि {self.receiver.shape.klass.name}.{self.method.declaration.name.name}>"
+
+# Stdlib docstrings end with the member's Sanskrit name, e.g. "Square root (वर्गमूल)"
+_ALIAS_PATTERN = re.compile(r'\(([^()]+)\)\s*$')
+_aliases: Dict[type, Dict[str, str]] = {}
+
+def attribute_aliases(cls: type) -> Dict[str, str]:
+    """Map the Sanskrit names in a type's method docstrings to attribute names"""
+    aliases = _aliases.get(cls)
+    if aliases is None:
+        aliases = {}
+        for attribute in dir(cls):
+            if attribute.startswith('_'):
+                continue
+            doc = getattr(getattr(cls, attribute, None), '__doc__', None)
+            if not doc or not doc.strip():
+                continue
+            match = _ALIAS_PATTERN.search(doc.strip().splitlines()[0])
+            if match:
+                aliases.setdefault(match.group(1).strip().replace(' ', '_'), attribute)
+        _aliases[cls] = aliases
+    return aliases
+
+def get_foreign_attribute(obj: Any, name: str) -> Any:
+    """Member access on values that are not वर्ग instances (modules, lists, records)
+
+    Python attribute names are tried first, then the Sanskrit name from
+    the member's docstring, so both गणित.vargmool and गणित.वर्गमूल work.
+    """
+    if name.startswith('_'):
+        raise SanskritRuntimeError(f"निजी गुण '{name}' उपलब्ध नहीं है")
+    if type(obj) is SanskritClass:
+        return obj.get(name)
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        pass
+    alias = attribute_aliases(type(obj)).get(name)
+    if alias is not None:
+        return getattr(obj, alias)
+    raise SanskritRuntimeError(f"'{type(obj).__name__}' में गुण '{name}' नहीं है")
@@ -0,0 +1,327 @@
+"""
+Sanskrit Language Optimizer
+Constant propagation and folding over a resolved AST
+"""
+
+from typing import Any, Dict, List, Optional
+from .ast_nodes import *
+
+# Folded strings longer than this stay as runtime expressions so that
+# programs like "क" * 1000000 do not bloat the AST
+MAX_FOLDED_STRING = 4096
+
+class SanskritOptimizer:
+    """Rewrites the AST, replacing uses of स्थिर constants with their values"""
+
+    def __init__(self, interpreter):
+        # Folding reuses the interpreter's own operator semantics
+        self.interpreter = interpreter
+        # Lexical scopes mapping constant names to their literal values.
+        # A name bound to None is shadowed (e.g. by a parameter).
+        # The outermost scope persists so REPL lines see earlier constants.
+        self.scopes: List[Dict[str, Optional[Literal]]] = [{}]
+
+    def optimize(self, program: Program, fresh_scope: bool = False) -> Program:
+        """Optimize a whole program in place
+
+        With fresh_scope the program neither sees nor leaves behind the
+        constants of the persistent outermost (REPL) scope.
+        """
+        scopes = self.scopes
+        if fresh_scope:
+            self.scopes = [{}]
+        try:
+            program.statements = self.optimize_statements(program.statements)
+        finally:
+            self.scopes = scopes
+        return program
+
+    def optimize_node(self, node: Optional[ASTNode]) -> Optional[ASTNode]:
+        """Optimize a single node, returning its replacement"""
+        if node is None:
+            return None
+        return node.accept(self)
+
+    def optimize_statements(self, statements: List[Statement]) -> List[Statement]:
+        """Optimize a list of statements, dropping ones that became empty"""
+        optimized = []
+        for statement in statements:
+            statement = self.optimize_node(statement)
+            if isinstance(statement, Block) and not statement.statements:
+                continue
+            optimized.append(statement)
+        return optimized
+
+    def optimize_block(self, statements: List[Statement],
+                       scope: Optional[Dict[str, Optional[Literal]]] = None) -> List[Statement]:
+        """Optimize statements inside a new lexical scope"""
+        self.scopes.append(scope if scope is not None else {})
+        try:
+            return self.optimize_statements(statements)
+        finally:
+            self.scopes.pop()
+
+    def lookup_constant(self, name: str) -> Optional[Literal]:
+        """Find the literal value of a visible constant"""
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def fold(self, node: Expression) -> Expression:
+        """Evaluate a side-effect free expression now, if that is safe"""
+        try:
+            value = self.interpreter.evaluate(node)
+        except Exception:
+            # Leave errors such as division by zero to surface at runtime
+            return node
+
+        if isinstance(value, str) and len(value) > MAX_FOLDED_STRING:
+            return node
+        if value is not None and not isinstance(value, (bool, int, float, str)):
+            return node
+        return Literal(value, node.line, node.column)
+
+    def visit_program(self, node: Program) -> Program:
+        """Visit program node"""
+        return self.optimize(node)
+
+    def visit_literal(self, node: Literal) -> Expression:
+        """Visit literal node"""
+        return node
+
+    def visit_identifier(self, node: Identifier) -> Expression:
+        """Visit identifier node"""
+        constant = self.lookup_constant(node.name)
+        if constant is not None:
+            return Literal(constant.value, node.line, node.column)
+        return node
+
+    def visit_binary_operation(self, node: BinaryOperation) -> Expression:
+        """Visit binary operation node"""
+        node.left = self.optimize_node(node.left)
+        node.right = self.optimize_node(node.right)
+
+        if isinstance(node.left, Literal):
+            if isinstance(node.right, Literal):
+                return self.fold(node)
+            # A constant left side may already decide च/वा
+            if node.operator in ('च', 'वा'):
+                decided = self.interpreter.is_truthy(node.left.value) == (node.operator == 'वा')
+                if decided:
+                    return self.fold(node)
+        return node
+
+    def visit_unary_operation(self, node: UnaryOperation) -> Expression:
+        """Visit unary operation node"""
+        node.operand = self.optimize_node(node.operand)
+        if isinstance(node.operand, Literal):
+            return self.fold(node)
+        return node
+
+    def visit_await_expression(self, node: AwaitExpression) -> Expression:
+        """Visit await expression node; never folded, since waiting is the effect"""
+        node.operand = self.optimize_node(node.operand)
+        return node
+
+    def visit_conditional_expression(self, node: ConditionalExpression) -> Expression:
+        """Visit conditional expression node"""
+        node.condition = self.optimize_node(node.condition)
+        node.then_value = self.optimize_node(node.then_value)
+        node.else_value = self.optimize_node(node.else_value)
+
+        if isinstance(node.condition, Literal):
+            if self.interpreter.is_truthy(node.condition.value):
+                return node.then_value
+            return node.else_value
+        return node
+
+    def visit_list_literal(self, node: ListLiteral) -> Expression:
+        """Visit list literal node"""
+        node.elements = [self.optimize_node(element) for element in node.elements]
+        return node
+
+    def visit_interpolated_string(self, node: InterpolatedString) -> Expression:
+        """Visit interpolated string node, merging constant parts into the text"""
+        parts = []
+        for part in node.parts:
+            if not isinstance(part, str):
+                part = self.optimize_node(part)
+                if isinstance(part, Literal):
+                    part = str(part.value)
+            if isinstance(part, str) and parts and isinstance(parts[-1], str):
+                parts[-1] += part
+            else:
+                parts.append(part)
+        node.parts = parts
+
+        if all(isinstance(part, str) for part in parts):
+            text = ''.join(parts)
+            if len(text) <= MAX_FOLDED_STRING:
+                return Literal(text, node.line, node.column)
+        return node
+
+    def visit_dict_literal(self, node: DictLiteral) -> Expression:
+        """Visit dictionary literal node"""
+        node.entries = [(self.optimize_node(key), self.optimize_node(value))
+                        for key, value in node.entries]
+        return node
+
+    def visit_index_expression(self, node: IndexExpression) -> Expression:
+        """Visit index expression node"""
+        node.collection = self.optimize_node(node.collection)
+        node.index = self.optimize_node(node.index)
+        return node
+
+    def visit_slice_expression(self, node: SliceExpression) -> Expression:
+        """Visit slice expression node"""
+        node.collection = self.optimize_node(node.collection)
+        node.start = self.optimize_node(node.start)
+        node.stop = self.optimize_node(node.stop)
+        return node
+
+    def visit_index_assignment(self, node: IndexAssignment) -> Statement:
+        """Visit index assignment node"""
+        node.collection = self.optimize_node(node.collection)
+        node.index = self.optimize_node(node.index)
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_member_expression(self, node: MemberExpression) -> Expression:
+        """Visit member access node"""
+        node.object = self.optimize_node(node.object)
+        return node
+
+    def visit_member_assignment(self, node: MemberAssignment) -> Statement:
+        """Visit member assignment node"""
+        node.object = self.optimize_node(node.object)
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_assignment(self, node: Assignment) -> Statement:
+        """Visit assignment node"""
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_compound_assignment(self, node: CompoundAssignment) -> Statement:
+        """Visit augmented assignment node"""
+        # Only the parts of the target are optimized: the target itself stays a location
+        target = node.target
+        if isinstance(target, IndexExpression):
+            target.collection = self.optimize_node(target.collection)
+            target.index = self.optimize_node(target.index)
+        elif isinstance(target, MemberExpression):
+            target.object = self.optimize_node(target.object)
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_constant_declaration(self, node: ConstantDeclaration) -> Statement:
+        """Visit constant declaration node"""
+        node.value = self.optimize_node(node.value)
+        if isinstance(node.value, Literal):
+            self.scopes[-1][node.target.name] = node.value
+        return node
+
+    def visit_if_statement(self, node: IfStatement) -> Statement:
+        """Visit if statement node"""
+        node.condition = self.optimize_node(node.condition)
+        node.then_branch = self.optimize_node(node.then_branch)
+        node.else_branch = self.optimize_node(node.else_branch)
+
+        # Branches on configuration constants disappear entirely
+        if isinstance(node.condition, Literal):
+            if self.interpreter.is_truthy(node.condition.value):
+                return node.then_branch
+            return node.else_branch or Block([], node.line, node.column)
+        return node
+
+    def visit_match_statement(self, node: MatchStatement) -> Statement:
+        """Visit match statement node"""
+        node.subject = self.optimize_node(node.subject)
+        node.cases = [([self.optimize_node(value) for value in values], self.optimize_node(body))
+                      for values, body in node.cases]
+        node.default = self.optimize_node(node.default)
+
+        # A constant subject with constant cases selects its branch now
+        if isinstance(node.subject, Literal) and all(
+                isinstance(value, Literal) for values, _ in node.cases for value in values):
+            for values, body in node.cases:
+                if any(node.subject.value == value.value for value in values):
+                    return body
+            return node.default or Block([], node.line, node.column)
+        return node
+
+    def visit_try_statement(self, node: TryStatement) -> Statement:
+        """Visit try statement node"""
+        node.body = self.optimize_node(node.body)
+        if node.handler is not None:
+            # The error variable shadows any constant of the same name
+            scope = {node.error_name.name: None} if node.error_name is not None else {}
+            node.handler.statements = self.optimize_block(node.handler.statements, scope)
+        node.finalizer = self.optimize_node(node.finalizer)
+        return node
+
+    def visit_while_loop(self, node: WhileLoop) -> Statement:
+        """Visit while loop node"""
+        node.condition = self.optimize_node(node.condition)
+        node.body = self.optimize_node(node.body)
+        return node
+
+    def visit_for_loop(self, node: ForLoop) -> Statement:
+        """Visit for loop node"""
+        node.iterable = self.optimize_node(node.iterable)
+        node.body = self.optimize_node(node.body)
+        return node
+
+    def visit_function_def(self, node: FunctionDef) -> Statement:
+        """Visit function definition node"""
+        parameters = {param.name: None for param in node.parameters}
+        node.body.statements = self.optimize_block(node.body.statements, parameters)
+        return node
+
+    def visit_function_call(self, node: FunctionCall) -> Expression:
+        """Visit function call node"""
+        node.function = self.optimize_node(node.function)
+        node.arguments = [self.optimize_node(argument) for argument in node.arguments]
+        return node
+
+    def visit_return_statement(self, node: ReturnStatement) -> Statement:
+        """Visit return statement node"""
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_yield_statement(self, node: YieldStatement) -> Statement:
+        """Visit yield statement node"""
+        node.value = self.optimize_node(node.value)
+        return node
+
+    def visit_break_statement(self, node: BreakStatement) -> Statement:
+        """Visit break statement node"""
+        return node
+
+    def visit_continue_statement(self, node: ContinueStatement) -> Statement:
+        """Visit continue statement node"""
+        return node
+
+    def visit_class_def(self, node: ClassDef) -> Statement:
+        """Visit class definition node"""
+        node.methods = [self.optimize_node(method) for method in node.methods]
+        return node
+
+    def visit_record_def(self, node: RecordDef) -> Statement:
+        """Visit record definition node"""
+        return node
+
+    def visit_import_statement(self, node: ImportStatement) -> Statement:
+        """Visit import statement node"""
+        return node
+
+    def visit_block(self, node: Block) -> Statement:
+        """Visit block node"""
+        node.statements = self.optimize_block(node.statements)
+        return node
+
+    def visit_expression_statement(self, node: ExpressionStatement) -> Statement:
+        """Visit expression statement node"""
+        node.expression = self.optimize_node(node.expression)
+        return node
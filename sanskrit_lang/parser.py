@@ -7,6 +7,7 @@ from typing import List, Optional, Union
 from .lexer import Token, TokenType, SanskritLexer
 from .ast_nodes import *
 from .errors import SanskritSyntaxError
+from .objects import SELF_NAME
 
 class SanskritParser:
     """Recursive descent parser for Sanskrit language"""
@@ -40,21 +41,42 @@ class SanskritParser:
             if self.match(TokenType.YAVAT):
                 return self.while_statement()
             
+            if self.match(TokenType.CHAYANA):
+                return self.match_statement()
+            
+            if self.match(TokenType.PRAYAASA):
+                return self.try_statement()
+            
             if self.match(TokenType.PRATHI):
                 return self.for_statement()
             
             if self.match(TokenType.KAARYA):
                 return self.function_statement()
             
+            if self.match(TokenType.ASAMAKALIKA):
+                return self.async_function_statement()
+            
             if self.match(TokenType.VARGA):
                 return self.class_statement()
             
+            if self.match(TokenType.ABHILEKHA):
+                return self.record_statement()
+            
             if self.match(TokenType.VRATYAA):
                 return self.return_statement()
             
+            if self.match(TokenType.PRADAANA):
+                return self.yield_statement()
+            
             if self.match(TokenType.AAYAT):
                 return self.import_statement()
             
+            if self.match(TokenType.VIRAAMA):
+                return BreakStatement(self.previous().line, self.previous().column)
+            
+            if self.match(TokenType.AGRE):
+                return ContinueStatement(self.previous().line, self.previous().column)
+            
             if self.check(TokenType.DHARANA) or self.check(TokenType.STHIRA):
                 return self.variable_declaration()
             
@@ -83,6 +105,62 @@ class SanskritParser:
         
         return IfStatement(condition, then_branch, else_branch, line, col)
     
+    def match_statement(self) -> MatchStatement:
+        """Parse match statement: चयन value { विकल्प a, b { statements } अथवा { statements } }"""
+        line, col = self.previous().line, self.previous().column
+        
+        subject = self.expression()
+        self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'चयन' के बाद")
+        
+        cases = []
+        default = None
+        while not self.check(TokenType.DAKSH_KURLY) and not self.is_at_end():
+            if self.match(TokenType.NAVAPANKTI):
+                continue
+            if self.match(TokenType.VIKALPA):
+                values = [self.expression()]
+                while self.match(TokenType.ALPA_VIRAM):
+                    values.append(self.expression())
+                self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'विकल्प' के बाद")
+                cases.append((values, self.block_statement()))
+            elif self.match(TokenType.ATHAVA):
+                if default is not None:
+                    raise SanskritSyntaxError("'चयन' में केवल एक 'अथवा' संभव है",
+                                            self.previous().line, self.previous().column)
+                self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'अथवा' के बाद")
+                default = self.block_statement()
+            else:
+                raise SanskritSyntaxError("'विकल्प' या 'अथवा' की अपेक्षा",
+                                        self.peek().line, self.peek().column)
+        
+        self.consume(TokenType.DAKSH_KURLY, "'}' की अपेक्षा")
+        return MatchStatement(subject, cases, default, line, col)
+    
+    def try_statement(self) -> TryStatement:
+        """Parse try statement: प्रयास { statements } पकड़ name { statements } अन्ततः { statements }"""
+        line, col = self.previous().line, self.previous().column
+        
+        self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'प्रयास' के बाद")
+        body = self.block_statement()
+        
+        error_name = None
+        handler = None
+        if self.match(TokenType.PAKAD):
+            if self.check(TokenType.NAAM):
+                name_token = self.advance()
+                error_name = Identifier(name_token.value, name_token.line, name_token.column)
+            self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'पकड़' के बाद")
+            handler = self.block_statement()
+        
+        finalizer = None
+        if self.match(TokenType.ANTATAH):
+            self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा 'अन्ततः' के बाद")
+            finalizer = self.block_statement()
+        
+        if handler is None and finalizer is None:
+            raise SanskritSyntaxError("'प्रयास' के बाद 'पकड़' या 'अन्ततः' की अपेक्षा", line, col)
+        return TryStatement(body, error_name, handler, finalizer, line, col)
+    
     def while_statement(self) -> WhileLoop:
         """Parse while loop: यावत् condition { statements }"""
         line, col = self.previous().line, self.previous().column
@@ -94,14 +172,13 @@ class SanskritParser:
         return WhileLoop(condition, body, line, col)
     
     def for_statement(self) -> ForLoop:
-        """Parse for loop: प्रति variable in iterable { statements }"""
+        """Parse for loop: प्रति variable में iterable { statements }"""
         line, col = self.previous().line, self.previous().column
         
         variable_token = self.consume(TokenType.NAAM, "चर नाम की अपेक्षा")
         variable = Identifier(variable_token.value, variable_token.line, variable_token.column)
         
-        # TODO: Add 'in' keyword to lexer
-        self.consume(TokenType.NAAM, "'में' की अपेक्षा")  # Temporary
+        self.consume(TokenType.MEIN, "'में' की अपेक्षा")
         
         iterable = self.expression()
         self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा")
@@ -134,15 +211,30 @@ class SanskritParser:
         body = self.block_statement()
         return FunctionDef(name, parameters, body, None, line, col)
     
+    def async_function_statement(self) -> FunctionDef:
+        """Parse async function definition: असमकालिक कार्य name(params) { statements }"""
+        self.consume(TokenType.KAARYA, "'कार्य' की अपेक्षा 'असमकालिक' के बाद")
+        function = self.function_statement()
+        function.is_async = True
+        return function
+    
     def class_statement(self) -> ClassDef:
-        """Parse class definition: वर्ग name { methods }"""
+        """Parse class definition: वर्ग name(bases) { methods }"""
         line, col = self.previous().line, self.previous().column
         
         name_token = self.consume(TokenType.NAAM, "वर्ग नाम की अपेक्षा")
         name = Identifier(name_token.value, name_token.line, name_token.column)
         
-        superclass = None
-        # TODO: Add inheritance syntax
+        superclasses = []
+        if self.match(TokenType.VAAM_VRTTA):
+            if not self.check(TokenType.DAKSH_VRTTA):
+                while True:
+                    base_token = self.consume(TokenType.NAAM, "जनक वर्ग नाम की अपेक्षा")
+                    superclasses.append(Identifier(base_token.value, base_token.line, base_token.column))
+                    if not self.match(TokenType.ALPA_VIRAM):
+                        break
+            self.consume(TokenType.DAKSH_VRTTA, "')' की अपेक्षा")
+        superclass = superclasses[0] if superclasses else None
         
         self.consume(TokenType.VAAM_KURLY, "'{' की अपेक्षा")
         
@@ -150,13 +242,39 @@ class SanskritParser:
         while not self.check(TokenType.DAKSH_KURLY) and not self.is_at_end():
             if self.match(TokenType.NAVAPANKTI):
                 continue
-            if self.match(TokenType.KAARYA):
-                methods.append(self.function_statement())
+            if self.match(TokenType.KAARYA, TokenType.ASAMAKALIKA):
+                if self.previous().type == TokenType.ASAMAKALIKA:
+                    method = self.async_function_statement()
+                else:
+                    method = self.function_statement()
+                # Methods receive their instance as the implicit first parameter यह
+                method.parameters.insert(0, Identifier(SELF_NAME, method.line, method.column))
+                methods.append(method)
             else:
                 self.advance()  # Skip unknown tokens
         
         self.consume(TokenType.DAKSH_KURLY, "'}' की अपेक्षा")
-        return ClassDef(name, superclass, methods, line, col)
+        return ClassDef(name, superclass, methods, line, col, superclasses)
+    
+    def record_statement(self) -> RecordDef:
+        """Parse record definition: अभिलेख name(fields)"""
+        line, col = self.previous().line, self.previous().column
+        
+        name_token = self.consume(TokenType.NAAM, "अभिलेख नाम की अपेक्षा")
+        name = Identifier(name_token.value, name_token.line, name_token.column)
+        
+        self.consume(TokenType.VAAM_VRTTA, "'(' की अपेक्षा")
+        
+        fields = []
+        if not self.check(TokenType.DAKSH_VRTTA):
+            while True:
+                field_token = self.consume(TokenType.NAAM, "क्षेत्र नाम की अपेक्षा")
+                fields.append(Identifier(field_token.value, field_token.line, field_token.column))
+                if not self.match(TokenType.ALPA_VIRAM):
+                    break
+        
+        self.consume(TokenType.DAKSH_VRTTA, "')' की अपेक्षा")
+        return RecordDef(name, fields, line, col)
     
     def return_statement(self) -> ReturnStatement:
         """Parse return statement: वापसी [expression]"""
@@ -168,6 +286,17 @@ class SanskritParser:
         
         return ReturnStatement(value, line, col)
     
+    def yield_statement(self) -> YieldStatement:
+        """Parse yield statement: प्रदान [expression]"""
+        line, col = self.previous().line, self.previous().column
+        
+        value = None
+        if not (self.check(TokenType.NAVAPANKTI) or self.check(TokenType.DAKSH_KURLY)
+                or self.is_at_end()):
+            value = self.expression()
+        
+        return YieldStatement(value, line, col)
+    
     def import_statement(self) -> ImportStatement:
         """Parse import statement: आयात module"""
         line, col = self.previous().line, self.previous().column
@@ -180,7 +309,7 @@ class SanskritParser:
         
         return ImportStatement(module, alias, from_list, line, col)
     
-    def variable_declaration(self) -> Assignment:
+    def variable_declaration(self) -> Statement:
         """Parse variable declaration: धारणा name = value or स्थिर name = value"""
         # Advance past the DHARANA/STHIRA token
         keyword_token = self.advance()
@@ -192,6 +321,8 @@ class SanskritParser:
         self.consume(TokenType.NIRDESH, "'=' की अपेक्षा")
         value = self.expression()
         
+        if keyword_token.type == TokenType.STHIRA:
+            return ConstantDeclaration(name, value, line, col)
         return Assignment(name, value, line, col)
     
     def block_statement(self) -> Block:
@@ -210,9 +341,12 @@ class SanskritParser:
         self.consume(TokenType.DAKSH_KURLY, "'}' की अपेक्षा")
         return Block(statements, line, col)
     
-    def expression_statement(self) -> ExpressionStatement:
+    def expression_statement(self) -> Statement:
         """Parse expression statement"""
         expr = self.expression()
+        # Assignments are statements already; wrapping them would only add a dispatch step
+        if isinstance(expr, Statement):
+            return expr
         return ExpressionStatement(expr)
     
     def expression(self) -> Expression:
@@ -221,16 +355,42 @@ class SanskritParser:
     
     def assignment(self) -> Expression:
         """Parse assignment expression"""
-        expr = self.logical_or()
+        expr = self.conditional()
         
         if self.match(TokenType.NIRDESH):
             value = self.assignment()
             if isinstance(expr, Identifier):
-                return Assignment(expr, value)
+                return Assignment(expr, value, expr.line, expr.column)
+            elif isinstance(expr, IndexExpression):
+                return IndexAssignment(expr.collection, expr.index, value, expr.line, expr.column)
+            elif isinstance(expr, MemberExpression):
+                return MemberAssignment(expr.object, expr.name, value, expr.line, expr.column)
             else:
                 raise SanskritSyntaxError("अवैध असाइनमेंट लक्ष्य", 
                                         self.previous().line, self.previous().column)
         
+        if self.match(TokenType.YOGA_NIRDESH, TokenType.VYAVAKALANA_NIRDESH, TokenType.GUNA_NIRDESH,
+                      TokenType.BHAGA_NIRDESH, TokenType.SHESH_NIRDESH):
+            operator = self.previous().value[0]
+            if not isinstance(expr, (Identifier, IndexExpression, MemberExpression)):
+                raise SanskritSyntaxError("अवैध असाइनमेंट लक्ष्य",
+                                        self.previous().line, self.previous().column)
+            value = self.assignment()
+            return CompoundAssignment(expr, operator, value, expr.line, expr.column)
+        
+        return expr
+    
+    def conditional(self) -> Expression:
+        """Parse conditional expression: value यदि condition अथवा other"""
+        expr = self.logical_or()
+        
+        if self.match(TokenType.YADI):
+            line, col = self.previous().line, self.previous().column
+            condition = self.logical_or()
+            self.consume(TokenType.ATHAVA, "'अथवा' की अपेक्षा सशर्त अभिव्यक्ति में")
+            else_value = self.conditional()
+            return ConditionalExpression(condition, expr, else_value, line, col)
+        
         return expr
     
     def logical_or(self) -> Expression:
@@ -271,7 +431,7 @@ class SanskritParser:
         expr = self.term()
         
         while self.match(TokenType.MAHAN, TokenType.MAHAN_SAMA, 
-                          TokenType.LAGHU, TokenType.LAGHU_SAMA):
+                          TokenType.LAGHU, TokenType.LAGHU_SAMA, TokenType.MEIN):
             operator = self.previous().value
             right = self.term()
             expr = BinaryOperation(expr, operator, right)
@@ -302,6 +462,10 @@ class SanskritParser:
     
     def unary(self) -> Expression:
         """Parse unary expression"""
+        if self.match(TokenType.PRATIKSHA):
+            keyword = self.previous()
+            return AwaitExpression(self.unary(), keyword.line, keyword.column)
+        
         if self.match(TokenType.NA, TokenType.VYAVAKALANA):
             operator = self.previous().value
             right = self.unary()
@@ -310,17 +474,83 @@ class SanskritParser:
         return self.call()
     
     def call(self) -> Expression:
-        """Parse function call"""
+        """Parse function call, indexing, slicing and member access"""
         expr = self.primary()
         
         while True:
             if self.match(TokenType.VAAM_VRTTA):
                 expr = self.finish_call(expr)
+            elif self.match(TokenType.VAAM_KONA):
+                expr = self.finish_index(expr)
+            elif self.match(TokenType.VIRAM):
+                name_token = self.consume(TokenType.NAAM, "गुण नाम की अपेक्षा")
+                expr = MemberExpression(expr, name_token.value, name_token.line, name_token.column)
             else:
                 break
         
         return expr
     
+    def finish_index(self, collection: Expression) -> Expression:
+        """Parse index or slice: collection[index] or collection[start:stop]"""
+        line, col = self.previous().line, self.previous().column
+        
+        start = None
+        if not self.check(TokenType.UTKARSH):
+            start = self.expression()
+            if self.match(TokenType.DAKSH_KONA):
+                return IndexExpression(collection, start, line, col)
+        
+        self.consume(TokenType.UTKARSH, "':' या ']' की अपेक्षा")
+        stop = None
+        if not self.check(TokenType.DAKSH_KONA):
+            stop = self.expression()
+        
+        self.consume(TokenType.DAKSH_KONA, "']' की अपेक्षा")
+        return SliceExpression(collection, start, stop, line, col)
+    
+    def list_literal(self) -> ListLiteral:
+        """Parse list literal: [a, b, c]"""
+        line, col = self.previous().line, self.previous().column
+        elements = []
+        
+        self.skip_newlines()
+        if not self.check(TokenType.DAKSH_KONA):
+            elements.append(self.expression())
+            self.skip_newlines()
+            while self.match(TokenType.ALPA_VIRAM):
+                self.skip_newlines()
+                if self.check(TokenType.DAKSH_KONA):
+                    break  # trailing comma
+                elements.append(self.expression())
+                self.skip_newlines()
+        
+        self.consume(TokenType.DAKSH_KONA, "']' की अपेक्षा")
+        return ListLiteral(elements, line, col)
+    
+    def dict_literal(self) -> DictLiteral:
+        """Parse dictionary literal: {key: value, ...}"""
+        line, col = self.previous().line, self.previous().column
+        entries = []
+        
+        self.skip_newlines()
+        while not self.check(TokenType.DAKSH_KURLY):
+            key = self.expression()
+            self.consume(TokenType.UTKARSH, "':' की अपेक्षा शब्दकोश में")
+            self.skip_newlines()
+            entries.append((key, self.expression()))
+            self.skip_newlines()
+            if not self.match(TokenType.ALPA_VIRAM):
+                break
+            self.skip_newlines()
+        
+        self.consume(TokenType.DAKSH_KURLY, "'}' की अपेक्षा")
+        return DictLiteral(entries, line, col)
+    
+    def skip_newlines(self) -> None:
+        """Skip newlines inside brackets"""
+        while self.match(TokenType.NAVAPANKTI):
+            pass
+    
     def finish_call(self, callee: Expression) -> FunctionCall:
         """Parse function call arguments"""
         arguments = []
@@ -360,6 +590,9 @@ class SanskritParser:
         if self.match(TokenType.SHABDA):
             return Literal(self.previous().value, self.previous().line, self.previous().column)
         
+        if self.match(TokenType.SAANCHA):
+            return self.interpolated_string(self.previous())
+        
         if self.match(TokenType.NAAM):
             return Identifier(self.previous().value, self.previous().line, self.previous().column)
         
@@ -368,9 +601,29 @@ class SanskritParser:
             self.consume(TokenType.DAKSH_VRTTA, "')' की अपेक्षा")
             return expr
         
+        if self.match(TokenType.VAAM_KONA):
+            return self.list_literal()
+        
+        if self.match(TokenType.VAAM_KURLY):
+            return self.dict_literal()
+        
         raise SanskritSyntaxError("अप्रत्याशित टोकन", 
                                 self.peek().line, self.peek().column)
     
+    def interpolated_string(self, token: Token) -> InterpolatedString:
+        """Parse the expressions the lexer cut out of an interpolated string"""
+        parts = []
+        for part in token.value:
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+            parser = SanskritParser(part)
+            parts.append(parser.expression())
+            if not parser.is_at_end():
+                raise SanskritSyntaxError("साँचा शब्द की अभिव्यक्ति में अप्रत्याशित टोकन",
+                                        parser.peek().line, parser.peek().column)
+        return InterpolatedString(parts, token.line, token.column)
+    
     def match(self, *types: TokenType) -> bool:
         """Check if current token matches any of the given types"""
         for token_type in types:
@@ -419,10 +672,10 @@ class SanskritParser:
             if self.previous().type == TokenType.NAVAPANKTI:
                 return
             
-            if self.peek().type in [TokenType.VARGA, TokenType.KAARYA, 
+            if self.peek().type in [TokenType.VARGA, TokenType.ABHILEKHA, TokenType.KAARYA, TokenType.ASAMAKALIKA,
                                   TokenType.DHARANA, TokenType.PRATHI,
-                                  TokenType.YADI, TokenType.YAVAT, 
-                                  TokenType.VRATYAA]:
+                                  TokenType.YADI, TokenType.YAVAT, TokenType.CHAYANA, TokenType.PRAYAASA,
+                                  TokenType.VRATYAA, TokenType.PRADAANA]:
                 return
             
             self.advance()
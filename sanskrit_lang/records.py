@@ -0,0 +1,63 @@
+"""
+Sanskrit Language Records
+Immutable value types (अभिलेख) with a fixed field layout
+"""
+
+from operator import itemgetter
+from typing import Any, List, Tuple
+from .errors import SanskritRuntimeError
+
+class SanskritRecord(tuple):
+    """Base class of every अभिलेख type
+
+    Instances are tuples, so a record costs one tuple header plus a
+    pointer per field, with no per-instance dictionary. Fields are
+    read through properties generated for each record type.
+    """
+
+    __slots__ = ()
+
+    # Filled in per record type by make_record_type
+    _fields: Tuple[str, ...] = ()
+
+    def __new__(cls, *values: Any) -> 'SanskritRecord':
+        if len(values) != len(cls._fields):
+            raise SanskritRuntimeError(
+                f"'{cls.__name__}' के लिए अपेक्षित {len(cls._fields)} तर्क, प्राप्त {len(values)}")
+        return tuple.__new__(cls, values)
+
+    def __eq__(self, other: Any) -> bool:
+        # Records of different types are never equal, even with equal fields
+        if type(self) is not type(other):
+            return False
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, tuple(self)))
+
+    def badal(self, field: str, value: Any) -> 'SanskritRecord':
+        """Copy with one field replaced (बदल)"""
+        if field not in self._fields:
+            raise SanskritRuntimeError(f"'{type(self).__name__}' में क्षेत्र '{field}' नहीं है")
+        values = list(self)
+        values[self._fields.index(field)] = value
+        return tuple.__new__(type(self), values)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={value!r}" for name, value in zip(self._fields, self))
+        return f"{type(self).__name__}({values})"
+
+    __str__ = __repr__
+
+def make_record_type(name: str, fields: List[str]) -> type:
+    """Create a new record type with the given field names"""
+    namespace = {
+        '__slots__': (),
+        '_fields': tuple(fields),
+    }
+    for index, field in enumerate(fields):
+        namespace[field] = property(itemgetter(index), doc=f"क्षेत्र {index}: {field}")
+    return type(name, (SanskritRecord,), namespace)
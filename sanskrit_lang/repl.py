@@ -8,6 +8,7 @@ import traceback
 from typing import List, Optional
 from .interpreter import SanskritInterpreter
 from .errors import SanskritError
+from .environment import StringBuffer
 from .docs import DocumentationSystem
 
 class SanskritREPL:
@@ -296,4 +297,6 @@ class SanskritREPL:
         for name, value in vars_dict.items():
             # Don't show built-in functions
             if not callable(value):
+                if type(value) is StringBuffer:
+                    value = value.materialize()
                 print(f"  {name} = {value} ({type(value).__name__})")
@@ -0,0 +1,333 @@
+"""
+Sanskrit Language Resolver
+Static analysis pass run over the AST before interpretation
+"""
+
+from typing import Dict, List, Optional, Set
+from .ast_nodes import *
+from .errors import SanskritSyntaxError
+
+class SanskritResolver:
+    """Annotates the AST with information the interpreter can trust"""
+
+    def __init__(self):
+        # Names referenced by each enclosing function, innermost last
+        self.function_scopes: List[Set[str]] = []
+        # Function definitions being resolved, innermost last
+        self.functions: List[FunctionDef] = []
+        # Number of loops enclosing the current statement within its function
+        self.loop_depth = 0
+        # Lexical scopes mapping names to whether they are स्थिर constants.
+        # The outermost scope persists so REPL lines see earlier constants.
+        self.scopes: List[Dict[str, bool]] = [{}]
+
+    def resolve(self, program: Program, fresh_scope: bool = False) -> Program:
+        """Resolve a whole program
+
+        With fresh_scope the program neither sees nor leaves behind the
+        constants of the persistent outermost (REPL) scope.
+        """
+        scopes = self.scopes
+        if fresh_scope:
+            self.scopes = [{}]
+        try:
+            self.resolve_statements(program.statements)
+        finally:
+            self.scopes = scopes
+        return program
+
+    def resolve_function(self, node: FunctionDef) -> None:
+        """Resolve a single function definition"""
+        self.resolve_node(node)
+
+    def resolve_node(self, node: Optional[ASTNode]) -> None:
+        """Resolve a single node"""
+        if node is not None:
+            node.accept(self)
+
+    def reference(self, name: str) -> None:
+        """Record a name used inside the current function"""
+        if self.function_scopes:
+            self.function_scopes[-1].add(name)
+
+    def is_constant(self, name: str, scopes: Optional[List[Dict[str, bool]]] = None) -> bool:
+        """Check whether a name currently resolves to a constant"""
+        for scope in reversed(self.scopes if scopes is None else scopes):
+            if name in scope:
+                return scope[name]
+        return False
+
+    def check_assignable(self, target: Identifier) -> None:
+        """Reject any statement that would rebind a constant"""
+        if self.is_constant(target.name):
+            raise SanskritSyntaxError(f"स्थिर '{target.name}' को पुनः निर्दिष्ट नहीं किया जा सकता",
+                                      target.line, target.column)
+
+    def resolve_block(self, statements: List[Statement], scope: Optional[Dict[str, bool]] = None) -> None:
+        """Resolve statements inside a new lexical scope"""
+        self.scopes.append(scope if scope is not None else {})
+        try:
+            self.resolve_statements(statements)
+        finally:
+            self.scopes.pop()
+
+    def resolve_statements(self, statements: List[Statement]) -> None:
+        """Resolve the statements of the current scope, its स्थिर names declared first
+
+        A function body may run after a स्थिर later in the enclosing
+        scope, so it must already see that name as a constant.
+        """
+        scope = self.scopes[-1]
+        for statement in statements:
+            if isinstance(statement, ConstantDeclaration):
+                target = statement.target
+                if scope.get(target.name):
+                    raise SanskritSyntaxError(f"स्थिर '{target.name}' को पुनः निर्दिष्ट नहीं किया जा सकता",
+                                              target.line, target.column)
+                scope[target.name] = True
+        for statement in statements:
+            self.resolve_node(statement)
+
+    def visit_program(self, node: Program) -> None:
+        """Visit program node"""
+        self.resolve_statements(node.statements)
+
+    def visit_literal(self, node: Literal) -> None:
+        """Visit literal node"""
+        pass
+
+    def visit_identifier(self, node: Identifier) -> None:
+        """Visit identifier node"""
+        self.reference(node.name)
+
+    def visit_binary_operation(self, node: BinaryOperation) -> None:
+        """Visit binary operation node"""
+        self.resolve_node(node.left)
+        self.resolve_node(node.right)
+
+    def visit_unary_operation(self, node: UnaryOperation) -> None:
+        """Visit unary operation node"""
+        self.resolve_node(node.operand)
+
+    def visit_await_expression(self, node: AwaitExpression) -> None:
+        """Reached only for a प्रतीक्षा nested inside a larger expression"""
+        raise SanskritSyntaxError("'प्रतीक्षा' केवल पूरे कथन, निर्देश के मान या वापसी के रूप में संभव है",
+                                  node.line, node.column)
+
+    def resolve_value(self, node: Optional[Expression]) -> None:
+        """Resolve the value of a statement, where a प्रतीक्षा may stand"""
+        if not isinstance(node, AwaitExpression):
+            self.resolve_node(node)
+            return
+        if not self.functions or not self.functions[-1].is_async:
+            raise SanskritSyntaxError("'प्रतीक्षा' केवल असमकालिक कार्य के भीतर संभव है",
+                                      node.line, node.column)
+        self.resolve_node(node.operand)
+
+    def visit_conditional_expression(self, node: ConditionalExpression) -> None:
+        """Visit conditional expression node"""
+        self.resolve_node(node.condition)
+        self.resolve_node(node.then_value)
+        self.resolve_node(node.else_value)
+
+    def visit_list_literal(self, node: ListLiteral) -> None:
+        """Visit list literal node"""
+        for element in node.elements:
+            self.resolve_node(element)
+
+    def visit_interpolated_string(self, node: InterpolatedString) -> None:
+        """Visit interpolated string node"""
+        for part in node.parts:
+            if not isinstance(part, str):
+                self.resolve_node(part)
+
+    def visit_dict_literal(self, node: DictLiteral) -> None:
+        """Visit dictionary literal node"""
+        for key, value in node.entries:
+            self.resolve_node(key)
+            self.resolve_node(value)
+
+    def visit_index_expression(self, node: IndexExpression) -> None:
+        """Visit index expression node"""
+        self.resolve_node(node.collection)
+        self.resolve_node(node.index)
+
+    def visit_slice_expression(self, node: SliceExpression) -> None:
+        """Visit slice expression node"""
+        self.resolve_node(node.collection)
+        self.resolve_node(node.start)
+        self.resolve_node(node.stop)
+
+    def visit_index_assignment(self, node: IndexAssignment) -> None:
+        """Visit index assignment node"""
+        self.resolve_node(node.collection)
+        self.resolve_node(node.index)
+        self.resolve_node(node.value)
+
+    def visit_member_expression(self, node: MemberExpression) -> None:
+        """Visit member access node"""
+        self.resolve_node(node.object)
+
+    def visit_member_assignment(self, node: MemberAssignment) -> None:
+        """Visit member assignment node"""
+        self.resolve_node(node.object)
+        self.resolve_node(node.value)
+
+    def visit_assignment(self, node: Assignment) -> None:
+        """Visit assignment node"""
+        self.check_assignable(node.target)
+        self.reference(node.target.name)
+        self.resolve_value(node.value)
+        value = node.value
+        node.appends = (isinstance(value, BinaryOperation) and value.operator == '+'
+                        and isinstance(value.left, Identifier)
+                        and value.left.name == node.target.name)
+
+    def visit_compound_assignment(self, node: CompoundAssignment) -> None:
+        """Visit augmented assignment node"""
+        if isinstance(node.target, Identifier):
+            self.check_assignable(node.target)
+        self.resolve_node(node.target)
+        self.resolve_node(node.value)
+
+    def visit_constant_declaration(self, node: ConstantDeclaration) -> None:
+        """Visit constant declaration node; resolve_statements already declared it in this scope"""
+        if self.is_constant(node.target.name, self.scopes[:-1]):
+            raise SanskritSyntaxError(f"स्थिर '{node.target.name}' को पुनः निर्दिष्ट नहीं किया जा सकता",
+                                      node.target.line, node.target.column)
+        self.resolve_value(node.value)
+
+    def visit_match_statement(self, node: MatchStatement) -> None:
+        """Visit match statement node"""
+        self.resolve_node(node.subject)
+        for values, body in node.cases:
+            for value in values:
+                self.resolve_node(value)
+            self.resolve_node(body)
+        self.resolve_node(node.default)
+
+    def visit_try_statement(self, node: TryStatement) -> None:
+        """Visit try statement node; the caught error is a fresh variable of the handler"""
+        self.resolve_node(node.body)
+        if node.handler is not None:
+            scope = {node.error_name.name: False} if node.error_name is not None else {}
+            self.resolve_block(node.handler.statements, scope)
+        self.resolve_node(node.finalizer)
+
+    def visit_if_statement(self, node: IfStatement) -> None:
+        """Visit if statement node"""
+        self.resolve_node(node.condition)
+        self.resolve_node(node.then_branch)
+        self.resolve_node(node.else_branch)
+
+    def visit_while_loop(self, node: WhileLoop) -> None:
+        """Visit while loop node"""
+        self.resolve_node(node.condition)
+        self.resolve_loop_body(node.body)
+
+    def visit_for_loop(self, node: ForLoop) -> None:
+        """Visit for loop node"""
+        self.check_assignable(node.variable)
+        self.resolve_node(node.iterable)
+        self.resolve_loop_body(node.body)
+
+    def resolve_loop_body(self, body: Statement) -> None:
+        """Resolve the body of a loop, where विराम/अग्रे are allowed"""
+        self.loop_depth += 1
+        try:
+            self.resolve_node(body)
+        finally:
+            self.loop_depth -= 1
+
+    def visit_function_def(self, node: FunctionDef) -> None:
+        """Visit function definition node and compute its free variables"""
+        self.check_assignable(node.name)
+
+        # Parameters shadow any constant of the same name
+        parameters = {param.name: False for param in node.parameters}
+
+        self.function_scopes.append(set())
+        self.functions.append(node)
+        enclosing_loop_depth, self.loop_depth = self.loop_depth, 0
+        node.is_generator = False
+        try:
+            self.resolve_block(node.body.statements, parameters)
+        finally:
+            referenced = self.function_scopes.pop()
+            self.functions.pop()
+            self.loop_depth = enclosing_loop_depth
+
+        if node.is_async and node.is_generator:
+            raise SanskritSyntaxError(f"असमकालिक कार्य '{node.name.name}' में 'प्रदान' संभव नहीं",
+                                      node.line, node.column)
+
+        referenced -= {param.name for param in node.parameters}
+        node.free_names = tuple(sorted(referenced))
+
+        # Enclosing functions must carry these names so that the
+        # nested closure can still reach them when it is created
+        for name in node.free_names:
+            self.reference(name)
+
+    def visit_function_call(self, node: FunctionCall) -> None:
+        """Visit function call node"""
+        self.resolve_node(node.function)
+        for argument in node.arguments:
+            self.resolve_node(argument)
+
+    def visit_return_statement(self, node: ReturnStatement) -> None:
+        """Visit return statement node"""
+        self.resolve_value(node.value)
+
+    def visit_yield_statement(self, node: YieldStatement) -> None:
+        """Visit yield statement node, marking the enclosing function a generator"""
+        if not self.functions:
+            raise SanskritSyntaxError("'प्रदान' केवल कार्य के भीतर संभव है", node.line, node.column)
+        self.functions[-1].is_generator = True
+        self.resolve_node(node.value)
+
+    def visit_break_statement(self, node: BreakStatement) -> None:
+        """Visit break statement node"""
+        if self.loop_depth == 0:
+            raise SanskritSyntaxError("'विराम' केवल लूप के भीतर संभव है", node.line, node.column)
+
+    def visit_continue_statement(self, node: ContinueStatement) -> None:
+        """Visit continue statement node"""
+        if self.loop_depth == 0:
+            raise SanskritSyntaxError("'अग्रे' केवल लूप के भीतर संभव है", node.line, node.column)
+
+    def visit_class_def(self, node: ClassDef) -> None:
+        """Visit class definition node"""
+        self.check_assignable(node.name)
+        for superclass in node.superclasses:
+            if superclass.name == node.name.name:
+                raise SanskritSyntaxError(f"वर्ग '{node.name.name}' स्वयं से विरासत नहीं ले सकता",
+                                          superclass.line, superclass.column)
+            self.resolve_node(superclass)
+        for method in node.methods:
+            self.resolve_node(method)
+
+    def visit_record_def(self, node: RecordDef) -> None:
+        """Visit record definition node"""
+        self.check_assignable(node.name)
+        seen = set()
+        for field in node.fields:
+            if field.name in seen:
+                raise SanskritSyntaxError(f"अभिलेख '{node.name.name}' में क्षेत्र '{field.name}' दोहराया गया",
+                                          field.line, field.column)
+            if field.name.startswith('_'):
+                raise SanskritSyntaxError(f"क्षेत्र नाम '{field.name}' '_' से आरम्भ नहीं हो सकता",
+                                          field.line, field.column)
+            seen.add(field.name)
+
+    def visit_import_statement(self, node: ImportStatement) -> None:
+        """Visit import statement node"""
+        pass
+
+    def visit_block(self, node: Block) -> None:
+        """Visit block node"""
+        self.resolve_block(node.statements)
+
+    def visit_expression_statement(self, node: ExpressionStatement) -> None:
+        """Visit expression statement node"""
+        self.resolve_value(node.expression)
@@ -3,10 +3,22 @@ Sanskrit Standard Library
 Sanskrit-named modules for core functionality
 """
 
+import asyncio
+import inspect
+from collections.abc import Iterator
 from typing import Dict, Any, Callable
 from .ganita import GanitaModule
-from .shabda import ShabdaModule  
+from .shabda import ShabdaModule, ShabdaNirmata
 from .pravesh import PraveshModule
+from .pravah import PravahModule
+from .sthayi import SthayiModule, SthayiSuchi, SthayiKosh
+from .sangrah import SangrahModule, Dvimukhi, Prathamikta, KramitSuchi, Ganak, BitSamuchchay
+from .varnamala import varnamala_kunji
+from .samaantar import samaantar_maanchitra
+from ..lists import SanskritList
+from ..records import SanskritRecord
+from ..objects import SanskritClass, SanskritInstance
+from ..generators import SanskritGenerator, SanskritCoroutine
 
 def get_builtin_functions() -> Dict[str, Callable]:
     """Get all built-in functions"""
@@ -29,10 +41,39 @@ def get_builtin_functions() -> Dict[str, Callable]:
             return "सत्य_असत्य"
         elif obj is None:
             return "शून्य"
-        elif isinstance(obj, list):
+        elif isinstance(obj, SanskritRecord):
+            return type(obj).__name__
+        elif isinstance(obj, SanskritInstance):
+            return obj.klass.name
+        elif isinstance(obj, SanskritClass):
+            return "वर्ग"
+        elif isinstance(obj, (list, SanskritList)):
             return "सूची"
         elif isinstance(obj, dict):
             return "शब्दकोश"
+        elif isinstance(obj, SthayiSuchi):
+            return "स्थायी_सूची"
+        elif isinstance(obj, SthayiKosh):
+            return "स्थायी_शब्दकोश"
+        elif isinstance(obj, Dvimukhi):
+            return "द्विमुखी_पंक्ति"
+        elif isinstance(obj, Prathamikta):
+            return "प्राथमिकता_पंक्ति"
+        elif isinstance(obj, KramitSuchi):
+            return "क्रमित_सूची"
+        elif isinstance(obj, Ganak):
+            return "गणक"
+        elif isinstance(obj, BitSamuchchay):
+            return "बिट_समुच्चय"
+        elif isinstance(obj, ShabdaNirmata):
+            return "शब्द_निर्माता"
+        elif isinstance(obj, range):
+            return "परिधि"
+        elif isinstance(obj, SanskritCoroutine) or inspect.isawaitable(obj):
+            return "असमकालिक_कार्य"
+        elif isinstance(obj, (SanskritGenerator, Iterator)):
+            # Includes the lazy pipelines built by the प्रवाह module
+            return "उत्पादक"
         else:
             return "अज्ञात"
     
@@ -56,12 +97,128 @@ def get_builtin_functions() -> Dict[str, Callable]:
                 raise ValueError(f"'{obj}' को संख्या में परिवर्तित नहीं किया जा सकता")
         return float(obj) if isinstance(obj, int) else obj
     
+    def suchi(iterable=None):
+        """Collect any iterable, e.g. a उत्पादक, into a list (सूची)"""
+        if iterable is None:
+            return SanskritList()
+        if not hasattr(iterable, '__iter__'):
+            raise TypeError(f"'{iterable}' से सूची नहीं बन सकती")
+        return SanskritList.from_values(iterable)
+    
+    def kram(suchi, kunji=None, ulta=False):
+        """Stable sort into a new list (क्रम)"""
+        if not hasattr(suchi, '__iter__'):
+            raise TypeError(f"'{suchi}' का क्रम संभव नहीं")
+        if kunji is not None and not callable(kunji):
+            raise TypeError(f"क्रम की कुंजी कार्य होनी चाहिए, प्राप्त '{kunji}'")
+        # Sanskrit truthiness: only शून्य and असत्य mean ascending
+        reverse = ulta is not None and ulta is not False
+        if kunji is None:
+            try:
+                return SanskritList.from_values(sorted(suchi, reverse=reverse))
+            except TypeError:
+                raise TypeError("क्रम के मान परस्पर तुलनीय नहीं हैं")
+        
+        # Each element is decorated with its key once, so a Sanskrit कुंजी
+        # runs n times rather than once per comparison. Keys are applied
+        # before sorting, so the कुंजी's own errors are not taken for
+        # failed comparisons.
+        values = list(suchi)
+        keys = [kunji(value) for value in values]
+        try:
+            order = sorted(range(len(values)), key=keys.__getitem__, reverse=reverse)
+        except TypeError:
+            raise TypeError("क्रम की कुंजियाँ परस्पर तुलनीय नहीं हैं")
+        return SanskritList.from_values([values[index] for index in order])
+    
+    def paridhi(*args):
+        """Lazy integer range (परिधि): परिधि(अंत), परिधि(आरम्भ, अंत, चरण)"""
+        if not 1 <= len(args) <= 3:
+            raise TypeError(f"परिधि १ से ३ तर्क लेती है, प्राप्त {len(args)}")
+        for arg in args:
+            if type(arg) is not int:
+                raise TypeError(f"परिधि के तर्क पूर्ण संख्या होने चाहिए, प्राप्त '{arg}'")
+        if len(args) == 3 and args[2] == 0:
+            raise ValueError("परिधि का चरण शून्य नहीं हो सकता")
+        # Python's range is lazy and constant-size for any bounds
+        return range(*args)
+    
+    def kunjiyan(shabdakosh):
+        """Lazy view of dictionary keys (कुंजियाँ)"""
+        return shabdakosh.keys()
+    
+    def moolyani(shabdakosh):
+        """Lazy view of dictionary values (मूल्यानि)"""
+        return shabdakosh.values()
+    
+    def yugmani(shabdakosh):
+        """Lazy view of (key, value) pairs (युग्मानि)"""
+        return shabdakosh.items()
+    
+    def smaran(function, aakaar=128):
+        """Memoize a pure function with a bounded LRU cache (स्मरण)"""
+        from ..interpreter import SanskritFunction, GeneratorFunction, AsyncFunction, MemoizedFunction
+        if not isinstance(function, SanskritFunction):
+            raise TypeError("स्मरण केवल कार्य के लिए संभव है")
+        if isinstance(function, GeneratorFunction):
+            # A cached उत्पादक would be exhausted after its first use
+            raise TypeError("उत्पादक कार्य का स्मरण संभव नहीं")
+        if isinstance(function, AsyncFunction):
+            # A cached coroutine could be awaited only once
+            raise TypeError("असमकालिक कार्य का स्मरण संभव नहीं")
+        if not isinstance(aakaar, int) or aakaar < 1:
+            raise ValueError(f"स्मरण आकार धनात्मक पूर्ण संख्या होना चाहिए, प्राप्त '{aakaar}'")
+        if isinstance(function, MemoizedFunction):
+            function = SanskritFunction(function.declaration, function.closure, function.interpreter)
+        return MemoizedFunction(function, aakaar)
+    
+    def smaran_aankde(function):
+        """Memoization statistics (स्मरण आँकड़े)"""
+        from ..interpreter import MemoizedFunction
+        if not isinstance(function, MemoizedFunction):
+            raise TypeError("यह कार्य स्मरण नहीं किया गया है")
+        return function.stats()
+    
+    def smaran_saaf(function):
+        """Clear a memoization cache (स्मरण साफ़)"""
+        from ..interpreter import MemoizedFunction
+        if not isinstance(function, MemoizedFunction):
+            raise TypeError("यह कार्य स्मरण नहीं किया गया है")
+        function.clear()
+    
+    async def ekatra(*karya):
+        """Await several coroutines concurrently, results in argument order (एकत्र)"""
+        if len(karya) == 1 and not inspect.isawaitable(karya[0]) and hasattr(karya[0], '__iter__'):
+            # एकत्र(सूची) waits for every coroutine in the list
+            karya = tuple(karya[0])
+        for item in karya:
+            if not inspect.isawaitable(item):
+                raise TypeError(f"'{item}' की प्रतीक्षा संभव नहीं")
+        return SanskritList.from_values(await asyncio.gather(*karya))
+    
+    async def nidra(kshan):
+        """Pause the current coroutine for some seconds (निद्रा)"""
+        await asyncio.sleep(kshan)
+    
     builtins.update({
         'मुद्रण': mudran,      # print
         'प्रकार': prakar,       # type
         'लम्बाई': lambai,       # len
         'सुन्दर': sundar,       # str
         'संख्या': sankhya,      # number conversion
+        'सूची': suchi,          # list conversion
+        'परिधि': paridhi,        # range
+        'क्रम': kram,           # sorted
+        'वर्णमाला_कुंजी': varnamala_kunji,  # Devanagari collation key
+        'कुंजियाँ': kunjiyan,     # dict keys
+        'मूल्यानि': moolyani,     # dict values
+        'युग्मानि': yugmani,      # dict items
+        'स्मरण': smaran,        # memoize
+        'स्मरण_आँकड़े': smaran_aankde,  # memoization stats
+        'स्मरण_साफ़': smaran_saaf,    # clear memoization cache
+        'एकत्र': ekatra,        # asyncio.gather
+        'निद्रा': nidra,         # asyncio.sleep
+        'समानांतर_मानचित्र': samaantar_maanchitra,  # parallel map over worker processes
     })
     
     return builtins
@@ -72,6 +229,9 @@ def load_module(name: str) -> Any:
         'गणित': GanitaModule(),
         'शब्द': ShabdaModule(),
         'प्रवेश': PraveshModule(),
+        'प्रवाह': PravahModule(),
+        'स्थायी': SthayiModule(),
+        'संग्रह': SangrahModule(),
     }
     
     if name in modules:
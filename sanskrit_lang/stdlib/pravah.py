@@ -0,0 +1,106 @@
+"""
+Pravah Module (प्रवाह)
+Lazy iterator pipelines over any sequence
+"""
+
+import functools
+import itertools
+from typing import Any, Callable, Iterable, Iterator
+from ..lists import SanskritList
+
+# Marks a संक्षेप call without an initial value
+_NO_INITIAL = object()
+
+def _satya(value: Any) -> bool:
+    """Sanskrit truthiness: only शून्य and असत्य are false"""
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    return True
+
+def _karya(function: Any, naam: str) -> Callable:
+    """Check that a callback can be called"""
+    if not callable(function):
+        raise TypeError(f"{naam} के लिए कार्य अपेक्षित, प्राप्त '{function}'")
+    return function
+
+def _kram(iterable: Any, naam: str) -> Iterator:
+    """Get an iterator, with a Sanskrit error for non-iterables"""
+    try:
+        return iter(iterable)
+    except TypeError:
+        raise TypeError(f"{naam}: '{iterable}' पर पुनरावृत्ति संभव नहीं")
+
+class PravahModule:
+    """Lazy iterator toolkit module
+
+    Every function returns an iterator that produces values only when
+    they are requested, so chained pipelines never build intermediate
+    lists. कार्य callbacks are called directly from Python.
+    """
+
+    def __init__(self):
+        pass
+
+    def manchitra(self, function, *iterables):
+        """Apply a function to every element (मानचित्र)"""
+        _karya(function, "मानचित्र")
+        if not iterables:
+            raise TypeError("मानचित्र के लिए कम से कम एक क्रम अपेक्षित")
+        return map(function, *[_kram(iterable, "मानचित्र") for iterable in iterables])
+
+    def chhanana(self, function, iterable):
+        """Keep the elements for which the function is true (छानना)"""
+        _karya(function, "छानना")
+        iterator = _kram(iterable, "छानना")
+        return (item for item in iterator if _satya(function(item)))
+
+    def pratham(self, iterable, n):
+        """Take at most the first n elements (प्रथम)"""
+        if type(n) is not int or n < 0:
+            raise ValueError(f"प्रथम के लिए अऋणात्मक पूर्ण संख्या अपेक्षित, प्राप्त '{n}'")
+        return itertools.islice(_kram(iterable, "प्रथम"), n)
+
+    def tyaag(self, iterable, n):
+        """Skip the first n elements (त्याग)"""
+        if type(n) is not int or n < 0:
+            raise ValueError(f"त्याग के लिए अऋणात्मक पूर्ण संख्या अपेक्षित, प्राप्त '{n}'")
+        return itertools.islice(_kram(iterable, "त्याग"), n, None)
+
+    def yugma(self, *iterables):
+        """Pair up elements of several sequences, stopping at the shortest (युग्म)"""
+        return zip(*[_kram(iterable, "युग्म") for iterable in iterables])
+
+    def shrinkhala(self, *iterables):
+        """Join sequences one after another (शृंखला)"""
+        return itertools.chain.from_iterable(_kram(iterable, "शृंखला") for iterable in iterables)
+
+    def khand(self, iterable, size):
+        """Group elements into lists of the given size (खण्ड)"""
+        if type(size) is not int or size < 1:
+            raise ValueError(f"खण्ड आकार धनात्मक पूर्ण संख्या होना चाहिए, प्राप्त '{size}'")
+        return self._khand(_kram(iterable, "खण्ड"), size)
+
+    def _khand(self, iterator: Iterator, size: int) -> Iterator[SanskritList]:
+        """Yield successive chunks; the last one may be shorter"""
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield SanskritList.from_values(chunk)
+
+    def ganana(self, iterable, start=0):
+        """Pair each element with its position (गणना)"""
+        return enumerate(_kram(iterable, "गणना"), start)
+
+    def sankshep(self, function, iterable, initial=_NO_INITIAL):
+        """Fold a sequence into a single value (संक्षेप)"""
+        _karya(function, "संक्षेप")
+        iterator = _kram(iterable, "संक्षेप")
+        if initial is _NO_INITIAL:
+            try:
+                initial = next(iterator)
+            except StopIteration:
+                raise ValueError("रिक्त क्रम का संक्षेप प्रारंभिक मान के बिना संभव नहीं")
+        return functools.reduce(function, iterator, initial)
@@ -3,6 +3,7 @@ Pravesh Module (प्रवेश)
 Input/Output operations and file handling
 """
 
+import asyncio
 import os
 import sys
 from typing import Any, Optional
@@ -53,6 +54,20 @@ class PraveshModule:
         except Exception as e:
             raise Exception(f"फ़ाइल पढ़ने में त्रुटि: {e}")
     
+    def file_panktiyan(self, file_path, encoding='utf-8'):
+        """Lazily read file lines, one at a time (फ़ाइल पंक्तियाँ)"""
+        try:
+            file = open(file_path, 'r', encoding=encoding)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"फ़ाइल '{file_path}' नहीं मिली")
+        return self._panktiyan(file)
+    
+    def _panktiyan(self, file):
+        """Yield lines without their trailing newline, closing the file at the end"""
+        with file:
+            for line in file:
+                yield line.rstrip('\n')
+    
     def file_likhiye(self, file_path, content, encoding='utf-8'):
         """Write file content (फ़ाइल लिखिये)"""
         try:
@@ -71,6 +86,18 @@ class PraveshModule:
         except Exception as e:
             raise Exception(f"फ़ाइल में जोड़ने में त्रुटि: {e}")
     
+    async def asamakalik_file_padhiye(self, file_path, encoding='utf-8'):
+        """Read file content on a worker thread, to be awaited (असमकालिक फ़ाइल पढ़िये)"""
+        return await asyncio.to_thread(self.file_padhiye, file_path, encoding)
+    
+    async def asamakalik_file_likhiye(self, file_path, content, encoding='utf-8'):
+        """Write file content on a worker thread, to be awaited (असमकालिक फ़ाइल लिखिये)"""
+        return await asyncio.to_thread(self.file_likhiye, file_path, content, encoding)
+    
+    async def asamakalik_file_jodiye(self, file_path, content, encoding='utf-8'):
+        """Append to file on a worker thread, to be awaited (असमकालिक फ़ाइल जोड़िये)"""
+        return await asyncio.to_thread(self.file_jodiye, file_path, content, encoding)
+    
     def file_hai(self, file_path):
         """Check if file exists (फ़ाइल है)"""
         return os.path.exists(file_path)
@@ -0,0 +1,187 @@
+"""
+Samaantar Maanchitra (समानांतर मानचित्र)
+Mapping a कार्य over a list on a pool of worker processes
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple
+from ..lists import SanskritList
+
+# Chunks are sized so that each keeps a worker busy for about this long:
+# long enough to amortize pickling and IPC, short enough to balance load
+TARGET_CHUNK_SECONDS = 0.05
+# Chunks queued per worker, so a worker never idles waiting for the next one
+CHUNKS_PER_WORKER = 2
+
+# Pools by worker count, kept so workers stay warm across calls
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+# Worker process state: its interpreter and the functions shipped to it
+_worker_interpreter = None
+_worker_functions: Dict[str, Any] = {}
+
+def export_function(function) -> bytes:
+    """Pickle a कार्य with the functions and values it reaches by name
+
+    A SanskritFunction holds a live Environment, which cannot cross a
+    process boundary. What is shipped instead is its declaration and a
+    flat namespace: every free name is looked up once, other कार्य are
+    exported the same way, builtins are left to the worker, and values
+    that cannot be pickled (instances, modules with open state) are left
+    out, so using one in the worker fails there as an undefined name.
+    Values are copies: changes made by a worker are not seen here.
+    """
+    from ..interpreter import SanskritFunction
+
+    builtins = function.interpreter.builtins
+    namespace: Dict[str, Any] = {}
+    pending = [function]
+    exported = {id(function)}
+    while pending:
+        current = pending.pop()
+        for name in current.declaration.free_names or ():
+            try:
+                value = current.closure.get(name)
+            except Exception:
+                # Names the body assigns itself, or that are not yet defined
+                continue
+            if builtins.get(name) is value:
+                continue
+            if isinstance(value, SanskritFunction):
+                if id(value) not in exported:
+                    exported.add(id(value))
+                    pending.append(value)
+                value = value.declaration
+            else:
+                try:
+                    pickle.dumps(value)
+                except Exception:
+                    continue
+            if name in namespace and namespace[name] is not value:
+                raise ValueError(f"समानांतर_मानचित्र: नाम '{name}' के दो भिन्न मान हैं")
+            namespace[name] = value
+    return pickle.dumps((function.declaration, namespace))
+
+def _warm_worker() -> None:
+    """Pool initializer: build the worker's interpreter once"""
+    global _worker_interpreter
+    from ..interpreter import SanskritInterpreter
+    _worker_interpreter = SanskritInterpreter()
+
+def _load_function(key: str, payload: bytes):
+    """Rebuild a shipped कार्य, once per worker"""
+    function = _worker_functions.get(key)
+    if function is None:
+        from ..ast_nodes import FunctionDef
+        from ..environment import Environment
+        from ..interpreter import make_function
+
+        interpreter = _worker_interpreter
+        declaration, namespace = pickle.loads(payload)
+        closure = Environment(interpreter.globals)
+        for name, value in namespace.items():
+            if isinstance(value, FunctionDef):
+                value = make_function(value, closure, interpreter)
+            closure.define(name, value)
+        function = make_function(declaration, closure, interpreter)
+        _worker_functions[key] = function
+    return function
+
+def _map_chunk(key: str, payload: bytes, items: List[Any]) -> Tuple[bool, Any, float]:
+    """Worker task: (ok, results or error description, seconds spent on the items)"""
+    from ..errors import describe_error
+
+    try:
+        function = _load_function(key, payload)
+        interpreter = _worker_interpreter
+        start = time.perf_counter()
+        results = [function.call(interpreter, [item]) for item in items]
+        return True, results, time.perf_counter() - start
+    except Exception as error:
+        # Sanskrit errors do not unpickle cleanly, so send their text
+        return False, describe_error(error), 0.0
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = ProcessPoolExecutor(workers, initializer=_warm_worker)
+        _pools[workers] = pool
+    return pool
+
+def samaantar_maanchitra(function, suchi, karyakarta=None):
+    """Apply a कार्य to every element on worker processes, keeping order (समानांतर मानचित्र)
+
+    The first chunk sent to each worker holds a single element; after
+    that chunk sizes follow the measured cost per element, so that each
+    chunk runs for about TARGET_CHUNK_SECONDS, and shrink near the end
+    so all workers finish together.
+    """
+    from ..interpreter import SanskritFunction, GeneratorFunction, AsyncFunction
+
+    if not isinstance(function, SanskritFunction) or isinstance(function, (GeneratorFunction, AsyncFunction)):
+        raise TypeError("समानांतर_मानचित्र का पहला तर्क साधारण कार्य होना चाहिए")
+    if function.arity() != 1:
+        raise TypeError(f"समानांतर_मानचित्र के कार्य को 1 तर्क लेना चाहिए, '{function.declaration.name.name}' {function.arity()} लेता है")
+    if not hasattr(suchi, '__iter__'):
+        raise TypeError(f"'{suchi}' पर मानचित्र संभव नहीं")
+    workers = karyakarta if karyakarta is not None else (os.cpu_count() or 1)
+    if type(workers) is not int or workers < 1:
+        raise ValueError(f"कार्यकर्ता संख्या धनात्मक पूर्ण संख्या होनी चाहिए, प्राप्त '{karyakarta}'")
+
+    items = list(suchi)
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return SanskritList()
+    payload = export_function(function)
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    pool = _pool(workers)
+    position = 0
+    measured_items = 0
+    measured_seconds = 0.0
+    in_flight = {}
+    try:
+        while position < len(items) or in_flight:
+            while position < len(items) and len(in_flight) < workers * CHUNKS_PER_WORKER:
+                if measured_items == 0:
+                    if len(in_flight) >= workers:
+                        break
+                    size = 1
+                else:
+                    per_item = measured_seconds / measured_items
+                    size = int(TARGET_CHUNK_SECONDS / per_item) if per_item > 0 else len(items)
+                    balanced = -(-(len(items) - position) // workers)
+                    size = max(1, min(size, balanced))
+                chunk = items[position:position + size]
+                future = pool.submit(_map_chunk, key, payload, chunk)
+                in_flight[future] = (position, len(chunk))
+                position += len(chunk)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, count = in_flight.pop(future)
+                try:
+                    ok, value, seconds = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as error:
+                    # Elements or results that cannot be pickled
+                    raise TypeError(f"समानांतर_मानचित्र के मान प्रक्रियाओं के बीच भेजे नहीं जा सकते: {error}")
+                if not ok:
+                    kind, message = value
+                    raise RuntimeError(f"कार्यकर्ता प्रक्रिया में {kind}: {message}")
+                results[start:start + count] = value
+                measured_items += count
+                measured_seconds += seconds
+    except BrokenProcessPool:
+        _pools.pop(workers, None)
+        raise RuntimeError("समानांतर_मानचित्र: कार्यकर्ता प्रक्रिया अनपेक्षित रूप से बंद हुई")
+    finally:
+        for future in in_flight:
+            future.cancel()
+    return SanskritList.from_values(results)
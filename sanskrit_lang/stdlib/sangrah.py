@@ -0,0 +1,295 @@
+"""
+Sangrah Module (संग्रह)
+Efficient containers: deque, priority queue, sorted list, counter, bitset
+"""
+
+import bisect
+import heapq
+import itertools
+from collections import Counter, deque
+from typing import Any, Iterable, Iterator, Optional
+from ..lists import SanskritList
+
+class Dvimukhi:
+    """Double-ended queue with O(1) operations at both ends (द्विमुखी पंक्ति)"""
+
+    __slots__ = ('items',)
+    __hash__ = None
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.items = deque(values)
+
+    def jod(self, value):
+        """Append on the right (जोड़)"""
+        self.items.append(value)
+
+    def baayen_jod(self, value):
+        """Append on the left (बायें जोड़)"""
+        self.items.appendleft(value)
+
+    def nikaal(self):
+        """Remove and return the rightmost value (निकाल)"""
+        if not self.items:
+            raise IndexError("रिक्त द्विमुखी पंक्ति से निकालना संभव नहीं")
+        return self.items.pop()
+
+    def baayen_nikaal(self):
+        """Remove and return the leftmost value (बायें निकाल)"""
+        if not self.items:
+            raise IndexError("रिक्त द्विमुखी पंक्ति से निकालना संभव नहीं")
+        return self.items.popleft()
+
+    def ghumao(self, steps=1):
+        """Rotate right by the given number of steps (घुमाओ)"""
+        self.items.rotate(steps)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.items
+
+    def __getitem__(self, index: int) -> Any:
+        return self.items[index]
+
+    def __repr__(self) -> str:
+        return f"द्विमुखी{list(self.items)}"
+
+    __str__ = __repr__
+
+class Prathamikta:
+    """Binary-heap priority queue returning the smallest priority first (प्राथमिकता पंक्ति)
+
+    Entries are stored as (priority, sequence, value) so equal priorities
+    leave in insertion order and values themselves never need comparing.
+    """
+
+    __slots__ = ('heap', 'sequence')
+    __hash__ = None
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.sequence = itertools.count()
+        self.heap = [(value, next(self.sequence), value) for value in values]
+        heapq.heapify(self.heap)
+
+    def jod(self, value, prathamikta=None):
+        """Insert a value, by default using it as its own priority (जोड़)"""
+        if prathamikta is None:
+            prathamikta = value
+        heapq.heappush(self.heap, (prathamikta, next(self.sequence), value))
+
+    def nikaal(self):
+        """Remove and return the value with the smallest priority (निकाल)"""
+        if not self.heap:
+            raise IndexError("रिक्त प्राथमिकता पंक्ति से निकालना संभव नहीं")
+        return heapq.heappop(self.heap)[2]
+
+    def dekho(self):
+        """Return the smallest value without removing it (देखो)"""
+        if not self.heap:
+            raise IndexError("रिक्त प्राथमिकता पंक्ति")
+        return self.heap[0][2]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Heap order, not sorted order
+        return (entry[2] for entry in self.heap)
+
+    def __repr__(self) -> str:
+        return f"प्राथमिकता{[entry[2] for entry in sorted(self.heap)]}"
+
+    __str__ = __repr__
+
+class KramitSuchi:
+    """List kept sorted on every insertion, with binary-search lookups (क्रमित सूची)"""
+
+    __slots__ = ('items',)
+    __hash__ = None
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.items = sorted(values)
+
+    def jod(self, value):
+        """Insert a value at its sorted position (जोड़)"""
+        bisect.insort(self.items, value)
+
+    def hatao(self, value):
+        """Remove one occurrence of a value (हटाओ)"""
+        index = bisect.bisect_left(self.items, value)
+        if index == len(self.items) or self.items[index] != value:
+            raise ValueError(f"'{value}' क्रमित सूची में नहीं है")
+        del self.items[index]
+
+    def sthaan(self, value):
+        """Number of elements smaller than a value (स्थान)"""
+        return bisect.bisect_left(self.items, value)
+
+    def seema(self, nimn, uchcha):
+        """Elements with nimn <= x < uchcha, as a list (सीमा)"""
+        start = bisect.bisect_left(self.items, nimn)
+        stop = bisect.bisect_left(self.items, uchcha)
+        return SanskritList.from_values(self.items[start:stop])
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __contains__(self, value: Any) -> bool:
+        index = bisect.bisect_left(self.items, value)
+        return index < len(self.items) and self.items[index] == value
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return SanskritList.from_values(self.items[index])
+        return self.items[index]
+
+    def __repr__(self) -> str:
+        return f"क्रमित{self.items}"
+
+    __str__ = __repr__
+
+class Ganak:
+    """Multiset counting occurrences of each value (गणक)"""
+
+    __slots__ = ('counts',)
+    __hash__ = None
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.counts = Counter(values)
+
+    def jod(self, value, sankhya=1):
+        """Count a value, optionally several times (जोड़)"""
+        self.counts[value] += sankhya
+
+    def vistaar(self, values):
+        """Count every value of a sequence (विस्तार)"""
+        self.counts.update(values)
+
+    def ginati(self, value):
+        """How many times a value was counted (गिनती)"""
+        return self.counts[value]
+
+    def sarvaadhik(self, n=None):
+        """The n most common (value, count) pairs (सर्वाधिक)"""
+        return SanskritList.from_values(self.counts.most_common(n))
+
+    def kul(self):
+        """Total of all counts (कुल)"""
+        return sum(self.counts.values())
+
+    def __getitem__(self, value: Any) -> int:
+        return self.counts[value]
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.counts
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.counts)
+
+    def keys(self):
+        return self.counts.keys()
+
+    def values(self):
+        return self.counts.values()
+
+    def items(self):
+        return self.counts.items()
+
+    def __repr__(self) -> str:
+        return f"गणक{dict(self.counts)}"
+
+    __str__ = __repr__
+
+class BitSamuchchay:
+    """Set of non-negative integers stored one bit each in a bytearray (बिट समुच्चय)"""
+
+    __slots__ = ('bits', 'count')
+    __hash__ = None
+
+    def __init__(self, aakaar: int = 0):
+        if type(aakaar) is not int or aakaar < 0:
+            raise ValueError(f"बिट समुच्चय आकार अऋणात्मक पूर्ण संख्या होना चाहिए, प्राप्त '{aakaar}'")
+        self.bits = bytearray((aakaar + 7) >> 3)
+        self.count = 0
+
+    def _check(self, number: Any) -> int:
+        if type(number) is not int or number < 0:
+            raise ValueError(f"बिट समुच्चय में केवल अऋणात्मक पूर्ण संख्याएँ संभव हैं, प्राप्त '{number}'")
+        return number
+
+    def sthapit(self, number):
+        """Add a number, growing the set if needed (स्थापित)"""
+        self._check(number)
+        byte, mask = number >> 3, 1 << (number & 7)
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(max(byte + 1, 2 * len(self.bits)) - len(self.bits)))
+        if not self.bits[byte] & mask:
+            self.bits[byte] |= mask
+            self.count += 1
+
+    def hatao(self, number):
+        """Remove a number if present (हटाओ)"""
+        self._check(number)
+        byte, mask = number >> 3, 1 << (number & 7)
+        if byte < len(self.bits) and self.bits[byte] & mask:
+            self.bits[byte] &= ~mask
+            self.count -= 1
+
+    def __contains__(self, number: Any) -> bool:
+        if type(number) is not int or number < 0:
+            return False
+        byte = number >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (number & 7)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        # Skip empty bytes quickly; only set bits are visited one by one
+        for byte_index, byte in enumerate(self.bits):
+            if byte:
+                base = byte_index << 3
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield base + bit
+
+    def __repr__(self) -> str:
+        return f"बिट{{{', '.join(str(number) for number in self)}}}"
+
+    __str__ = __repr__
+
+class SangrahModule:
+    """Efficient containers module"""
+
+    def __init__(self):
+        pass
+
+    def dvimukhi(self, values=()):
+        """Create a deque (द्विमुखी पंक्ति)"""
+        return Dvimukhi(values)
+
+    def prathamikta(self, values=()):
+        """Create a priority queue (प्राथमिकता पंक्ति)"""
+        return Prathamikta(values)
+
+    def kramit_suchi(self, values=()):
+        """Create a sorted list (क्रमित सूची)"""
+        return KramitSuchi(values)
+
+    def ganak(self, values=()):
+        """Create a counter (गणक)"""
+        return Ganak(values)
+
+    def bit_samuchchay(self, aakaar=0):
+        """Create a bitset (बिट समुच्चय)"""
+        return BitSamuchchay(aakaar)
@@ -4,6 +4,41 @@ String manipulation and text processing functions
 """
 
 import re
+from ..environment import StringBuffer
+
+class ShabdaNirmata(StringBuffer):
+    """Mutable string builder (शब्द निर्माता)
+    
+    Appends are stored as pieces and joined once, when the text is
+    read, so building a long string costs linear time.
+    """
+    
+    __slots__ = ()
+    __hash__ = None
+    
+    def jod(self, value):
+        """Append a value as text (जोड़)"""
+        self.append(value if type(value) is str else str(value))
+    
+    def pankti_jod(self, value=""):
+        """Append a value followed by a newline (पंक्ति जोड़)"""
+        self.append(f"{value}\n")
+    
+    def shabda(self):
+        """The built text (शब्द)"""
+        return self.materialize()
+    
+    def saaf(self):
+        """Remove all text (साफ़)"""
+        self.clear()
+    
+    def __eq__(self, other):
+        if isinstance(other, ShabdaNirmata):
+            return self.materialize() == other.materialize()
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"निर्माता({self.materialize()!r})"
 
 class ShabdaModule:
     """String manipulation module"""
@@ -11,6 +46,10 @@ class ShabdaModule:
     def __init__(self):
         pass
     
+    def nirmata(self, aarambh=""):
+        """Create a string builder (निर्माता)"""
+        return ShabdaNirmata(str(aarambh))
+    
     def lambai(self, text):
         """Length of string (लम्बाई)"""
         return len(text)
@@ -0,0 +1,440 @@
+"""
+Sthayi Module (स्थायी)
+Persistent immutable vectors and maps with structural sharing
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Both structures branch 32 ways, consuming 5 bits of index or hash per level
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+# Python hashes are folded to 64 non-negative bits before use
+HASH_MASK = (1 << 64) - 1
+
+class SthayiSuchi:
+    """Persistent vector (स्थायी सूची)
+
+    A 32-way trie of leaves plus a separate tail for the last leaf, as in
+    Clojure's PersistentVector. Updates copy only the O(log32 n) nodes on
+    the path to the changed element and share everything else with the
+    previous version, which stays valid and unchanged.
+    """
+
+    __slots__ = ('count', 'shift', 'root', 'tail')
+
+    def __init__(self, count: int = 0, shift: int = BITS, root: Optional[list] = None,
+                 tail: Optional[list] = None):
+        self.count = count
+        self.shift = shift
+        self.root = root if root is not None else []
+        self.tail = tail if tail is not None else []
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any]) -> 'SthayiSuchi':
+        """Build a vector bottom-up in O(n)"""
+        items = list(values)
+        count = len(items)
+        tailoff = cls._tailoff_for(count)
+
+        nodes = [items[i:i + WIDTH] for i in range(0, tailoff, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [nodes[i:i + WIDTH] for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        return cls(count, shift, nodes, items[tailoff:])
+
+    @staticmethod
+    def _tailoff_for(count: int) -> int:
+        """Index of the first element stored in the tail"""
+        if count < WIDTH:
+            return 0
+        return ((count - 1) >> BITS) << BITS
+
+    def _leaf_for(self, index: int) -> list:
+        """Find the leaf array holding an index"""
+        if index >= self._tailoff_for(self.count):
+            return self.tail
+        node = self.root
+        level = self.shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node
+
+    def _check_index(self, index: Any) -> int:
+        """Normalise a possibly negative index, raising IndexError when out of range"""
+        if type(index) is not int:
+            raise TypeError(f"स्थायी सूची का अनुक्रमांक पूर्ण संख्या होना चाहिए, प्राप्त '{index}'")
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return index
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return SthayiSuchi.from_iterable(self[i] for i in range(*index.indices(self.count)))
+        index = self._check_index(index)
+        return self._leaf_for(index)[index & MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        # Walk leaf by leaf rather than descending the trie per element
+        for start in range(0, self.count, WIDTH):
+            yield from self._leaf_for(start)
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item == value for item in self)
+
+    def jod(self, value: Any) -> 'SthayiSuchi':
+        """Return a new vector with a value appended (जोड़)"""
+        count = self.count
+        if count - self._tailoff_for(count) < WIDTH:
+            return SthayiSuchi(count + 1, self.shift, self.root, self.tail + [value])
+
+        # The tail is full: move it into the trie and start a new one
+        shift = self.shift
+        if (count >> BITS) > (1 << shift):
+            root = [self.root, self._new_path(shift, self.tail)]
+            shift += BITS
+        else:
+            root = self._push_tail(count, shift, self.root, self.tail)
+        return SthayiSuchi(count + 1, shift, root, [value])
+
+    def _new_path(self, level: int, node: list) -> list:
+        """Wrap a leaf in single-child nodes down from a level"""
+        while level > 0:
+            node = [node]
+            level -= BITS
+        return node
+
+    def _push_tail(self, count: int, level: int, parent: list, tail: list) -> list:
+        """Copy the path to the last leaf, attaching the old tail as that leaf"""
+        sub = ((count - 1) >> level) & MASK
+        node = list(parent)
+        if level == BITS:
+            child = tail
+        elif sub < len(parent):
+            child = self._push_tail(count, level - BITS, parent[sub], tail)
+        else:
+            child = self._new_path(level - BITS, tail)
+
+        if sub < len(node):
+            node[sub] = child
+        else:
+            node.append(child)
+        return node
+
+    def badal(self, index: int, value: Any) -> 'SthayiSuchi':
+        """Return a new vector with one element replaced (बदल)"""
+        index = self._check_index(index)
+        if index >= self._tailoff_for(self.count):
+            tail = list(self.tail)
+            tail[index & MASK] = value
+            return SthayiSuchi(self.count, self.shift, self.root, tail)
+        return SthayiSuchi(self.count, self.shift,
+                           self._assoc(self.shift, self.root, index, value), self.tail)
+
+    def _assoc(self, level: int, node: list, index: int, value: Any) -> list:
+        """Copy the path to an index, replacing the element at its end"""
+        node = list(node)
+        if level == 0:
+            node[index & MASK] = value
+        else:
+            sub = (index >> level) & MASK
+            node[sub] = self._assoc(level - BITS, node[sub], index, value)
+        return node
+
+    def nikaal(self) -> 'SthayiSuchi':
+        """Return a new vector without its last element (निकाल)"""
+        count = self.count
+        if count == 0:
+            raise IndexError("रिक्त स्थायी सूची से निकालना संभव नहीं")
+        if count == 1:
+            return SthayiSuchi()
+        if count - self._tailoff_for(count) > 1:
+            return SthayiSuchi(count - 1, self.shift, self.root, self.tail[:-1])
+
+        # The tail empties: the last leaf of the trie becomes the new tail
+        tail = self._leaf_for(count - 2)
+        root = self._pop_tail(count, self.shift, self.root)
+        shift = self.shift
+        if root is None:
+            root = []
+        if shift > BITS and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+        return SthayiSuchi(count - 1, shift, root, tail)
+
+    def _pop_tail(self, count: int, level: int, node: list) -> Optional[list]:
+        """Copy the path to the last leaf without it; None when a node empties"""
+        sub = ((count - 2) >> level) & MASK
+        if level > BITS:
+            child = self._pop_tail(count, level - BITS, node[sub])
+            if child is None and sub == 0:
+                return None
+            return node[:sub] + ([child] if child is not None else [])
+        if sub == 0:
+            return None
+        return node[:sub]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SthayiSuchi):
+            return self.count == other.count and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"स्थायी{list(self)}"
+
+    __str__ = __repr__
+
+class _Shakha:
+    """HAMT branch node: a 32-bit bitmap and a packed array of present slots
+
+    Each slot holds either a (key, value) pair or a child node.
+    """
+
+    __slots__ = ('bitmap', 'slots')
+
+    def __init__(self, bitmap: int, slots: list):
+        self.bitmap = bitmap
+        self.slots = slots
+
+    def get(self, shift: int, key_hash: int, key: Any, default: Any) -> Any:
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return default
+        slot = self.slots[bin(self.bitmap & (bit - 1)).count('1')]
+        if isinstance(slot, tuple):
+            return slot[1] if slot[0] == key else default
+        return slot.get(shift + BITS, key_hash, key, default)
+
+    def assoc(self, shift: int, key_hash: int, key: Any, value: Any) -> Tuple['_Shakha', bool]:
+        """Return the updated node and whether a new key was added"""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        position = bin(self.bitmap & (bit - 1)).count('1')
+
+        if not self.bitmap & bit:
+            slots = self.slots[:position] + [(key, value)] + self.slots[position:]
+            return _Shakha(self.bitmap | bit, slots), True
+
+        slot = self.slots[position]
+        if isinstance(slot, tuple):
+            existing_key, existing_value = slot
+            if existing_key == key:
+                if existing_value is value:
+                    return self, False
+                replacement, added = (key, value), False
+            else:
+                replacement = _merge(shift + BITS, slot, hash(existing_key) & HASH_MASK,
+                                     (key, value), key_hash)
+                added = True
+        else:
+            replacement, added = slot.assoc(shift + BITS, key_hash, key, value)
+            if replacement is slot:
+                return self, False
+
+        slots = list(self.slots)
+        slots[position] = replacement
+        return _Shakha(self.bitmap, slots), added
+
+    def without(self, shift: int, key_hash: int, key: Any) -> Optional['_Shakha']:
+        """Return the node without a key; None once it is empty"""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return self
+        position = bin(self.bitmap & (bit - 1)).count('1')
+        slot = self.slots[position]
+
+        if isinstance(slot, tuple):
+            if slot[0] != key:
+                return self
+            replacement = None
+        else:
+            replacement = slot.without(shift + BITS, key_hash, key)
+            if replacement is slot:
+                return self
+
+        if replacement is None:
+            if len(self.slots) == 1:
+                return None
+            return _Shakha(self.bitmap & ~bit, self.slots[:position] + self.slots[position + 1:])
+        slots = list(self.slots)
+        slots[position] = replacement
+        return _Shakha(self.bitmap, slots)
+
+    def entries(self) -> Iterator[Tuple[Any, Any]]:
+        for slot in self.slots:
+            if isinstance(slot, tuple):
+                yield slot
+            else:
+                yield from slot.entries()
+
+class _Takraav:
+    """HAMT leaf for keys whose full 64-bit hashes collide"""
+
+    __slots__ = ('key_hash', 'pairs')
+
+    def __init__(self, key_hash: int, pairs: list):
+        self.key_hash = key_hash
+        self.pairs = pairs
+
+    def get(self, shift: int, key_hash: int, key: Any, default: Any) -> Any:
+        for existing_key, value in self.pairs:
+            if existing_key == key:
+                return value
+        return default
+
+    def assoc(self, shift: int, key_hash: int, key: Any, value: Any) -> Tuple[Any, bool]:
+        if key_hash != self.key_hash:
+            # A different hash that shares this prefix: branch above the collision
+            branch = _Shakha(1 << ((self.key_hash >> shift) & MASK), [self])
+            return branch.assoc(shift, key_hash, key, value)
+        for index, (existing_key, _) in enumerate(self.pairs):
+            if existing_key == key:
+                pairs = list(self.pairs)
+                pairs[index] = (key, value)
+                return _Takraav(key_hash, pairs), False
+        return _Takraav(key_hash, self.pairs + [(key, value)]), True
+
+    def without(self, shift: int, key_hash: int, key: Any) -> Optional['_Takraav']:
+        pairs = [pair for pair in self.pairs if pair[0] != key]
+        if len(pairs) == len(self.pairs):
+            return self
+        if not pairs:
+            return None
+        return _Takraav(self.key_hash, pairs)
+
+    def entries(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(self.pairs)
+
+def _merge(shift: int, first: tuple, first_hash: int, second: tuple, second_hash: int) -> Any:
+    """Build the smallest subtree holding two pairs that clashed in one slot"""
+    if first_hash == second_hash:
+        return _Takraav(first_hash, [first, second])
+    first_bit = (first_hash >> shift) & MASK
+    second_bit = (second_hash >> shift) & MASK
+    if first_bit == second_bit:
+        return _Shakha(1 << first_bit, [_merge(shift + BITS, first, first_hash, second, second_hash)])
+    slots = [first, second] if first_bit < second_bit else [second, first]
+    return _Shakha((1 << first_bit) | (1 << second_bit), slots)
+
+# Distinguishes "no default given" from a default of शून्य
+_MISSING = object()
+
+class SthayiKosh:
+    """Persistent map (स्थायी शब्दकोश)
+
+    A hash array mapped trie: every update copies only the nodes on the
+    path to the changed key, O(log32 n), and shares the rest.
+    """
+
+    __slots__ = ('count', 'root')
+
+    def __init__(self, count: int = 0, root: Optional[_Shakha] = None):
+        self.count = count
+        self.root = root
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[Any, Any]]) -> 'SthayiKosh':
+        """Build a map from (key, value) pairs"""
+        result = cls()
+        for key, value in pairs:
+            result = result.rakh(key, value)
+        return result
+
+    def prapt(self, key: Any, default: Any = None) -> Any:
+        """Look up a key, returning a default when absent (प्राप्त)"""
+        if self.root is None:
+            return default
+        return self.root.get(0, hash(key) & HASH_MASK, key, default)
+
+    def rakh(self, key: Any, value: Any) -> 'SthayiKosh':
+        """Return a new map with a key set (रख)"""
+        key_hash = hash(key) & HASH_MASK
+        if self.root is None:
+            return SthayiKosh(1, _Shakha(1 << (key_hash & MASK), [(key, value)]))
+        root, added = self.root.assoc(0, key_hash, key, value)
+        if root is self.root:
+            return self
+        return SthayiKosh(self.count + added, root)
+
+    def hatao(self, key: Any) -> 'SthayiKosh':
+        """Return a new map without a key (हटाओ)"""
+        if self.root is None:
+            return self
+        root = self.root.without(0, hash(key) & HASH_MASK, key)
+        if root is self.root:
+            return self
+        return SthayiKosh(self.count - 1, root)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.prapt(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.prapt(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self.count
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over (key, value) pairs"""
+        if self.root is None:
+            return iter(())
+        return self.root.entries()
+
+    def keys(self) -> Iterator[Any]:
+        """Iterate over keys"""
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over values"""
+        return (value for _, value in self.items())
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SthayiKosh):
+            if self.count != other.count:
+                return False
+            return all(other.prapt(key, _MISSING) == value for key, value in self.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __repr__(self) -> str:
+        return f"स्थायी{dict(self.items())}"
+
+    __str__ = __repr__
+
+class SthayiModule:
+    """Persistent data structures module"""
+
+    def __init__(self):
+        pass
+
+    def suchi(self, values=()):
+        """Create a persistent vector (स्थायी सूची)"""
+        return SthayiSuchi.from_iterable(values)
+
+    def kosh(self, mapping=None):
+        """Create a persistent map from a dictionary or pairs (स्थायी शब्दकोश)"""
+        if mapping is None:
+            return SthayiKosh()
+        if isinstance(mapping, SthayiKosh):
+            return mapping
+        if hasattr(mapping, 'items'):
+            return SthayiKosh.from_pairs(mapping.items())
+        return SthayiKosh.from_pairs(mapping)
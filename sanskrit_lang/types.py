@@ -6,6 +6,7 @@ Type definitions inspired by Sanskrit word classifications
 from enum import Enum
 from typing import Any, Optional, Union
 from abc import ABC, abstractmethod
+from .lists import SanskritList
 
 class VarnaType(Enum):
     """
@@ -197,7 +198,7 @@ class TypeInferrer:
             return SatyaAsatyaType()
         elif value is None:
             return ShunyaType()
-        elif isinstance(value, (list, tuple)):
+        elif isinstance(value, (list, tuple, SanskritList)):
             element_type = None
             if value:
                 element_type = TypeInferrer.infer_type(value[0])
@@ -0,0 +1,28 @@
+"""
+Shared fixtures: an interpreter, and helpers to run programs in it
+"""
+
+import pytest
+from sanskrit_lang.interpreter import SanskritInterpreter
+
+# Global values a host can compare directly, unlike कार्य or वर्ग objects
+PLAIN_TYPES = (bool, int, float, str, type(None))
+
+@pytest.fixture
+def interpreter():
+    return SanskritInterpreter()
+
+@pytest.fixture
+def run(interpreter):
+    """Compile source and run it in a fresh context, returning that context's globals"""
+    def run(source: str):
+        return interpreter.run_isolated(interpreter.compile(source))
+    return run
+
+@pytest.fixture
+def plain_values(interpreter):
+    """The program's own plain global values, leaving out the builtins"""
+    def plain_values(globals):
+        return {name: value for name, value in globals.values.items()
+                if name not in interpreter.builtins and isinstance(value, PLAIN_TYPES)}
+    return plain_values
@@ -0,0 +1,46 @@
+"""
+Closure memory: callbacks keep only the variables they use
+
+Each callback below is created inside a call whose argument is a large
+string. A callback that never names the argument must not keep it
+alive once the call has returned; one that does name it must.
+"""
+
+import gc
+import tracemalloc
+
+CALLBACKS = 20
+# Characters per temporary; Devanagari strings take 2 bytes per character
+TEMPORARY_SIZE = 1_000_000
+TEMPORARY_BYTES = 2 * TEMPORARY_SIZE
+
+PROGRAM = '''
+कार्य बनाओ(बड़ा, n) {
+    कार्य कॉलबैक() { वापसी %s }
+    वापसी कॉलबैक
+}
+धारणा कॉलबैक_सूची = []
+प्रति i में परिधि(%d) { कॉलबैक_सूची.जोड़(बनाओ("क" * %d, i)) }
+'''
+
+def retained_bytes(run, body: str) -> int:
+    """Memory still held after building the callbacks, with them alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        globals = run(PROGRAM % (body, CALLBACKS, TEMPORARY_SIZE))
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(globals.get('कॉलबैक_सूची')) == CALLBACKS
+    return current
+
+def test_unused_temporaries_are_collected(run):
+    retained = retained_bytes(run, 'n')
+    # Far less than even one temporary survives
+    assert retained < TEMPORARY_BYTES // 4, f"{retained} बाइट शेष"
+
+def test_used_temporaries_are_kept(run):
+    retained = retained_bytes(run, 'लम्बाई(बड़ा) + n')
+    assert retained >= CALLBACKS * TEMPORARY_BYTES, f"{retained} बाइट शेष"
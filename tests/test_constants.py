@@ -0,0 +1,25 @@
+"""
+Constants: no statement may rebind a स्थिर, wherever it appears
+"""
+
+import pytest
+from sanskrit_lang.errors import SanskritSyntaxError
+
+@pytest.mark.parametrize('source', [
+    'स्थिर X = 1\nX = 2',
+    'स्थिर X = 1\nस्थिर X = 2',
+    # The function runs after the declaration, so it must be rejected too
+    'कार्य बदलो() { X = 5 }\nस्थिर X = 1\nबदलो()',
+    'कार्य बदलो() { X += 5 }\nस्थिर X = 1\nबदलो()',
+])
+def test_reassignment_is_rejected(interpreter, source):
+    with pytest.raises(SanskritSyntaxError):
+        interpreter.compile(source)
+
+def test_function_reads_later_constant(run):
+    globals = run('कार्य पढ़ो() { वापसी X }\nस्थिर X = 7\nधारणा परिणाम = पढ़ो() + X')
+    assert globals.get('परिणाम') == 14
+
+def test_parameter_shadows_constant(run):
+    globals = run('स्थिर X = 1\nकार्य f(X) {\n    X = X + 2\n    वापसी X\n}\nधारणा परिणाम = f(1)')
+    assert globals.get('परिणाम') == 3
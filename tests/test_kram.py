@@ -0,0 +1,23 @@
+"""
+क्रम: stable sorting with a कुंजी applied once per element
+"""
+
+import pytest
+
+def test_stable_with_key(run):
+    globals = run('धारणा परिणाम = क्रम(["ख", "क", "खा", "का"], लम्बाई)')
+    assert list(globals.get('परिणाम')) == ["ख", "क", "खा", "का"]
+
+def test_reverse_stays_stable(run):
+    globals = run('धारणा परिणाम = क्रम([3, 1, 2, 1], शून्य, सत्य)')
+    assert list(globals.get('परिणाम')) == [3, 2, 1, 1]
+
+def test_key_errors_come_through(run):
+    # The कुंजी itself fails, with its own error rather than "not comparable"
+    with pytest.raises(Exception) as error:
+        run('कार्य कुंजी(x) { वापसी x - 1 }\nक्रम(["क", "ख"], कुंजी)')
+    assert 'तुलनीय' not in str(error.value)
+
+def test_incomparable_values(run):
+    with pytest.raises(TypeError, match='तुलनीय'):
+        run('क्रम([1, "क"])')
@@ -0,0 +1,14 @@
+"""
+Lists: compact storage and in-place extension
+"""
+
+import pytest
+
+@pytest.mark.parametrize('literal, expected', [
+    ('[1, 2]', [1, 2, 1, 2]),
+    ('["a", 1]', ["a", 1, "a", 1]),
+])
+def test_extend_with_itself(run, literal, expected):
+    globals = run(f'धारणा l = {literal}\nl += l\nधारणा m = {literal}\nm.विस्तार(m)')
+    assert list(globals.get('l')) == expected
+    assert list(globals.get('m')) == expected
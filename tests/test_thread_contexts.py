@@ -0,0 +1,122 @@
+"""
+Execution contexts: many threads running one compiled program
+
+Every thread runs the same compiled program with run_isolated, each in
+its own context, while a short switch interval forces the threads to
+interleave inside shared inline caches, match tables and generators.
+Each run's globals must equal those of a single-threaded run, and
+finished contexts must be freed even though the tree they ran lives on.
+"""
+
+import gc
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sanskrit_lang.ast_nodes import MemberExpression
+
+PROGRAM = '''
+वर्ग बिंदु {
+    कार्य प्रारंभ(x, y) {
+        यह.x = x
+        यह.y = y
+    }
+    कार्य योग() { वापसी यह.x + यह.y }
+}
+वर्ग त्रिबिंदु(बिंदु) {
+    कार्य प्रारंभ(x, y, z) {
+        बिंदु.प्रारंभ(यह, x, y)
+        यह.z = z
+    }
+    कार्य योग() { वापसी यह.x + यह.y + यह.z }
+}
+कार्य सम(n) {
+    प्रति i में परिधि(n) {
+        यदि i % 2 == 0 { प्रदान i }
+    }
+}
+कार्य नाम(k) {
+    चयन k % 3 {
+        विकल्प 0 { वापसी "शून्य" }
+        विकल्प 1 { वापसी "एक" }
+        अथवा { वापसी "दो" }
+    }
+}
+धारणा कुल = 0
+धारणा पाठ = ""
+प्रति i में परिधि(300) {
+    धारणा p = बिंदु(i, 1) यदि i % 2 == 0 अथवा त्रिबिंदु(i, 1, 2)
+    कुल += p.योग()
+    पाठ = पाठ + नाम(i)
+}
+प्रति v में सम(200) { कुल += v }
+धारणा लम्बा = लम्बाई(पाठ)
+'''
+
+# Compiled first: its constant must not leak into PROGRAM, which assigns कुल
+UNRELATED = 'स्थिर कुल = 1'
+
+RUNS = 64
+
+@pytest.fixture
+def program(interpreter):
+    interpreter.compile(UNRELATED)
+    return interpreter.compile(PROGRAM)
+
+@pytest.fixture
+def reference(interpreter, program, plain_values):
+    """The globals of a single-threaded run"""
+    values = plain_values(interpreter.run_isolated(program))
+    assert values['कुल'] == sum(i + 1 if i % 2 == 0 else i + 3 for i in range(300)) + sum(range(0, 200, 2))
+    assert values['पाठ'] == ''.join(["शून्य", "एक", "दो"][i % 3] for i in range(300))
+    assert values['लम्बा'] == len(values['पाठ'])
+    return values
+
+@pytest.fixture
+def interleaving():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(0.0001)
+    yield
+    sys.setswitchinterval(interval)
+
+@pytest.mark.parametrize('threads', [1, 4, 16])
+def test_threads_match_single_threaded_run(interpreter, program, reference, plain_values, interleaving, threads):
+    def run(_):
+        return plain_values(interpreter.run_isolated(program))
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(run, range(RUNS)))
+    wrong = sum(result != reference for result in results)
+    assert wrong == 0, f"{threads} थ्रेड: {RUNS} में से {wrong} परिणाम भिन्न"
+
+# One field read, through a class whose shapes belong to each context
+CACHED_SITE = '''
+वर्ग बिंदु {
+    कार्य प्रारंभ(x) { यह.x = x }
+}
+धारणा बड़ा = "क" * 100000
+धारणा b = बिंदु(1)
+धारणा v = b.x
+'''
+
+def test_finished_contexts_are_freed(interpreter, program):
+    contexts = []
+    for _ in range(8):
+        contexts.append(weakref.ref(interpreter.run_isolated(program)))
+    gc.collect()
+    alive = sum(context() is not None for context in contexts)
+    assert alive == 0, f"8 में से {alive} संदर्भ अब भी जीवित"
+
+def test_later_contexts_hit_the_cache(interpreter):
+    program = interpreter.compile(CACHED_SITE)
+    site = program.statements[-1].value
+    assert isinstance(site, MemberExpression)
+    for _ in range(8):
+        globals = interpreter.run_isolated(program)
+        shape = globals.get('b').shape
+        # The site must have room for this context's shape, not hold dead ones
+        cached = site.field_ref is shape.ref or any(entry[0] is shape.ref for entry in site.cache)
+        assert cached
+        assert globals.get('v') == 1
+        del globals, shape
+        gc.collect()
@@ -0,0 +1,29 @@
+"""
+Varnamala collation: वर्णमाला_कुंजी sorts words in dictionary order
+"""
+
+import random
+from sanskrit_lang.stdlib.varnamala import varnamala_kunji
+
+# The order promised by the docs: every plain vowel, then the same vowel
+# with chandrabindu, anusvara or visarga, then the next consonant
+DOCUMENTED_ORDER = [
+    'अ', 'आ', 'इ', 'ऋ', 'ॠ', 'ए', 'औ', 'अं', 'अः',
+    'क', 'कक', 'क़लम', 'का', 'कि', 'कु', 'कृ', 'के', 'कौ', 'कँ', 'कं', 'कः', 'कां',
+    'क्ष', 'ख', 'ह', '।',
+]
+
+def test_documented_order():
+    for seed in range(20):
+        words = DOCUMENTED_ORDER[:]
+        random.Random(seed).shuffle(words)
+        assert sorted(words, key=varnamala_kunji) == DOCUMENTED_ORDER
+
+def test_inherent_vowel():
+    # क carries an अ, so it sorts before क्, which does not
+    assert varnamala_kunji('क्') < varnamala_kunji('क')
+    assert varnamala_kunji('कं') < varnamala_kunji('कंक') < varnamala_kunji('कः')
+
+def test_kram_with_key(run):
+    globals = run('धारणा परिणाम = क्रम(["क्ष", "कं", "का", "क"], वर्णमाला_कुंजी)')
+    assert list(globals.get('परिणाम')) == ['क', 'का', 'कं', 'क्ष']